@@ -1,14 +1,20 @@
 from tabulate import tabulate
 import argparse
+import sys
+from bio_seq_v1.export import Exporter
 from bio_seq_v1.fasta import FASTAParser
-from bio_seq_v1.stats import sequence
+from bio_seq_v1.genetic_codes import NCBI_TABLES
+from bio_seq_v1.orf import ORFDetector, call_orfs
+from bio_seq_v1.stats import composition_matrix, sequence
+from bio_seq_v1.summary import AssemblySummary
+from bio_seq_v1.translator import FRAMES, Translator
 
 def print_sequence_lengths_formatted(sequences):
     """
     Print a formatted table of sequence IDs and their lengths.
 
     Args:
-        sequences (list of sequence): List of Sequence objects to process.
+        sequences (iterable of sequence): Sequence objects to process.
     """
     table = [[s.id, s.sequence_length()] for s in sequences]
     print(tabulate(table, headers=["Sequence ID", "Length"], tablefmt="grid"))
@@ -18,7 +24,7 @@ def print_gc_content_table(sequences):
     Print a formatted table of sequence IDs and their GC content percentages.
 
     Args:
-        sequences (list of sequence): List of Sequence objects to process.
+        sequences (iterable of sequence): Sequence objects to process.
     """
     table = [[s.id, f"{s.gc_content():.2f}%"] for s in sequences]
     print(tabulate(table, headers=["Sequence", "GC%"], tablefmt="grid"))
@@ -28,7 +34,7 @@ def print_revcomp(sequences):
     Print the reverse complement of each sequence in the list.
 
     Args:
-        sequences (list of sequence): List of Sequence objects to process.
+        sequences (iterable of sequence): Sequence objects to process.
     """
     for s in sequences:
         print(f">{s.id} reverse complement")
@@ -40,14 +46,11 @@ def print_base_count(sequences):
     Print a table of the counts of each base for each sequence.
 
     Args:
-        sequences (list of sequence): List of Sequence objects to process.
+        sequences (iterable of sequence): Sequence objects to process.
     """
-    all_counts = [s.base_count() for s in sequences]
     bases_present = [b for b in sequence.valid]
-    table = []
-    for counts, s in zip(all_counts, sequences):
-        row = [s.id] + [counts.get(b, 0) for b in bases_present]
-        table.append(row)
+    ids, matrix = composition_matrix(sequences, bases_present)
+    table = [[seq_id] + row for seq_id, row in zip(ids, matrix)]
     headers = ["Sequence"] + bases_present
     print(tabulate(table, headers=headers, tablefmt="grid"))
 
@@ -56,7 +59,8 @@ def print_summary(sequences):
     Print a full summary of sequences including lengths, GC content, and base composition.
 
     Args:
-        sequences (list of sequence): List of Sequence objects to process.
+        sequences (list): Sequence objects (or ``RecordStats``) to process;
+            it is read once per table.
     """
     print("SEQUENCE LENGTHS")
     print_sequence_lengths_formatted(sequences)
@@ -69,25 +73,180 @@ def print_summary(sequences):
     print("BASE COMPOSITION")
     print_base_count(sequences)
 
-def main():
+class RecordStats:
     """
-    Command-line interface entry point.
+    The per-record values the tables print, taken from one record.
 
-    Parses arguments to specify FASTA input source and analysis options,
-    and prints the requested sequence information.
+    It answers ``sequence_length``, ``gc_content`` and ``base_count`` like
+    the record did, so the tables can be printed after the input has been
+    streamed once without keeping any sequence.
+    """
+
+    __slots__ = ("id", "_length", "_counts")
+
+    def __init__(self, seq):
+        self.id = seq.id
+        self._length = seq.sequence_length()
+        self._counts = seq.base_count()
+
+    def sequence_length(self):
+        return self._length
+
+    def gc_content(self):
+        if not self._length:
+            return 0.0
+        return ((self._counts["G"] + self._counts["C"]) / self._length) * 100
+
+    def base_count(self):
+        return dict(self._counts)
+
+def print_assembly_summary(summary):
+    """
+    Print assembly-level statistics and the length histogram.
+
+    Args:
+        summary (AssemblySummary): Statistics accumulated over a record stream.
+    """
+    stats = summary.to_dict()
+    table = [[k, f"{v:.4f}" if isinstance(v, float) else v] for k, v in stats.items()]
+    print("ASSEMBLY SUMMARY")
+    print(tabulate(table, headers=["Metric", "Value"], tablefmt="grid"))
+    print()
+    print("LENGTH HISTOGRAM")
+    print(tabulate(summary.length_histogram(), headers=["Length", "Sequences"], tablefmt="grid"))
+
+def input_arguments():
+    """
+    Build the options shared by ``main`` and every subcommand.
+
+    The returned parser is passed as ``parents=[...]`` so the input,
+    decompression, process and strictness options are defined in one place.
+
+    Returns:
+        argparse.ArgumentParser: Parent parser without its own ``--help``.
     """
-    arg_parser = argparse.ArgumentParser()
+    parent = argparse.ArgumentParser(add_help=False)
 
-    input_group = arg_parser.add_mutually_exclusive_group(required=True)
-    input_group.add_argument("--file", "-f", help="Path to the FASTA file")
+    input_group = parent.add_mutually_exclusive_group(required=True)
+    input_group.add_argument("--file", "-f", help="Path to the FASTA file (may be gzip/bz2/xz/BGZF compressed)")
     input_group.add_argument("--string", "-s", help="FASTA-formatted string")
 
-    arg_parser.add_argument("--strict", action="store_true",
-                            help="Enable strict parsing (fail on structural errors)")
-    arg_parser.add_argument("--strict-file", action="store_true",
-                            help="Enable strict file validation")
-    arg_parser.add_argument("--strict-seq", action="store_true",
-                            help="Fail on invalid sequence characters")
+    parent.add_argument("--threads", type=int, default=None,
+                        help="Threads for BGZF decompression (default: all CPUs)")
+    parent.add_argument("--processes", "-p", type=int, default=1,
+                        help="Worker processes for parsing, translation or ORF scanning (default: 1)")
+
+    parent.add_argument("--strict", action="store_true",
+                        help="Enable strict parsing (fail on structural errors)")
+    parent.add_argument("--strict-file", action="store_true",
+                        help="Enable strict file validation")
+    parent.add_argument("--strict-seq", action="store_true",
+                        help="Fail on invalid sequence characters")
+    return parent
+
+def open_stream(args, processes=None):
+    """
+    Build a parser for the CLI input and return it with its record stream.
+
+    Args:
+        args (argparse.Namespace): Parsed command-line arguments.
+        processes (int, optional): Parsing processes; defaults to
+            ``args.processes``.
+
+    Returns:
+        tuple: (FASTAParser, iterator of sequence)
+    """
+    fasta_parser = FASTAParser(
+        path=args.file,
+        strict=args.strict,
+        strict_file=args.strict_file,
+        strict_seq=args.strict_seq,
+        threads=args.threads
+    )
+    if args.file:
+        return fasta_parser, fasta_parser.iter_records(args.processes if processes is None else processes)
+    return fasta_parser, fasta_parser.iter_string(args.string)
+
+def translate_main(argv):
+    """
+    ``bioseq translate``: write translated frames of a FASTA input as protein FASTA.
+
+    Args:
+        argv (list of str): Arguments following the subcommand name.
+    """
+    arg_parser = argparse.ArgumentParser(prog="bioseq translate", parents=[input_arguments()])
+    arg_parser.add_argument("--output", "-o", help="Protein FASTA output path (default: stdout)")
+    arg_parser.add_argument("--frames", nargs="+", choices=FRAMES, default=list(FRAMES),
+                            help="Frames to translate (default: all six)")
+    arg_parser.add_argument("--table", "-t", type=int, default=1, choices=sorted(NCBI_TABLES),
+                            help="NCBI translation table (default: 1)")
+    args = arg_parser.parse_args(argv)
+
+    # The worker processes translate; the input is parsed in this process.
+    fasta_parser, records = open_stream(args, processes=1)
+    proteins = Translator(table=args.table).translate_records(records, args.frames, args.processes)
+    try:
+        Exporter.to_fasta(proteins, args.output)
+    except Exception as e:
+        print(f"Parsing failed: {e}", file=sys.stderr)
+        return
+    # The report goes to stderr so it never mixes with FASTA on stdout.
+    print(fasta_parser.get_report(), file=sys.stderr)
+
+def orfs_main(argv):
+    """
+    ``bioseq orfs``: call ORFs genome-wide and stream them as GFF3 or BED.
+
+    Args:
+        argv (list of str): Arguments following the subcommand name.
+    """
+    arg_parser = argparse.ArgumentParser(prog="bioseq orfs", parents=[input_arguments()])
+    arg_parser.add_argument("--output", "-o", help="Output path (default: stdout)")
+    arg_parser.add_argument("--format", choices=["gff3", "bed"], default="gff3",
+                            help="Output format (default: gff3)")
+    arg_parser.add_argument("--min-length", type=int, default=0,
+                            help="Minimum ORF length in nucleotides")
+    arg_parser.add_argument("--mode", choices=ORFDetector.MODES, default="all",
+                            help="Report every start ('all') or the longest ORF per stop ('longest')")
+    arg_parser.add_argument("--start-codons", nargs="+", default=None,
+                            help="Start codons (default: ATG)")
+    arg_parser.add_argument("--table", "-t", type=int, default=None, choices=sorted(NCBI_TABLES),
+                            help="NCBI translation table supplying the stop codons")
+    arg_parser.add_argument("--chunk-size", type=int, default=1 << 20,
+                            help="Bases per chunk sent to a worker")
+    args = arg_parser.parse_args(argv)
+
+    detector = ORFDetector(args.min_length, args.table, args.mode,
+                           [c.upper() for c in args.start_codons] if args.start_codons else None)
+    # The worker processes scan chromosome chunks; the input is parsed in this process.
+    fasta_parser, records = open_stream(args, processes=1)
+    orfs = call_orfs(records, detector, args.processes, args.chunk_size)
+    write = Exporter.orfs_to_gff3 if args.format == "gff3" else Exporter.orfs_to_bed
+    try:
+        write(orfs, args.output)
+    except Exception as e:
+        print(f"Parsing failed: {e}", file=sys.stderr)
+        return
+    print(fasta_parser.get_report(), file=sys.stderr)
+
+SUBCOMMANDS = {
+    "translate": translate_main,
+    "orfs": orfs_main,
+}
+
+def main(argv=None):
+    """
+    Command-line interface entry point.
+
+    Parses arguments to specify FASTA input source and analysis options,
+    and prints the requested sequence information. A first argument naming
+    one of ``SUBCOMMANDS`` hands the remaining arguments to that command.
+    """
+    argv = sys.argv[1:] if argv is None else argv
+    if argv and argv[0] in SUBCOMMANDS:
+        return SUBCOMMANDS[argv[0]](argv[1:])
+
+    arg_parser = argparse.ArgumentParser(parents=[input_arguments()])
 
     arg_parser.add_argument("--length", "-l", action="store_true",
                             help="Compute sequence length per sequence")
@@ -97,23 +256,25 @@ def main():
                             help="Compute reverse complements per sequence")
     arg_parser.add_argument("--basecount", "-b", action="store_true",
                             help="Compute base counts per sequence")
-    arg_parser.add_argument("--summary", action="store_true",
-                            help="Print summary statistics")
+    arg_parser.add_argument("--summary", nargs="?", const="tables", choices=["tables", "assembly"],
+                            help="Print summary statistics; 'assembly' streams N50/GC/length "
+                                 "statistics in a single pass")
 
-    args = arg_parser.parse_args()
-
-    fasta_parser = FASTAParser(
-        path=args.file,
-        strict=args.strict,
-        strict_file=args.strict_file,
-        strict_seq=args.strict_seq
-    )
+    args = arg_parser.parse_args(argv)
 
+    # One pass validates the input and keeps only the per-record values the
+    # tables need; the tables are printed after the parser report.
+    wants_tables = args.length or args.gc or args.basecount or args.summary == "tables" or not any(
+        [args.length, args.gc, args.revcomp, args.basecount, args.summary])
+    rows = []
+    assembly = AssemblySummary() if args.summary == "assembly" else None
     try:
-        if args.file:
-            fasta_parser.parse_file()
-        else:
-            fasta_parser.parse_string(args.string)
+        fasta_parser, records = open_stream(args)
+        for record in records:
+            if wants_tables:
+                rows.append(RecordStats(record))
+            if assembly is not None:
+                assembly.add(record)
     except Exception as e:
         print(f"Parsing failed: {e}")
         return
@@ -121,30 +282,33 @@ def main():
     print(fasta_parser.get_report())
     print()
 
-    sequences = fasta_parser.sequences
-
-    if not sequences:
+    if not fasta_parser.records_parsed:
         raise ValueError("No valid sequences parsed.")
 
     if not any([args.length, args.gc, args.revcomp, args.basecount, args.summary]):
-        print_summary(sequences)
+        print_summary(rows)
         return
 
     if args.length:
-        print_sequence_lengths_formatted(sequences)
+        print_sequence_lengths_formatted(rows)
         print()
 
     if args.gc:
-        print_gc_content_table(sequences)
+        print_gc_content_table(rows)
         print()
 
     if args.revcomp:
-        print_revcomp(sequences)
+        # Reverse complements are whole sequences, not per-record values, so
+        # they are streamed again rather than held from the first pass.
+        print_revcomp(open_stream(args)[1])
         print()
 
     if args.basecount:
-        print_base_count(sequences)
+        print_base_count(rows)
         print()
 
-    if args.summary:
-        print_summary(sequences)
\ No newline at end of file
+    if args.summary == "tables":
+        print_summary(rows)
+
+    if assembly is not None:
+        print_assembly_summary(assembly)
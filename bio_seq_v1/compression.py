@@ -0,0 +1,154 @@
+"""
+Transparent decompression of sequence files.
+
+The compression format is picked from the file's magic bytes, not its
+extension. Block-gzipped (BGZF) files are split into their independent
+deflate blocks, which are inflated in parallel on a thread pool (zlib
+releases the GIL while it works).
+"""
+
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Iterator, Optional
+import bz2
+import gzip
+import io
+import lzma
+import os
+import struct
+import zlib
+
+GZIP_MAGIC = b"\x1f\x8b"
+BZ2_MAGIC = b"BZh"
+XZ_MAGIC = b"\xfd7zXZ\x00"
+
+_BGZF_HEADER = struct.Struct("<4s4xBBH")
+
+
+def detect_compression(path) -> Optional[str]:
+    """
+    Identify the compression of a file from its leading bytes.
+
+    Returns:
+        str or None: One of "bgzf", "gzip", "bz2", "xz", or None for plain files.
+    """
+    with open(path, "rb") as f:
+        head = f.read(18)
+    if head.startswith(GZIP_MAGIC):
+        return "bgzf" if _is_bgzf_header(head) else "gzip"
+    if head.startswith(BZ2_MAGIC):
+        return "bz2"
+    if head.startswith(XZ_MAGIC):
+        return "xz"
+    return None
+
+
+def _is_bgzf_header(head: bytes) -> bool:
+    # FEXTRA set and a 'BC' subfield first in the extra field (SAM spec 4.1).
+    return len(head) >= 18 and head[3] & 4 and head[12:14] == b"BC"
+
+
+def _read_bgzf_blocks(f) -> Iterator[bytes]:
+    """Yield the raw (still compressed) BGZF blocks of an open binary file."""
+    while True:
+        header = f.read(12)
+        if not header:
+            return
+        if len(header) < 12:
+            raise ValueError("Truncated BGZF block header")
+        magic, _, _, xlen = _BGZF_HEADER.unpack(header)
+        if magic[:3] != b"\x1f\x8b\x08" or not magic[3] & 4:
+            raise ValueError("Not a BGZF block")
+        extra = f.read(xlen)
+        bsize = None
+        i = 0
+        while i + 4 <= len(extra):
+            slen = struct.unpack_from("<H", extra, i + 2)[0]
+            if extra[i:i + 2] == b"BC" and slen == 2:
+                bsize = struct.unpack_from("<H", extra, i + 4)[0]
+            i += 4 + slen
+        if bsize is None:
+            raise ValueError("BGZF block without BSIZE field")
+        body = f.read(bsize + 1 - 12 - xlen)
+        if len(body) != bsize + 1 - 12 - xlen:
+            raise ValueError("Truncated BGZF block")
+        yield body
+
+
+def _inflate_block(body: bytes) -> bytes:
+    data = zlib.decompress(body[:-8], -15)
+    crc, isize = struct.unpack("<II", body[-8:])
+    if len(data) != isize or zlib.crc32(data) != crc:
+        raise ValueError("BGZF block failed CRC check")
+    return data
+
+
+def iter_bgzf(path, threads: Optional[int] = None) -> Iterator[bytes]:
+    """
+    Decompress a BGZF file block by block, in order, using a thread pool.
+
+    At most ``4 * threads`` blocks are in flight at once, so memory stays
+    bounded regardless of file size.
+
+    Args:
+        path: Path to the BGZF file.
+        threads (int, optional): Worker threads; defaults to the CPU count.
+    """
+    threads = threads or os.cpu_count() or 1
+    with open(path, "rb") as f, ThreadPoolExecutor(max_workers=threads) as pool:
+        pending = deque()
+        for body in _read_bgzf_blocks(f):
+            pending.append(pool.submit(_inflate_block, body))
+            if len(pending) >= 4 * threads:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+class BGZFReader(io.RawIOBase):
+    """Read-only binary stream over the parallel BGZF decompressor."""
+
+    def __init__(self, path, threads: Optional[int] = None):
+        self._blocks = iter_bgzf(path, threads)
+        self._buffer = b""
+
+    def readable(self):
+        return True
+
+    def readinto(self, b):
+        while not self._buffer:
+            block = next(self._blocks, None)
+            if block is None:
+                return 0
+            self._buffer = block
+        n = min(len(b), len(self._buffer))
+        b[:n] = self._buffer[:n]
+        self._buffer = self._buffer[n:]
+        return n
+
+    def close(self):
+        if not self.closed:
+            self._blocks.close()
+        super().close()
+
+
+def open_binary(path, threads: Optional[int] = None):
+    """Open ``path`` for binary reading, decompressing it if needed."""
+    kind = detect_compression(path)
+    if kind == "bgzf":
+        return io.BufferedReader(BGZFReader(path, threads), buffer_size=1 << 16)
+    if kind == "gzip":
+        return gzip.open(path, "rb")
+    if kind == "bz2":
+        return bz2.open(path, "rb")
+    if kind == "xz":
+        return lzma.open(path, "rb")
+    return open(path, "rb")
+
+
+def open_text(path, threads: Optional[int] = None):
+    """Open ``path`` for text reading, decompressing it if needed."""
+    if detect_compression(path) is None:
+        return Path(path).open("r")
+    return io.TextIOWrapper(open_binary(path, threads))
@@ -0,0 +1,129 @@
+"""
+Exact and near-duplicate record detection.
+
+Records are fingerprinted with a 128-bit BLAKE2b digest of their
+sequence, so exact duplicates are found in O(1) per record while only the
+digests are kept in memory. With ``strand_aware`` the digest of the
+reverse complement is checked too. The optional containment check also
+catches records that are a prefix or suffix of an earlier record; it
+needs the kept sequences, so it is off by default.
+"""
+
+from bio_seq_v1.stats import sequence
+from typing import Iterable, Iterator, List, NamedTuple, Optional, Tuple
+import hashlib
+
+
+class Duplicate(NamedTuple):
+    """A record that was recognised as redundant."""
+    id: str
+    duplicate_of: str
+    kind: str  # "exact", "reverse_complement", "prefix" or "suffix"
+
+
+def _digest(seq: str) -> bytes:
+    return hashlib.blake2b(seq.encode("ascii"), digest_size=16).digest()
+
+
+class Deduplicator:
+    """
+    Streaming duplicate filter for sequence records.
+
+    Attributes:
+        strand_aware (bool): Treat a record and its reverse complement as equal.
+        containment (bool): Also flag records that are a prefix or suffix of
+            an earlier kept record (on either strand if ``strand_aware``).
+        anchor (int): Length of the prefix/suffix used to find containment
+            candidates; shorter records are only checked for exact duplicates.
+        duplicates (list of Duplicate): Everything flagged so far.
+    """
+
+    def __init__(self, strand_aware: bool = True, containment: bool = False, anchor: int = 32):
+        if anchor <= 0:
+            raise ValueError("anchor must be positive")
+        self.strand_aware = strand_aware
+        self.containment = containment
+        self.anchor = anchor
+        self.duplicates = []
+        self._seen = {}
+        self._kept = []
+        self._prefixes = {}
+        self._suffixes = {}
+
+    def check(self, record) -> Optional[Duplicate]:
+        """
+        Classify a record against everything kept so far and keep it if new.
+
+        Returns:
+            Duplicate or None: The match found, or None if the record is new.
+        """
+        seq = record.sequence
+        forward = _digest(seq)
+        hit = self._seen.get(forward)
+        if hit is not None:
+            return self._flag(Duplicate(record.id, hit, "exact"))
+        rc = seq.translate(sequence.revcomp_table)[::-1] if self.strand_aware else None
+        if rc is not None:
+            hit = self._seen.get(_digest(rc))
+            if hit is not None:
+                return self._flag(Duplicate(record.id, hit, "reverse_complement"))
+        if self.containment and len(seq) >= self.anchor:
+            for query in (seq, rc) if rc is not None else (seq,):
+                found = self._contained(record.id, query)
+                if found is not None:
+                    return self._flag(found)
+
+        self._seen[forward] = record.id
+        if self.containment:
+            self._index(record.id, seq)
+        return None
+
+    def _flag(self, duplicate):
+        self.duplicates.append(duplicate)
+        return duplicate
+
+    def _contained(self, record_id, query) -> Optional[Duplicate]:
+        a = self.anchor
+        for i in self._prefixes.get(query[:a], ()):
+            kept_id, kept = self._kept[i]
+            if len(kept) > len(query) and kept.startswith(query):
+                return Duplicate(record_id, kept_id, "prefix")
+        for i in self._suffixes.get(query[-a:], ()):
+            kept_id, kept = self._kept[i]
+            if len(kept) > len(query) and kept.endswith(query):
+                return Duplicate(record_id, kept_id, "suffix")
+        return None
+
+    def _index(self, record_id, seq):
+        if len(seq) < self.anchor:
+            return
+        i = len(self._kept)
+        self._kept.append((record_id, seq))
+        self._prefixes.setdefault(seq[:self.anchor], []).append(i)
+        self._suffixes.setdefault(seq[-self.anchor:], []).append(i)
+
+    def filter(self, records: Iterable) -> Iterator:
+        """Yield only the first occurrence of each record; duplicates go to ``self.duplicates``."""
+        for record in records:
+            if self.check(record) is None:
+                yield record
+
+
+def deduplicate(records: Iterable, strand_aware: bool = True, containment: bool = False,
+                anchor: int = 32) -> Tuple[List, List[Duplicate]]:
+    """
+    Remove duplicates from a finite collection of records.
+
+    Unlike the streaming ``Deduplicator.filter``, records are checked
+    longest first, so a short contig is dropped even when it appears
+    before the longer contig that contains it. Kept records stay in their
+    original order.
+
+    Returns:
+        tuple: (unique records, list of Duplicate)
+    """
+    records = list(records)
+    dedup = Deduplicator(strand_aware, containment, anchor)
+    order = sorted(range(len(records)), key=lambda i: -records[i].sequence_length()) if containment else range(len(records))
+    keep = set(i for i in order if dedup.check(records[i]) is None)
+    return [r for i, r in enumerate(records) if i in keep], dedup.duplicates
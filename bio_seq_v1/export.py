@@ -1,39 +1,58 @@
 from pathlib import Path
-from bio_seq_v1.fasta import FASTAParser
-from bio_seq_v1.stats import sequence
+from bio_seq_v1.fasta import FASTAParser, split_header
+from bio_seq_v1.stats import sequence, window_stats
 from bio_seq_v1.translator import Translator
 from bio_seq_v1.orf import ORFDetector, ORF
 from bio_seq_v1.motif_search import MotifFinder, Match
+from contextlib import contextmanager
 import csv
-import io
 import json
+import re
 import sys
 
+# Characters GFF3 allows unescaped in the seqid column, and characters it
+# reserves in attribute values.
+_GFF3_SEQID_ESCAPE = re.compile(r"[^a-zA-Z0-9.:^*$@!+_?|-]")
+_GFF3_ATTRIBUTE_ESCAPE = re.compile(r"[\x00-\x1f\x7f%;=&,]")
+
+
+def _gff3_escape(pattern, value):
+    return pattern.sub(lambda m: "".join(f"%{b:02X}" for b in m.group().encode()), value)
+
+
 class Exporter:
     
     @staticmethod
-    def _write_or_print(content: str, file_path = None):
+    @contextmanager
+    def _open_output(file_path=None):
         if file_path:
-            Path(file_path).parent.mkdir(parents=True, file_path=None)
-            with open(file_path, "w", encoding="utf-8") as f:
-                f.write(content)
+            Path(file_path).parent.mkdir(parents=True, exist_ok=True)
+            with open(file_path, "w", encoding="utf-8", newline="") as f:
+                yield f
         else:
-            sys.stdout.write(content)
+            yield sys.stdout
+
+    @staticmethod
+    def _write_or_print(content: str, file_path = None):
+        with Exporter._open_output(file_path) as out:
+            out.write(content)
     
     @staticmethod
     def to_csv(data, file_path=None, delimiter=","):
-        if not data:
-            Exporter._write_or_print("", file_path)
-            return
-        buffer = io.StringIO()
-        writer = csv.DictWriter(
-            buffer,
-            fieldnames=data[0].keys,
-            delimiter=delimiter
-        )
-        writer.writeheader()
-        writer.writerows(data)
-        Exporter._write_or_print(buffer.getvalue(), file_path)
+        rows = iter(data)
+        first = next(rows, None)
+        with Exporter._open_output(file_path) as out:
+            if first is None:
+                return
+            writer = csv.DictWriter(
+                out,
+                fieldnames=list(first.keys()),
+                delimiter=delimiter
+            )
+            writer.writeheader()
+            writer.writerow(first)
+            for row in rows:
+                writer.writerow(row)
 
     @staticmethod
     def to_tsv(data, file_path=None):
@@ -46,7 +65,7 @@ class Exporter:
 
     @staticmethod
     def sequences_to_csv(sequences, file_path=None):
-        rows = [
+        rows = (
             {
                 "id": seq.id,
                 "length": seq.sequence_length(),
@@ -55,12 +74,12 @@ class Exporter:
                 "reverse complement": seq.rev_complement()
             }
             for seq in sequences
-        ]
+        )
         Exporter.to_csv(rows, file_path)
 
     @staticmethod
     def orfs_to_csv(orfs, file_path=None):
-        rows = [
+        rows = (
             {
                 "sequence id": orf.seq_id,
                 'start': orf.start,
@@ -71,12 +90,52 @@ class Exporter:
                 'protein': orf.protein
             }
             for orf in orfs
-        ]
+        )
         Exporter.to_csv(rows, file_path)
 
+    @staticmethod
+    def orfs_to_gff3(orfs, file_path=None, source="bio_seq_v1"):
+        """
+        Stream ORFs as GFF3 features (1-based, inclusive coordinates).
+
+        The seqid is the record name (first word of the header, as in a
+        ``.fai`` index), percent-escaped like the attribute values.
+
+        Args:
+            orfs (iterable of ORF): ORFs to write (may be a stream).
+            file_path (str, optional): Output path; stdout when omitted.
+            source (str): Value of the GFF3 source column.
+        """
+        with Exporter._open_output(file_path) as out:
+            out.write("##gff-version 3\n")
+            for n, orf in enumerate(orfs, start=1):
+                name = split_header(orf.seq_id)[0]
+                seqid = _gff3_escape(_GFF3_SEQID_ESCAPE, name)
+                feature_id = _gff3_escape(_GFF3_ATTRIBUTE_ESCAPE, f"{name}_orf{n}")
+                out.write(
+                    f"{seqid}\t{source}\tORF\t{orf.start + 1}\t{orf.end + 1}\t.\t{orf.strand}\t.\t"
+                    f"ID={feature_id};frame={orf.frame};length={orf.length}\n"
+                )
+
+    @staticmethod
+    def orfs_to_bed(orfs, file_path=None):
+        """
+        Stream ORFs as BED6 (0-based, half-open coordinates).
+
+        The chrom column is the record name (first word of the header).
+
+        Args:
+            orfs (iterable of ORF): ORFs to write (may be a stream).
+            file_path (str, optional): Output path; stdout when omitted.
+        """
+        with Exporter._open_output(file_path) as out:
+            for n, orf in enumerate(orfs, start=1):
+                name = split_header(orf.seq_id)[0]
+                out.write(f"{name}\t{orf.start}\t{orf.end + 1}\t{name}_orf{n}\t0\t{orf.strand}\n")
+
     @staticmethod
     def motifs_to_csv(matches, file_path=None):
-        rows=[
+        rows = (
             {
                 "id" : m.id,
                 "position" : m.position,
@@ -84,16 +143,31 @@ class Exporter:
                 'strand_attributes' : m.strand_attributes
             }
             for m in matches
-        ]
+        )
         Exporter.to_csv(rows, file_path)
 
     @staticmethod
     def to_fasta(sequences, file_path=None):
-        lines = []
-        for seq in sequences:
-            lines.append(f">{seq.id}")
-            lines.append(seq.sequence)
-        content = "\n".join(lines) + "\n"
-        Exporter._write_or_print(content,file_path)
-
-    
\ No newline at end of file
+        with Exporter._open_output(file_path) as out:
+            for seq in sequences:
+                out.write(f">{seq.id}\n{seq.sequence}\n")
+
+    @staticmethod
+    def windows_to_bedgraph(sequences, window, step=None, metric="gc", file_path=None):
+        """
+        Stream a windowed statistic for each sequence as BEDGraph.
+
+        Args:
+            sequences (iterable of sequence): Records to scan (may be a stream).
+            window (int): Window size in bases.
+            step (int, optional): Distance between window starts.
+            metric (str): One of "gc", "gc_skew" or "n_fraction".
+            file_path (str, optional): Output path; stdout when omitted.
+        """
+        if metric not in ("gc", "gc_skew", "n_fraction"):
+            raise ValueError(f"Unknown window metric '{metric}'")
+        with Exporter._open_output(file_path) as out:
+            for seq in sequences:
+                name = split_header(seq.id)[0]
+                for w in window_stats(seq, window, step):
+                    out.write(f"{name}\t{w.start}\t{w.end}\t{getattr(w, metric):.6g}\n")
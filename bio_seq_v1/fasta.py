@@ -5,19 +5,57 @@ This module provides helper functions to validate FASTA file paths
 and parse FASTA-formatted files into sequence objects.
 """
 
+from bio_seq_v1.compression import detect_compression, open_text
 from bio_seq_v1.stats import sequence
+from bio_seq_v1.validation import find_invalid
+from bio_seq_v1.views import SequenceView
 from pathlib import Path
-from typing import Optional
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterable, Iterator, NamedTuple, Optional, Tuple
+import io
+import mmap
+
+
+def split_header(header: str) -> Tuple[str, str]:
+    """
+    Split a FASTA header into its name and description.
+
+    The name is the first whitespace-delimited token, as in a ``.fai``
+    index; the description is the rest of the line (empty if absent).
+    """
+    fields = header.split(None, 1)
+    if not fields:
+        return "", ""
+    return fields[0], fields[1] if len(fields) > 1 else ""
+
+
+class FAIEntry(NamedTuple):
+    """One row of a samtools-style ``.fai`` index."""
+    name: str
+    length: int
+    offset: int
+    line_bases: int
+    line_width: int
+
+    def byte_offset(self, pos: int) -> int:
+        """Byte offset in the FASTA file of residue ``pos`` (0-based)."""
+        return self.offset + (pos // self.line_bases) * self.line_width + pos % self.line_bases
 
 
 class FASTAParser:
-    def __init__(self, path: Optional[str] = None, strict: bool = False, strict_file: bool = False, strict_seq: bool = False):
+    def __init__(self, path: Optional[str] = None, strict: bool = False, strict_file: bool = False, strict_seq: bool = False, threads: Optional[int] = None):
         self.path = Path(path) if path else None
         self.sequences = []
         self.errors = []
+        self.warnings = []
+        self.records_parsed = 0
+        self.index = None
+        self._mmap = None
         self.strict = strict
         self.strict_file = strict_file
         self.strict_seq = strict_seq
+        self.threads = threads
 
         if self.strict_file:
             self._strict_file_validate()
@@ -37,87 +75,151 @@ class FASTAParser:
             raise ValueError(f"File is empty.")
         
     def _validate_sequence(self, seq, linenum):
-        valid = set("ACGTNRYKMSWBDHV")
-        for ch in seq.upper():
-            if ch not in valid:
-                raise ValueError(f"invalid character '{ch}'")        
-              
-    def _parse_lines(self, lines):
-            seq = []
-            header = None
-            for linenum, line in enumerate(lines, start =1):
-                if not line:
-                    continue
-                line = line.strip()
-                if not line:
-                    self.errors.append(f"Empty or whitespace-only sequence at line {linenum}")
-                    continue
-                if line.startswith(">"):
-                    if header is None and seq:
-                        msg = f"Sequence found before header at line {linenum}: {seq}"
-                        if self.strict:
-                            raise ValueError(msg)
-                        else:
-                            self.errors.append(msg)
-                    if header:
-                        self.sequences.append(sequence(header, "".join(seq)))
-                    header = line[1:]
-                    seq = []
-                    if header and not seq:
-                        msg = f"Header '{header}' has no sequence"
-                        if self.strict:
-                            raise ValueError(msg)
-                        else:
-                            self.errors.append(msg)
-                    else:
-                        if not header:
-                            msg = f"Sequence line before any header at line {linenum}"
-                            if self.strict:
-                                raise ValueError(msg)
-                            else:
-                                self.errors.append(msg)
-                            continue
-
-                        # Empty / whitespace-only line (after strip)
-                        if not line:
-                            self.errors.append(f"Empty or whitespace-only sequence at line {linenum}")
-                            continue
-
-                        try:
-                            self._validate_sequence(line, linenum)
-                        except ValueError as e:
-                            # Ensure error message contains line number and 'invalid'
-                            msg = f"Invalid sequence character at line {linenum}: {e}"
-                            if self.strict:
-                                raise ValueError(msg)
-                            else:
-                                self.errors.append(msg)
-                            continue
-
-                        seq.append(line.upper())                
-            if seq:
-                try:
-                    self.sequences.append(sequence(header, "".join(seq)))
-                except ValueError as e:
-                    self.errors.append(str(e))
-            elif seq and not header:
-                msg = "Sequence without header at end of file"
-            if not self.sequences:
-                msg = "No sequences found (empty or whitespace-only input)"
-                if self.strict:
-                    raise ValueError(msg)
-                else:
-                    self.errors.append(msg)
-
-    def parse_file(self):
+        pos = find_invalid(seq)
+        if pos < 0:
+            return True
+        self._report(f"Invalid nucleotide '{seq[pos]}'", self.strict or self.strict_seq, linenum, pos + 1)
+        return False
+
+    def _report(self, msg, strict, linenum=None, column=None):
+        msg = _located(msg, linenum, column)
+        if strict:
+            raise ValueError(msg)
+        self.errors.append(msg)
+
+    def _build_record(self, header, seq):
+        if header is None:
+            header = "anonymous"
+        elif not seq:
+            self._report(f"Header '{header}' has no sequence", self.strict)
+            return None
+        # Every line was already checked by _validate_sequence and uppercased.
+        return sequence.trusted(header, "".join(seq))
+
+    def _parse_lines(self, lines: Iterable[str]) -> Iterator[sequence]:
+        """
+        Parse FASTA lines lazily, yielding one sequence record at a time.
+
+        Only the residues of the record currently being read are held in
+        memory. Errors are raised or collected in ``self.errors`` according
+        to ``strict``/``strict_seq``, exactly as for the eager parsers.
+        """
+        seq = []
+        header = None
+        for linenum, line in enumerate(lines, start=1):
+            line = line.strip()
+            if not line:
+                self._report("Empty or whitespace-only sequence", False, linenum)
+                continue
+            if line.startswith(">"):
+                if header is not None or seq:
+                    record = self._build_record(header, seq)
+                    if record is not None:
+                        yield record
+                header = line[1:]
+                seq = []
+                continue
+
+            if header is None and not seq:
+                self._report("Sequence line before any header", self.strict, linenum)
+
+            if not self._validate_sequence(line, linenum):
+                continue
+
+            seq.append(line.upper())
+
+        if header is not None or seq:
+            record = self._build_record(header, seq)
+            if record is not None:
+                yield record
+
+    def _count(self, records):
+        found = 0
+        for record in records:
+            found += 1
+            self.records_parsed += 1
+            yield record
+        if not found:
+            self._report("No sequences found (empty or whitespace-only input)", self.strict)
+
+    def iter_records(self, processes: int = 1, chunk_size: int = 1 << 24) -> Iterator[sequence]:
+        """
+        Stream the records of ``self.path`` one ``sequence`` at a time.
+
+        Unlike ``parse_file`` nothing is accumulated in ``self.sequences``,
+        so memory use is bounded by the largest single record. gzip, bz2,
+        xz and BGZF input is decompressed on the fly (see
+        ``bio_seq_v1.compression``); ``self.threads`` sizes the BGZF pool.
+
+        Args:
+            processes (int): With more than one process, an uncompressed
+                file is cut at record boundaries into ``chunk_size``-byte
+                ranges that are parsed and validated in a process pool.
+                Records are still yielded in file order.
+            chunk_size (int): Target size in bytes of each parallel chunk.
+        """
         if not self.path:
             raise ValueError("No file path provided")
-        with self.path.open("r") as f:
-            self._parse_lines(f)
-        
+        if processes > 1 and detect_compression(self.path) is None:
+            yield from self._count(self._parse_parallel(processes, chunk_size))
+            return
+        with open_text(self.path, self.threads) as f:
+            yield from self._count(self._parse_lines(f))
+
+    def iter_string(self, fasta_str: str) -> Iterator[sequence]:
+        """Stream the records of a FASTA-formatted string."""
+        return self._count(self._parse_lines(fasta_str.splitlines()))
+
+    def parse_file(self, processes: int = 1):
+        self.sequences.extend(self.iter_records(processes))
 
     def parse_string(self, fasta_str: str):
-        self._parse_lines(fasta_str.splitlines())   
+        self.sequences.extend(self.iter_string(fasta_str))
+
+    def _chunk_ranges(self, chunk_size: int):
+        size = self.path.stat().st_size
+        if size == 0:
+            return []
+        with self.path.open("rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            bounds = [0]
+            while True:
+                cut = mm.find(b"\n>", bounds[-1] + max(chunk_size, 1) - 1)
+                if cut == -1:
+                    break
+                bounds.append(cut + 1)
+        bounds.append(size)
+        return list(zip(bounds, bounds[1:]))
+
+    def _parse_parallel(self, processes: int, chunk_size: int) -> Iterator[sequence]:
+        ranges = self._chunk_ranges(chunk_size)
+        if len(ranges) < 2:
+            with self.path.open("r") as f:
+                yield from self._parse_lines(f)
+            return
+        path = str(self.path)
+        options = (self.strict, self.strict_seq)
+        with ProcessPoolExecutor(max_workers=processes) as pool:
+            pending = deque()
+            # Workers number lines from 1; each chunk's results are shifted by
+            # the newlines of the chunks before it as they arrive in order.
+            offset = 0
+            for start, end in ranges:
+                pending.append(pool.submit(_parse_chunk, path, start, end, options))
+                if len(pending) < 2 * processes:
+                    continue
+                offset = yield from self._merge_chunk(pending.popleft().result(), offset)
+            while pending:
+                offset = yield from self._merge_chunk(pending.popleft().result(), offset)
+
+    def _merge_chunk(self, result, offset):
+        records, errors, failure, newlines = result
+        for msg, linenum, column in errors:
+            self._report(msg, False, None if linenum is None else linenum + offset, column)
+        yield from records
+        if failure is not None:
+            msg, linenum, column = failure
+            self._report(msg, True, None if linenum is None else linenum + offset, column)
+        return offset + newlines
 
     def get_report(self):
         lines =[]
@@ -128,7 +230,7 @@ class FASTAParser:
         else:
             lines.append("Parser successful with warnings.")
 
-        lines.append(f"Sequences parsed: {len(self.sequences)}")
+        lines.append(f"Sequences parsed: {self.records_parsed}")
 
         if self.errors:
             lines.append("\nErrors: ")
@@ -139,4 +241,197 @@ class FASTAParser:
             for war in self.warnings:
                 lines.append(f"-{war}")
         return "\n".join(lines)
-        
+
+    def build_index(self) -> Dict[str, FAIEntry]:
+        """
+        Scan ``self.path`` once and build a ``.fai``-style index.
+
+        Records are keyed by the first whitespace-delimited word of their
+        header, as samtools does. Every line of a record except the last
+        must have the same length, otherwise random access is impossible.
+
+        Returns:
+            dict: Record name -> FAIEntry, in file order.
+        """
+        if not self.path:
+            raise ValueError("No file path provided")
+        if detect_compression(self.path):
+            raise ValueError(f"Random access requires an uncompressed FASTA file: {self.path}")
+        index = {}
+        name = None
+        length = offset = line_bases = line_width = 0
+        short_line = False
+        pos = 0
+
+        def close_record():
+            if name in index:
+                raise ValueError(f"Duplicate record name '{name}' in {self.path}")
+            index[name] = FAIEntry(name, length, offset, line_bases, line_width)
+
+        with self.path.open("rb") as f:
+            for linenum, raw in enumerate(f, start=1):
+                line_start = pos
+                pos += len(raw)
+                if raw.startswith(b">"):
+                    if name is not None:
+                        close_record()
+                    fields = raw[1:].split()
+                    if not fields:
+                        raise ValueError(f"Header without a name at line {linenum}")
+                    name = fields[0].decode()
+                    length = line_bases = line_width = 0
+                    offset = pos
+                    short_line = False
+                    continue
+                bases = len(raw.rstrip(b"\r\n"))
+                if name is None:
+                    if bases:
+                        raise ValueError(f"Sequence line before any header at line {linenum}")
+                    continue
+                if not bases:
+                    short_line = short_line or length > 0
+                    continue
+                if short_line:
+                    raise ValueError(f"Inconsistent line length in '{name}' at line {linenum}")
+                if not line_bases:
+                    line_bases, line_width = bases, len(raw)
+                    offset = line_start
+                elif bases > line_bases:
+                    raise ValueError(f"Inconsistent line length in '{name}' at line {linenum}")
+                if bases < line_bases or len(raw) != line_width:
+                    short_line = True
+                length += bases
+        if name is not None:
+            close_record()
+        self.index = index
+        return index
+
+    def _index_path(self, index_path=None) -> Path:
+        if index_path:
+            return Path(index_path)
+        if not self.path:
+            raise ValueError("No file path provided")
+        return self.path.with_name(self.path.name + ".fai")
+
+    def write_index(self, index_path=None) -> Path:
+        """Build the index if needed and save it next to the FASTA file (``<file>.fai``)."""
+        if self.index is None:
+            self.build_index()
+        out = self._index_path(index_path)
+        with out.open("w") as f:
+            for e in self.index.values():
+                f.write(f"{e.name}\t{e.length}\t{e.offset}\t{e.line_bases}\t{e.line_width}\n")
+        return out
+
+    def load_index(self, index_path=None) -> Dict[str, FAIEntry]:
+        """Load a previously written ``.fai`` index."""
+        index = {}
+        with self._index_path(index_path).open("r") as f:
+            for linenum, line in enumerate(f, start=1):
+                fields = line.rstrip("\n").split("\t")
+                if len(fields) < 5:
+                    raise ValueError(f"Malformed index line {linenum}")
+                name = fields[0]
+                index[name] = FAIEntry(name, *(int(x) for x in fields[1:5]))
+        self.index = index
+        return index
+
+    def view(self, seq_id: str, start: int = 0, end: Optional[int] = None) -> SequenceView:
+        """
+        Return a zero-copy view of residues ``[start, end)`` of one record.
+
+        The file is memory-mapped and the view reads straight from the map,
+        so slicing, ``gc_content`` and ``base_count`` only touch the bytes of
+        the region. The index is loaded from ``<file>.fai`` when present and
+        built otherwise.
+
+        Args:
+            seq_id (str): Record name as stored in the index, or the full
+                header of a parsed record (only its first word is used).
+            start (int): 0-based start position (inclusive).
+            end (int, optional): 0-based end position (exclusive); defaults
+                to the end of the record.
+
+        Returns:
+            SequenceView: View over the region.
+        """
+        if self.index is None:
+            if self._index_path().exists():
+                self.load_index()
+            else:
+                self.build_index()
+        seq_id = split_header(seq_id)[0]
+        if seq_id not in self.index:
+            raise KeyError(f"Sequence '{seq_id}' not found in index")
+        entry = self.index[seq_id]
+        if end is None or end > entry.length:
+            end = entry.length
+        if start < 0 or start > end:
+            raise ValueError(f"Invalid region {start}-{end} for '{seq_id}'")
+        if self._mmap is None:
+            with self.path.open("rb") as f:
+                self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        return SequenceView(entry.name, self._mmap, entry.offset, max(entry.line_bases, 1),
+                            max(entry.line_width, 1), start, end)
+
+    def fetch(self, seq_id: str, start: int = 0, end: Optional[int] = None) -> str:
+        """
+        Read residues ``[start, end)`` of one record straight from disk.
+
+        Same lookup as ``view``, but the region is copied out as a string.
+
+        Returns:
+            str: Uppercase sequence of the region.
+        """
+        return self.view(seq_id, start, end).sequence
+
+    def close(self):
+        """Release the memory map opened by ``view``/``fetch``; open views become unusable."""
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+
+
+def _located(msg, linenum=None, column=None):
+    """Append the 1-based line (and column) an error refers to."""
+    if linenum is None:
+        return msg
+    return f"{msg} at line {linenum}" + ("" if column is None else f", column {column}")
+
+
+class _ChunkError(ValueError):
+    """Strict-mode failure inside a chunk, as ``(msg, linenum, column)``."""
+
+
+class _ChunkParser(FASTAParser):
+    """
+    Parser for one chunk of a file.
+
+    Errors are kept as ``(msg, linenum, column)`` with chunk-local line
+    numbers, so the caller can make them absolute before formatting.
+    """
+
+    def _report(self, msg, strict, linenum=None, column=None):
+        if strict:
+            raise _ChunkError(msg, linenum, column)
+        self.errors.append((msg, linenum, column))
+
+
+def _parse_chunk(path, start, end, options):
+    """
+    Process-pool worker: parse one record-aligned byte range of a FASTA file.
+
+    Line numbers in errors are local to the chunk; the newline count is
+    returned so the caller can make them absolute without rereading.
+    """
+    strict, strict_seq = options
+    with open(path, "rb") as f:
+        f.seek(start)
+        data = f.read(end - start)
+    parser = _ChunkParser(strict=strict, strict_seq=strict_seq)
+    records, failure = [], None
+    try:
+        records.extend(parser._parse_lines(io.TextIOWrapper(io.BytesIO(data))))
+    except _ChunkError as e:
+        failure = e.args
+    return records, parser.errors, failure, data.count(b"\n")
@@ -0,0 +1,169 @@
+"""
+FASTQ file parsing with compact quality scores.
+
+Records are streamed four lines at a time. Phred qualities are decoded
+with a single ``bytes.translate`` call into a ``bytes`` buffer (one byte
+per base) rather than a list of Python ints.
+"""
+
+from bio_seq_v1.compression import open_text
+from bio_seq_v1.stats import sequence
+from bio_seq_v1.validation import find_invalid
+from pathlib import Path
+from typing import Iterable, Iterator, Optional
+
+
+def _phred_table(offset: int) -> bytes:
+    # Characters below the offset map to 255 so they can be detected.
+    return bytes(i - offset if i >= offset else 255 for i in range(256))
+
+
+class FASTQRecord(sequence):
+    """
+    A sequence read with per-base Phred quality scores.
+
+    Attributes:
+        id (str): Read identifier (header without the leading '@').
+        sequence (str): Uppercase string of sequence bases.
+        quality (bytes): Decoded Phred score of each base, one byte per base.
+    """
+
+    def __init__(self, id, sequence, quality: bytes):
+        super().__init__(id, sequence)
+        if len(quality) != len(self.sequence):
+            raise ValueError(f"Read '{id}' has {len(self.sequence)} bases but {len(quality)} quality scores")
+        self.quality = bytes(quality)
+
+    @classmethod
+    def trusted(cls, id, sequence, quality: bytes = b""):
+        obj = super().trusted(id, sequence)
+        obj.quality = quality
+        return obj
+
+    def mean_quality(self) -> float:
+        """
+        Return the arithmetic mean Phred score of the read.
+
+        Returns:
+            float: Mean quality, or 0.0 for an empty read.
+        """
+        if not self.quality:
+            return 0.0
+        return sum(self.quality) / len(self.quality)
+
+    def quality_string(self, offset: int = 33) -> str:
+        """Re-encode the qualities as a FASTQ quality line."""
+        table = bytes((i + offset) & 0xFF for i in range(256))
+        return self.quality.translate(table).decode("ascii")
+
+    def trim(self, threshold: int = 20, five_prime: bool = False):
+        """
+        Trim low-quality bases using the BWA/cutadapt running-sum algorithm.
+
+        The 3' end is cut at the position that maximises the sum of
+        ``threshold - q`` over the removed tail; with ``five_prime`` the same
+        rule is also applied to the start of the read.
+
+        Args:
+            threshold (int): Phred score below which bases count against the read.
+            five_prime (bool): Also trim the 5' end.
+
+        Returns:
+            FASTQRecord: The trimmed read (may be empty).
+        """
+        end = len(self.quality) - _trim_length(reversed(self.quality), threshold)
+        start = _trim_length(self.quality[:end], threshold) if five_prime else 0
+        return FASTQRecord.trusted(self.id, self.sequence[start:end], self.quality[start:end])
+
+
+def _trim_length(qualities: Iterable[int], threshold: int) -> int:
+    # Stops as soon as the running sum goes negative, so only the
+    # low-quality tail is ever visited.
+    total = best = best_at = 0
+    for i, q in enumerate(qualities, start=1):
+        total += threshold - q
+        if total < 0:
+            break
+        if total > best:
+            best, best_at = total, i
+    return best_at
+
+
+class FASTQParser:
+    def __init__(self, path: Optional[str] = None, strict: bool = False, offset: int = 33, threads: Optional[int] = None):
+        self.path = Path(path) if path else None
+        self.records = []
+        self.errors = []
+        self.records_parsed = 0
+        self.strict = strict
+        self.offset = offset
+        self.threads = threads
+        self._decode = _phred_table(offset)
+
+    def _report(self, msg):
+        if self.strict:
+            raise ValueError(msg)
+        self.errors.append(msg)
+
+    def _build_record(self, lines, linenum):
+        header, seq, plus, qual = (line.rstrip("\r\n") for line in lines)
+        if not header.startswith("@"):
+            self._report(f"Expected '@' header at line {linenum}")
+            return None
+        if not plus.startswith("+"):
+            self._report(f"Expected '+' separator at line {linenum + 2}")
+            return None
+        if not seq:
+            self._report(f"Read '{header[1:]}' has no sequence at line {linenum + 1}")
+            return None
+        pos = find_invalid(seq)
+        if pos >= 0:
+            self._report(f"Invalid nucleotide '{seq[pos]}' at line {linenum + 1}, column {pos + 1}")
+            return None
+        if len(qual) != len(seq):
+            self._report(f"Quality length does not match sequence length at line {linenum + 3}")
+            return None
+        try:
+            quality = qual.encode("ascii").translate(self._decode)
+        except UnicodeEncodeError:
+            quality = b"\xff"
+        if 255 in quality:
+            self._report(f"Invalid quality character at line {linenum + 3}")
+            return None
+        return FASTQRecord.trusted(header[1:], seq.upper(), quality)
+
+    def _parse_lines(self, lines: Iterable[str]) -> Iterator[FASTQRecord]:
+        """Parse FASTQ lines lazily, yielding one FASTQRecord at a time."""
+        chunk = []
+        linenum = 1
+        for line in lines:
+            if not chunk and not line.strip():
+                linenum += 1
+                continue
+            chunk.append(line)
+            if len(chunk) == 4:
+                record = self._build_record(chunk, linenum)
+                if record is not None:
+                    self.records_parsed += 1
+                    yield record
+                linenum += 4
+                chunk = []
+        if chunk:
+            self._report(f"Truncated record at line {linenum}")
+
+    def iter_records(self) -> Iterator[FASTQRecord]:
+        """Stream the reads of ``self.path``; compressed input is read directly."""
+        if not self.path:
+            raise ValueError("No file path provided")
+        with open_text(self.path, self.threads) as f:
+            yield from self._parse_lines(f)
+
+    def iter_string(self, fastq_str: str) -> Iterator[FASTQRecord]:
+        """Stream the reads of a FASTQ-formatted string."""
+        return self._parse_lines(fastq_str.splitlines())
+
+    def parse_file(self):
+        self.records.extend(self.iter_records())
+
+    def parse_string(self, fastq_str: str):
+        self.records.extend(self.iter_string(fastq_str))
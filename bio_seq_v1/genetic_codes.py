@@ -0,0 +1,261 @@
+"""
+NCBI translation tables and their compiled lookup form.
+
+Tables are stored in NCBI's compact notation: 64 amino acids (and start
+markers) listed for codons in TCAG order. ``get_code(id)`` expands a table
+and ``compile_genetic_code`` turns any codon table into the lookup used by
+``Translator``. Both are cached, so each table is built once per process
+no matter how many translators or ORF detectors use it.
+"""
+
+from functools import lru_cache
+from itertools import product
+from typing import Dict, FrozenSet, NamedTuple, Optional, Tuple
+
+# id: (name, amino acids, start markers) -- https://www.ncbi.nlm.nih.gov/Taxonomy/Utils/wprintgc.cgi
+NCBI_TABLES = {
+    1: ("Standard",
+        "FFLLSSSSYY**CC*WLLLLPPPPHHQQRRRRIIIMTTTTNNKKSSRRVVVVAAAADDEEGGGG",
+        "---M------**--*----M---------------M----------------------------"),
+    2: ("Vertebrate Mitochondrial",
+        "FFLLSSSSYY**CCWWLLLLPPPPHHQQRRRRIIMMTTTTNNKKSS**VVVVAAAADDEEGGGG",
+        "----------**--------------------MMMM----------**---M------------"),
+    3: ("Yeast Mitochondrial",
+        "FFLLSSSSYY**CCWWTTTTPPPPHHQQRRRRIIMMTTTTNNKKSSRRVVVVAAAADDEEGGGG",
+        "----------**----------------------MM---------------M------------"),
+    4: ("Mold, Protozoan, and Coelenterate Mitochondrial and Mycoplasma/Spiroplasma",
+        "FFLLSSSSYY**CCWWLLLLPPPPHHQQRRRRIIIMTTTTNNKKSSRRVVVVAAAADDEEGGGG",
+        "--MM------**-------M------------MMMM---------------M------------"),
+    5: ("Invertebrate Mitochondrial",
+        "FFLLSSSSYY**CCWWLLLLPPPPHHQQRRRRIIMMTTTTNNKKSSSSVVVVAAAADDEEGGGG",
+        "---M------**--------------------MMMM---------------M------------"),
+    6: ("Ciliate, Dasycladacean and Hexamita Nuclear",
+        "FFLLSSSSYYQQCC*WLLLLPPPPHHQQRRRRIIIMTTTTNNKKSSRRVVVVAAAADDEEGGGG",
+        "--------------*--------------------M----------------------------"),
+    9: ("Echinoderm and Flatworm Mitochondrial",
+        "FFLLSSSSYY**CCWWLLLLPPPPHHQQRRRRIIIMTTTTNNNKSSSSVVVVAAAADDEEGGGG",
+        "----------**-----------------------M---------------M------------"),
+    10: ("Euplotid Nuclear",
+         "FFLLSSSSYY**CCCWLLLLPPPPHHQQRRRRIIIMTTTTNNKKSSRRVVVVAAAADDEEGGGG",
+         "----------**-----------------------M----------------------------"),
+    11: ("Bacterial, Archaeal and Plant Plastid",
+         "FFLLSSSSYY**CC*WLLLLPPPPHHQQRRRRIIIMTTTTNNKKSSRRVVVVAAAADDEEGGGG",
+         "---M------**--*----M------------MMMM---------------M------------"),
+    12: ("Alternative Yeast Nuclear",
+         "FFLLSSSSYY**CC*WLLLSPPPPHHQQRRRRIIIMTTTTNNKKSSRRVVVVAAAADDEEGGGG",
+         "----------**--*----M---------------M----------------------------"),
+    13: ("Ascidian Mitochondrial",
+         "FFLLSSSSYY**CCWWLLLLPPPPHHQQRRRRIIMMTTTTNNKKSSGGVVVVAAAADDEEGGGG",
+         "---M------**----------------------MM---------------M------------"),
+    14: ("Alternative Flatworm Mitochondrial",
+         "FFLLSSSSYYY*CCWWLLLLPPPPHHQQRRRRIIIMTTTTNNNKSSSSVVVVAAAADDEEGGGG",
+         "-----------*-----------------------M----------------------------"),
+    15: ("Blepharisma Nuclear",
+         "FFLLSSSSYY*QCC*WLLLLPPPPHHQQRRRRIIIMTTTTNNKKSSRRVVVVAAAADDEEGGGG",
+         "----------*---*--------------------M----------------------------"),
+    16: ("Chlorophycean Mitochondrial",
+         "FFLLSSSSYY*LCC*WLLLLPPPPHHQQRRRRIIIMTTTTNNKKSSRRVVVVAAAADDEEGGGG",
+         "----------*---*--------------------M----------------------------"),
+    21: ("Trematode Mitochondrial",
+         "FFLLSSSSYY**CCWWLLLLPPPPHHQQRRRRIIMMTTTTNNNKSSSSVVVVAAAADDEEGGGG",
+         "----------**-----------------------M---------------M------------"),
+    22: ("Scenedesmus obliquus Mitochondrial",
+         "FFLLSS*SYY*LCC*WLLLLPPPPHHQQRRRRIIIMTTTTNNKKSSRRVVVVAAAADDEEGGGG",
+         "------*---*---*--------------------M----------------------------"),
+    23: ("Thraustochytrium Mitochondrial",
+         "FF*LSSSSYY**CC*WLLLLPPPPHHQQRRRRIIIMTTTTNNKKSSRRVVVVAAAADDEEGGGG",
+         "--*-------**--*-----------------M--M---------------M------------"),
+    24: ("Rhabdopleuridae Mitochondrial",
+         "FFLLSSSSYY**CCWWLLLLPPPPHHQQRRRRIIIMTTTTNNKKSSSKVVVVAAAADDEEGGGG",
+         "---M------**-------M---------------M---------------M------------"),
+    25: ("Candidate Division SR1 and Gracilibacteria",
+         "FFLLSSSSYY**CCGWLLLLPPPPHHQQRRRRIIIMTTTTNNKKSSRRVVVVAAAADDEEGGGG",
+         "---M------**-----------------------M---------------M------------"),
+    26: ("Pachysolen tannophilus Nuclear",
+         "FFLLSSSSYY**CC*WLLLAPPPPHHQQRRRRIIIMTTTTNNKKSSRRVVVVAAAADDEEGGGG",
+         "----------**--*----M---------------M----------------------------"),
+    27: ("Karyorelict Nuclear",
+         "FFLLSSSSYYQQCCWWLLLLPPPPHHQQRRRRIIIMTTTTNNKKSSRRVVVVAAAADDEEGGGG",
+         "--------------*--------------------M----------------------------"),
+    28: ("Condylostoma Nuclear",
+         "FFLLSSSSYYQQCCWWLLLLPPPPHHQQRRRRIIIMTTTTNNKKSSRRVVVVAAAADDEEGGGG",
+         "----------**--*--------------------M----------------------------"),
+    29: ("Mesodinium Nuclear",
+         "FFLLSSSSYYYYCC*WLLLLPPPPHHQQRRRRIIIMTTTTNNKKSSRRVVVVAAAADDEEGGGG",
+         "--------------*--------------------M----------------------------"),
+    30: ("Peritrich Nuclear",
+         "FFLLSSSSYYEECC*WLLLLPPPPHHQQRRRRIIIMTTTTNNKKSSRRVVVVAAAADDEEGGGG",
+         "--------------*--------------------M----------------------------"),
+    31: ("Blastocrithidia Nuclear",
+         "FFLLSSSSYYEECCWWLLLLPPPPHHQQRRRRIIIMTTTTNNKKSSRRVVVVAAAADDEEGGGG",
+         "----------**-----------------------M----------------------------"),
+    32: ("Balanophoraceae Plastid",
+         "FFLLSSSSYY*WCC*WLLLLPPPPHHQQRRRRIIIMTTTTNNKKSSRRVVVVAAAADDEEGGGG",
+         "---M------*---*----M------------MMMM---------------M------------"),
+    33: ("Cephalodiscidae Mitochondrial",
+         "FFLLSSSSYYY*CCWWLLLLPPPPHHQQRRRRIIIMTTTTNNKKSSSKVVVVAAAADDEEGGGG",
+         "---M-------*-------M---------------M---------------M------------"),
+}
+
+_CODON_ORDER = ["".join(c) for c in product("TCAG", repeat=3)]
+
+# Each base is encoded as a 4-bit IUPAC mask (A=1, C=2, G=4, T/U=8); an
+# ambiguity code is the OR of the bases it stands for and anything else
+# (gaps, invalid characters) is 0.
+IUPAC_MASKS = {
+    "A": 1, "C": 2, "G": 4, "T": 8, "U": 8,
+    "M": 3, "R": 5, "W": 9, "S": 6, "Y": 10, "K": 12,
+    "V": 7, "H": 11, "D": 13, "B": 14, "N": 15,
+}
+
+_ENCODE = bytearray(256)
+for _base, _mask in IUPAC_MASKS.items():
+    _ENCODE[ord(_base)] = _ENCODE[ord(_base.lower())] = _mask
+_ENCODE = bytes(_ENCODE)
+
+_MASK_BASES = [[b for bit, b in ((1, "A"), (2, "C"), (4, "G"), (8, "T")) if m & bit] for m in range(16)]
+
+
+class GeneticCode(NamedTuple):
+    """
+    An expanded NCBI translation table.
+
+    Tables 27, 28 and 31 have context-dependent stops: codons that are read
+    as an amino acid inside a gene but can also end one. NCBI marks them
+    with "*" only in the start line. ``codons`` (and so ``Translator``) reads
+    them as amino acids, while ``stop_codons`` includes them, so
+    ``ORFDetector`` treats them as possible ORF ends. ``context_stops``
+    lists them separately.
+    """
+    id: int
+    name: str
+    codons: Dict[str, str]
+    start_codons: FrozenSet[str]
+    stop_codons: FrozenSet[str]
+    context_stops: FrozenSet[str]
+
+
+@lru_cache(maxsize=None)
+def get_code(table_id: int) -> GeneticCode:
+    """
+    Look up an NCBI translation table by its ID.
+
+    Args:
+        table_id (int): NCBI table number (1-33; 7, 8 and 17-20 do not exist).
+
+    Returns:
+        GeneticCode: Codon table with its start and stop codons.
+    """
+    if table_id not in NCBI_TABLES:
+        raise ValueError(f"Unknown genetic code table {table_id}")
+    name, amino_acids, starts = NCBI_TABLES[table_id]
+    context_stops = frozenset(c for c, aa, s in zip(_CODON_ORDER, amino_acids, starts) if s == "*" != aa)
+    return GeneticCode(
+        table_id,
+        name,
+        dict(zip(_CODON_ORDER, amino_acids)),
+        frozenset(c for c, s in zip(_CODON_ORDER, starts) if s == "M"),
+        frozenset(c for c, aa in zip(_CODON_ORDER, amino_acids) if aa == "*") | context_stops,
+        context_stops,
+    )
+
+
+def encode(seq: str) -> bytes:
+    """Encode a nucleotide string as one IUPAC mask byte per base."""
+    return seq.encode("ascii").translate(_ENCODE)
+
+
+class CompiledCode(NamedTuple):
+    """
+    Byte tables that translate encoded codons without a per-codon Python step.
+
+    ``flat`` holds the amino acid for every codon index
+    ``mask1 << 8 | mask2 << 4 | mask3``. The other three fields are a
+    reduction of it to single bytes: ``pairs`` maps ``mask2 << 4 | mask3``
+    to a pair class, ``rows`` maps ``mask1`` to a row offset, and
+    ``residues`` maps offset + class to the amino acid. They are None when a
+    table does not fit or a residue is not a single ASCII character (never
+    for the NCBI tables), and ``flat`` is used.
+    """
+    flat: Tuple[str, ...]
+    pairs: Optional[bytes]
+    rows: Optional[bytes]
+    residues: Optional[bytes]
+
+
+def compile_genetic_code(code) -> CompiledCode:
+    """
+    Precompile a codon table into lookups indexed by encoded codons.
+
+    Every combination of three masks gets an entry. An ambiguous codon
+    resolves to an amino acid when all the codons it could stand for agree
+    (e.g. GCN -> A); otherwise, and for codons with gaps or invalid
+    characters, it maps to "X". Results are cached by table content, so
+    equal tables share one compiled lookup.
+
+    Args:
+        code (dict or int): Codon (str) to amino acid mapping, or an NCBI table ID.
+
+    Returns:
+        CompiledCode: Lookup tables for ``translate_codes``.
+    """
+    if isinstance(code, int):
+        code = get_code(code).codons
+    return _compile(tuple(sorted((c.upper().replace("U", "T"), aa) for c, aa in code.items())))
+
+
+@lru_cache(maxsize=None)
+def _compile(items) -> CompiledCode:
+    code = dict(items)
+    flat = []
+    for key in product(range(16), repeat=3):
+        residues = {code.get("".join(bases), "X") for bases in product(*(_MASK_BASES[m] for m in key))}
+        flat.append(residues.pop() if len(residues) == 1 else "X")
+
+    # Pairs (mask2, mask3) with the same amino acid for every mask1 share a
+    # class, and so do first masks with the same amino acid for every class.
+    columns = {}
+    pairs = bytes(columns.setdefault(tuple(flat[m1 << 8 | p] for m1 in range(16)), len(columns)) for p in range(256))
+    reps = list(columns)
+    row_ids = {}
+    rows = [row_ids.setdefault(tuple(col[m1] for col in reps), len(row_ids)) for m1 in range(16)]
+    if len(row_ids) * len(reps) > 256 or not all(len(aa) == 1 and aa.isascii() for aa in flat):
+        return CompiledCode(tuple(flat), None, None, None)
+    residues = bytearray(256)
+    for m1, row in enumerate(rows):
+        for k, col in enumerate(reps):
+            residues[row * len(reps) + k] = ord(col[m1])
+    return CompiledCode(tuple(flat), pairs, bytes(r * len(reps) for r in rows) + bytes(240),
+                        bytes(residues))
+
+
+_SHIFT4 = bytes((m << 4) & 0xFF for m in range(256))
+
+
+def translate_codes(compiled: CompiledCode, codes: bytes, frame: int = 0) -> str:
+    """
+    Translate one frame of an encoded sequence (see ``encode``).
+
+    The three codon positions are strided slices. Masks are below 16, so
+    OR-ing the second (shifted) and third positions as little-endian
+    integers packs each pair into one byte; adding the first position's row
+    offset the same way yields one table index per codon, which a single
+    ``bytes.translate`` turns into amino acids.
+    """
+    end = frame + (len(codes) - frame) // 3 * 3
+    n = (end - frame) // 3
+    if n <= 0:
+        return ""
+    first = codes[frame:end:3]
+    pairs = (int.from_bytes(codes[frame + 1:end:3].translate(_SHIFT4), "little")
+             | int.from_bytes(codes[frame + 2:end:3], "little")).to_bytes(n, "little")
+    if compiled.residues is not None:
+        index = (int.from_bytes(first.translate(compiled.rows), "little")
+                 + int.from_bytes(pairs.translate(compiled.pairs), "little"))
+        return index.to_bytes(n, "little").translate(compiled.residues).decode("ascii")
+    # Fallback: one UTF-16 code unit per codon index, mapped through ``flat``
+    # (a sequence, so residues may be longer than one character).
+    units = bytearray(2 * n)
+    units[0::2] = pairs
+    units[1::2] = first
+    return units.decode("utf-16-le").translate(compiled.flat)
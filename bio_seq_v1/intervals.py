@@ -0,0 +1,168 @@
+"""
+Interval overlap queries for ORFs and other features.
+
+Intervals are any objects with ``start`` and ``end`` attributes, both
+inclusive (the ``ORF`` convention). ``overlapping_pairs`` finds all
+overlapping pairs with a sort-and-sweep, and ``IntervalIndex`` answers
+region and nearest-feature queries. Both keep features from different
+groups (e.g. sequences or strands) apart.
+"""
+
+from bisect import bisect_left, bisect_right
+from heapq import heappop, heappush
+from itertools import accumulate
+from operator import attrgetter, itemgetter
+from typing import Callable, Dict, Hashable, Iterable, Iterator, List, Optional, Tuple
+
+_start = attrgetter("start")
+_end = attrgetter("end")
+
+
+def group_intervals(items: Iterable, group: Optional[Callable] = None) -> Dict[Hashable, List]:
+    """Split intervals by ``group(item)`` (everything in one group when None)."""
+    groups = {}
+    for item in items:
+        groups.setdefault(group(item) if group else None, []).append(item)
+    return groups
+
+
+def sweep_pairs(starts, ends, order: Iterable[int]) -> Iterator[Tuple[int, int]]:
+    """
+    Yield index pairs of overlapping intervals stored as parallel sequences.
+
+    Args:
+        starts, ends: Inclusive coordinates, indexed by interval number.
+        order (iterable of int): Interval numbers sorted by start.
+
+    Yields:
+        tuple: ``(i, j)`` with ``starts[i] <= starts[j]``.
+    """
+    active = []
+    for rank, j in enumerate(order):
+        start = starts[j]
+        while active and active[0][0] < start:
+            heappop(active)
+        for _, _, i in sorted(active, key=itemgetter(1)):
+            yield i, j
+        heappush(active, (ends[j], rank, j))
+
+
+def overlapping_pairs(items: Iterable, group: Optional[Callable] = None) -> Iterator[Tuple]:
+    """
+    Yield every pair of overlapping intervals from the same group.
+
+    Each group is sorted by start and swept once, keeping only the
+    intervals that are still open in a heap keyed by end, so the cost is
+    O(n log n + pairs) rather than O(n**2).
+
+    Args:
+        items (iterable): Objects with inclusive ``start``/``end``.
+        group (callable, optional): Key separating independent coordinate
+            spaces, e.g. ``lambda o: (o.seq_id, o.strand)``.
+
+    Yields:
+        tuple: ``(earlier, later)`` pairs ordered by start.
+    """
+    for members in group_intervals(items, group).values():
+        members.sort(key=_start)
+        starts = [m.start for m in members]
+        ends = [m.end for m in members]
+        for i, j in sweep_pairs(starts, ends, range(len(members))):
+            yield members[i], members[j]
+
+
+class SortedIntervals:
+    """
+    Overlap queries over parallel start/end sequences already sorted by start.
+
+    A running maximum of the ends lets a query stop scanning left once no
+    earlier interval can still reach the region.
+    """
+
+    __slots__ = ("starts", "ends", "max_ends")
+
+    def __init__(self, starts, ends):
+        self.starts = starts
+        self.ends = ends
+        self.max_ends = list(accumulate(ends, max))
+
+    def overlapping(self, start: int, end: int) -> List[int]:
+        """Positions (in start order) of intervals overlapping ``[start, end]``."""
+        if end < start:
+            return []
+        hits = []
+        i = bisect_right(self.starts, end) - 1
+        while i >= 0 and self.max_ends[i] >= start:
+            if self.ends[i] >= start:
+                hits.append(i)
+            i -= 1
+        hits.reverse()
+        return hits
+
+
+class _Group:
+    __slots__ = ("items", "sorted", "by_end", "ends")
+
+    def __init__(self, items):
+        self.items = sorted(items, key=_start)
+        self.sorted = SortedIntervals([i.start for i in self.items], [i.end for i in self.items])
+        self.by_end = sorted(items, key=_end)
+        self.ends = [i.end for i in self.by_end]
+
+
+class IntervalIndex:
+    """
+    Static index for overlap and nearest-feature queries.
+
+    Each group is held as ``SortedIntervals``, so a region query is a
+    binary search followed by a scan over candidates that can still reach
+    the region.
+
+    Attributes:
+        group (callable, optional): Key used to partition the features;
+            queries name the partition with their ``group`` argument.
+    """
+
+    def __init__(self, items: Iterable, group: Optional[Callable] = None):
+        self.group = group
+        self._groups = {key: _Group(members) for key, members in group_intervals(items, group).items()}
+
+    def __len__(self):
+        return sum(len(g.items) for g in self._groups.values())
+
+    def overlaps(self, start: int, end: int, group: Hashable = None) -> List:
+        """
+        Return the features overlapping ``[start, end]`` (inclusive), ordered by start.
+
+        Args:
+            start (int): Region start.
+            end (int): Region end.
+            group: Partition to search (ignored when the index is ungrouped).
+        """
+        g = self._groups.get(group if self.group else None)
+        if g is None:
+            return []
+        return [g.items[i] for i in g.sorted.overlapping(start, end)]
+
+    def nearest(self, position: int, group: Hashable = None):
+        """
+        Return the feature closest to ``position``; one covering it wins.
+
+        Ties between an upstream and a downstream feature go upstream.
+
+        Returns:
+            The nearest feature, or None when the group is empty.
+        """
+        covering = self.overlaps(position, position, group)
+        if covering:
+            return covering[0]
+        g = self._groups.get(group if self.group else None)
+        if g is None:
+            return None
+        i = bisect_left(g.ends, position) - 1
+        before = g.by_end[i] if i >= 0 else None
+        j = bisect_right(g.sorted.starts, position)
+        after = g.items[j] if j < len(g.items) else None
+        if before is None or (after is not None and after.start - position < position - before.end):
+            return after
+        return before
@@ -0,0 +1,299 @@
+"""
+K-mer counting with 2-bit codes.
+
+Each k-mer is encoded as an integer of ``2 * k`` bits. Bases outside ACGT
+(U is read as T) break the k-mer and are skipped. For k <= 32 the codes of
+a whole run of ACGT are built at once: every base offset of the k-mer is
+a shifted ``bytes.translate`` of the run, the offsets are OR-ed together
+as big integers, one byte of the code at a time, and the bytes are
+reinterpreted as an ``array`` of codes. Canonical codes take the minimum
+of both strands lane by lane with the same big-integer arithmetic. The
+per-base work is therefore done in C, k times over; longer k-mers fall
+back to a rolling Python loop.
+
+Building the codes costs roughly 0.05-0.15 s per Mb (0.1-0.65 s canonical).
+Tallying them still visits every k-mer once, either in ``Counter.update``
+or in the loop over the dense table, at about 0.2-0.5 s per Mb, which is
+the throughput limit of this module without NumPy.
+
+Counts are kept in a dense ``array`` indexed by the code for k <= 12 (at
+most 4**12 slots) and in a ``Counter`` above that. The dense table also
+records which codes were seen, so listing the observed k-mers costs
+nothing for the slots left at zero.
+"""
+
+from array import array
+from bio_seq_v1.fasta import FASTAParser
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from itertools import count, repeat
+from typing import Iterable, Iterator, List, Optional, Tuple
+import re
+import sys
+
+DENSE_MAX_K = 12
+
+# Bases per block of codes built at once, which bounds the temporary arrays.
+KMER_BLOCK = 1 << 20
+
+_CODES = bytearray(b"\x04" * 256)
+for _i, _bases in enumerate((b"Aa", b"Cc", b"Gg", b"TtUu")):
+    for _b in _bases:
+        _CODES[_b] = _i
+_CODES = bytes(_CODES)
+_COMPLEMENT = bytes(3 - c if c < 4 else c for c in range(256))
+_SHIFTS = [bytes((c << t) & 0xFF for c in range(256)) for t in range(8)]
+_WIDTHS = ((1, "B"), (2, "H"), (4, "I"), (8, "Q"))
+
+
+def _run_pattern(k):
+    return re.compile(b"[\x00-\x03]{%d,}" % k)
+
+
+def _rolling_codes(run: bytes, k: int) -> List[int]:
+    mask = (1 << 2 * k) - 1
+    code = 0
+    for c in run[:k - 1]:
+        code = (code << 2) | c
+    codes = []
+    for c in run[k - 1:]:
+        code = ((code << 2) | c) & mask
+        codes.append(code)
+    return codes
+
+
+def _packed_codes(run: bytes, k: int, width: int, byteorder: str = "little") -> bytearray:
+    """Codes of every k-mer of ``run`` as lanes of ``width`` bytes."""
+    m = len(run) - k + 1
+    groups = [0] * width
+    for j in range(k):
+        shift = 2 * (k - 1 - j)
+        groups[shift >> 3] |= int.from_bytes(run[j:j + m].translate(_SHIFTS[shift & 7]), "little")
+    packed = bytearray(width * m)
+    for g, value in enumerate(groups):
+        offset = g if byteorder == "little" else width - 1 - g
+        packed[offset::width] = value.to_bytes(m, "little")
+    return packed
+
+
+def _lane_min(forward: bytes, reverse: bytes, width: int) -> bytes:
+    """Lane-wise minimum of two packed code buffers whose lanes keep the top bit clear."""
+    bits = 8 * width
+    low = int.from_bytes((b"\x01" + bytes(width - 1)) * (len(forward) // width), "little")
+    high = low << (bits - 1)
+    x = int.from_bytes(forward, "little")
+    y = int.from_bytes(reverse, "little")
+    # Setting the spare top bit makes each lane subtract without borrowing from
+    # its neighbour; the bit survives exactly where x >= y, and is then widened
+    # into a mask over the whole lane.
+    ge = ((x | high) - y) & high
+    take_y = (ge << 1) - (ge >> (bits - 1))
+    return (x ^ ((x ^ y) & take_y)).to_bytes(len(forward), "little")
+
+
+def _to_array(typecode: str, packed) -> array:
+    codes = array(typecode)
+    codes.frombytes(packed)
+    if sys.byteorder != "little":
+        codes.byteswap()
+    return codes
+
+
+def _block_codes(run: bytes, k: int, canonical: bool = False):
+    """Codes of every k-mer of ``run`` (2-bit values, no breaks), in order."""
+    if k > 32:
+        codes = _rolling_codes(run, k)
+        if canonical:
+            rev = _rolling_codes(run[::-1].translate(_COMPLEMENT), k)
+            codes = list(map(min, codes, reversed(rev)))
+        return codes
+    width, typecode = next(w for w in _WIDTHS if 4 * w[0] >= k)
+    if not canonical:
+        return _to_array(typecode, _packed_codes(run, k, width))
+    # The lane minimum needs a spare top bit per lane, so k = 4, 8, 16 and 32
+    # are compared in lanes twice as wide and narrowed afterwards. Reversing
+    # big-endian lanes byte by byte puts them in order as little-endian lanes.
+    lane = width if 4 * width > k else 2 * width
+    rev = _packed_codes(run[::-1].translate(_COMPLEMENT), k, lane, "big")
+    packed = _lane_min(_packed_codes(run, k, lane), rev[::-1], lane)
+    if lane != width:
+        narrow = bytearray(len(packed) // 2)
+        for g in range(width):
+            narrow[g::width] = packed[g::lane]
+        packed = narrow
+    return _to_array(typecode, packed)
+
+
+def iter_code_blocks(seq, k: int, canonical: bool = False) -> Iterator[Tuple[int, Iterable[int]]]:
+    """
+    Yield ``(position, codes)`` for blocks of consecutive k-mers of ``seq``.
+
+    ``codes[i]`` is the code of the k-mer starting at ``position + i``; only
+    k-mers made entirely of ACGT are included, so blocks never span a break.
+
+    Args:
+        seq (sequence or str): Sequence to scan.
+        k (int): K-mer length.
+        canonical (bool): Use the smaller of the forward and
+            reverse-complement codes.
+    """
+    text = seq if isinstance(seq, str) else seq.sequence
+    encoded = text.encode("ascii").translate(_CODES)
+    for match in _run_pattern(k).finditer(encoded):
+        start, stop = match.span()
+        for a in range(start, stop - k + 1, KMER_BLOCK):
+            yield a, _block_codes(encoded[a:min(a + KMER_BLOCK + k - 1, stop)], k, canonical)
+
+
+def iter_kmer_codes(seq, k: int, canonical: bool = False) -> Iterator[Tuple[int, int]]:
+    """
+    Yield ``(position, code)`` for every k-mer of ``seq`` made only of ACGT.
+
+    Args:
+        seq (sequence or str): Sequence to scan.
+        k (int): K-mer length.
+        canonical (bool): Yield the smaller of the forward and
+            reverse-complement codes.
+    """
+    for start, codes in iter_code_blocks(seq, k, canonical):
+        yield from zip(count(start), codes)
+
+
+class KmerCounter:
+    """
+    Counts k-mers over one or more sequences.
+
+    Attributes:
+        k (int): K-mer length.
+        canonical (bool): Merge each k-mer with its reverse complement,
+            counting it under the smaller of the two codes.
+    """
+
+    def __init__(self, k: int, canonical: bool = False):
+        if k <= 0:
+            raise ValueError("k must be positive")
+        self.k = k
+        self.canonical = canonical
+        self.dense = k <= DENSE_MAX_K
+        self.counts = array("I", [0]) * 4 ** k if self.dense else Counter()
+        self._seen = array("I")
+
+    def iter_codes(self, seq) -> Iterator[Tuple[int, int]]:
+        """
+        Yield ``(position, code)`` for every k-mer of ``seq`` made only of ACGT.
+
+        Args:
+            seq (sequence or str): Sequence to scan.
+        """
+        return iter_kmer_codes(seq, self.k, self.canonical)
+
+    def add(self, seq):
+        """Count all k-mers of ``seq`` (a ``sequence`` or string)."""
+        counts = self.counts
+        for _, codes in iter_code_blocks(seq, self.k, self.canonical):
+            if not self.dense:
+                counts.update(codes)
+                continue
+            seen = self._seen.append
+            for code in codes:
+                if not counts[code]:
+                    seen(code)
+                counts[code] += 1
+        return self
+
+    def add_all(self, sequences: Iterable):
+        """Count every sequence of an iterable (e.g. a FASTA record stream)."""
+        for seq in sequences:
+            self.add(seq)
+        return self
+
+    def merge(self, other: "KmerCounter"):
+        """Add the counts of another counter with the same ``k``/``canonical``."""
+        if (other.k, other.canonical) != (self.k, self.canonical):
+            raise ValueError("Cannot merge counters with different k or canonical mode")
+        if self.dense:
+            counts, seen = self.counts, self._seen.append
+            for code, n in other.nonzero():
+                if not counts[code]:
+                    seen(code)
+                counts[code] += n
+        else:
+            get = self.counts.get
+            for code, n in other.nonzero():
+                self.counts[code] = get(code, 0) + n
+        return self
+
+    def nonzero(self) -> Iterator[Tuple[int, int]]:
+        """Yield ``(code, count)`` for every k-mer seen at least once, in code order."""
+        if self.dense:
+            counts = self.counts
+            return ((code, counts[code]) for code in sorted(self._seen))
+        return iter(self.counts.items())
+
+    def decode(self, code: int) -> str:
+        """Turn a k-mer code back into its string."""
+        return "".join("ACGT"[(code >> 2 * (self.k - 1 - i)) & 3] for i in range(self.k))
+
+    def encode(self, kmer: str) -> int:
+        """Code of ``kmer`` (canonicalised if the counter is canonical)."""
+        if len(kmer) != self.k:
+            raise ValueError(f"K-mer must have length {self.k}")
+        codes = list(self.iter_codes(kmer))
+        if not codes:
+            raise ValueError(f"K-mer '{kmer}' contains bases outside ACGT")
+        return codes[0][1]
+
+    def __getitem__(self, kmer: str) -> int:
+        code = self.encode(kmer)
+        return self.counts[code] if self.dense else self.counts.get(code, 0)
+
+    def items(self) -> Iterator[Tuple[str, int]]:
+        """Yield ``(kmer, count)`` pairs for all observed k-mers."""
+        return ((self.decode(code), n) for code, n in self.nonzero())
+
+    def most_common(self, n: Optional[int] = None) -> List[Tuple[str, int]]:
+        """Return the ``n`` most frequent k-mers, highest count first."""
+        ranked = sorted(self.nonzero(), key=lambda item: (-item[1], item[0]))
+        if n is not None:
+            ranked = ranked[:n]
+        return [(self.decode(code), count) for code, count in ranked]
+
+    def to_sparse(self):
+        """Drop the dense table in favour of a dict of non-zero counts (cheap to pickle)."""
+        sparse = KmerCounter.__new__(KmerCounter)
+        sparse.k, sparse.canonical, sparse.dense = self.k, self.canonical, False
+        sparse._seen = array("I")
+        sparse.counts = Counter(dict(self.nonzero()))
+        return sparse
+
+
+def _count_file(path, k, canonical, threads):
+    counter = KmerCounter(k, canonical)
+    counter.add_all(FASTAParser(path, threads=threads).iter_records())
+    return counter.to_sparse()
+
+
+def count_files(paths: Iterable[str], k: int, canonical: bool = False,
+                processes: Optional[int] = None, threads: Optional[int] = None) -> KmerCounter:
+    """
+    Count k-mers over several FASTA files, one file per worker process.
+
+    Each worker streams its file and returns sparse counts, which are
+    merged into a single counter in the parent.
+
+    Args:
+        paths (iterable of str): FASTA files (compressed input is fine).
+        k (int): K-mer length.
+        canonical (bool): Merge strands.
+        processes (int, optional): Pool size; defaults to the CPU count.
+        threads (int, optional): BGZF decompression threads per worker.
+
+    Returns:
+        KmerCounter: Combined counts.
+    """
+    paths = [str(p) for p in paths]
+    total = KmerCounter(k, canonical)
+    with ProcessPoolExecutor(max_workers=processes) as pool:
+        for counter in pool.map(_count_file, paths, repeat(k), repeat(canonical), repeat(threads)):
+            total.merge(counter)
+    return total
@@ -1,4 +1,6 @@
 from bio_seq_v1.stats import sequence
+from bio_seq_v1.kmers import KmerCounter
+from bio_seq_v1.views import ReverseComplementView
 from typing import List
 class Match():
     def __init__(self, seq_id, position, matched_seq, strand_attributes):
@@ -34,6 +36,12 @@ class MotifFinder():
         'V': {'A', 'C', 'G'},
         'N': {'A', 'C', 'G', 'T'}
     }
+    # Reverse-strand bases scanned per block in search_both_strands.
+    REVERSE_BLOCK = 1 << 16
+    # Bases matched per bitmap in _scan.
+    SCAN_BLOCK = 1 << 20
+    _class_tables = {}
+
     def __init__(self, k: int):
         if k <= 0:
             raise ValueError("Motif length must be positive")
@@ -58,10 +66,23 @@ class MotifFinder():
 
     def kmer_generation(self, seq: str):
         k = self.k
-        kmers = []
         for base in range(len(seq) - k + 1):
-            kmers.append((seq[base:base+k], base))
-        return kmers
+            yield seq[base:base+k], base
+
+    def count_kmers(self, sequences, canonical: bool = False):
+        """
+        Count the k-mers of one sequence or an iterable of sequences.
+
+        Uses the rolling 2-bit engine in ``bio_seq_v1.kmers`` rather than
+        the substrings of ``kmer_generation``.
+
+        Returns:
+            KmerCounter: Counts for this finder's ``k``.
+        """
+        counter = KmerCounter(self.k, canonical)
+        if isinstance(sequences, (str, sequence)):
+            return counter.add(sequences)
+        return counter.add_all(sequences)
 
     def search_single(self, seq_obj: sequence, motif: str, max_mismatches: int):
         if len(motif) != self.k:
@@ -73,14 +94,74 @@ class MotifFinder():
         motif = motif.upper()
         self._validate_seq_string(seq)
 
-        matches = []
-        for kmer, pos in self.kmer_generation(seq):
-            if self.mismatches(motif, kmer) <= max_mismatches:
-                matches.append(
-                    Match(seq_obj.id, pos, kmer, None)
-                )
-        return matches
-    
+        return [
+            Match(seq_obj.id, pos, kmer, None)
+            for kmer, pos in self._scan(seq, motif, max_mismatches)
+        ]
+
+    def class_table(self, motif_char: str) -> bytes:
+        """
+        ``bytes.translate`` table turning a sequence into ``b"1"`` where the
+        base satisfies ``motif_char`` and ``b"0"`` elsewhere.
+        """
+        table = self._class_tables.get(motif_char)
+        if table is None:
+            table = bytearray(b"0" * 256)
+            for base in self.IUPAC[motif_char]:
+                table[ord(base)] = ord("1")
+            table = self._class_tables[motif_char] = bytes(table)
+        return table
+
+    def _match_bits(self, block: bytes, motif: str, max_mismatches: int) -> int:
+        """
+        Bitmap of window starts in ``block`` within ``max_mismatches`` of ``motif``.
+
+        Bit-parallel Shift-And run across the text: each motif character
+        becomes one integer with bit ``j`` set when ``block[j]`` matches it,
+        and shifting it right by the motif position lines all of them up on
+        the window start. Exact matches are the AND of the shifted masks;
+        with mismatches allowed, a bit-sliced counter records the windows
+        with at least ``t`` mismatches for each ``t`` up to
+        ``max_mismatches + 1``.
+        """
+        k = len(motif)
+        windows = len(block) - k + 1
+        if windows <= 0:
+            return 0
+        valid = (1 << windows) - 1
+        masks = {m: int(block.translate(self.class_table(m))[::-1], 2) for m in set(motif)}
+        if max_mismatches <= 0:
+            hits = valid
+            for i, m in enumerate(motif):
+                hits &= masks[m] >> i
+                if not hits:
+                    break
+            return hits
+
+        levels = min(max_mismatches, k)
+        at_least = [valid] + [0] * (levels + 1)
+        for i, m in enumerate(motif):
+            miss = ~(masks[m] >> i) & valid
+            for t in range(min(i + 1, levels + 1), 0, -1):
+                at_least[t] |= at_least[t - 1] & miss
+        return valid & ~at_least[levels + 1]
+
+    def _scan(self, seq: str, motif: str, max_mismatches: int):
+        """Yield ``(kmer, pos)`` for every window within ``max_mismatches`` of ``motif``."""
+        k = len(motif)
+        raw = seq.encode("ascii")
+        # Overlapping blocks keep the bitmaps a fixed size on long sequences.
+        for block_start in range(0, max(len(raw) - k + 1, 0), self.SCAN_BLOCK):
+            hits = self._match_bits(raw[block_start:block_start + self.SCAN_BLOCK + k - 1], motif, max_mismatches)
+            if not hits:
+                continue
+            bits = format(hits, "b")[::-1]
+            i = bits.find("1")
+            while i != -1:
+                pos = block_start + i
+                yield seq[pos:pos + k], pos
+                i = bits.find("1", i + 1)
+
     def search_fasta(self, fasta_sequences: List[sequence], motif: str, mismatches: int):
         all_matches = []
         for seq_obj in fasta_sequences:
@@ -96,15 +177,21 @@ class MotifFinder():
             matches.append(match)
 
 
-        rev_seq = seq_obj.rev_complement()
-        rev_obj = sequence(seq_obj.id, rev_seq)
-        seq_len = len(seq_obj.sequence)
-        for match in self.search_single(rev_obj, motif, mismatches):
-            original_pos = seq_len - match.position - self.k
-            matches.append(
-                Match(seq_id = seq_obj.id,
-                      position= original_pos,
-                      matched_seq= match.matched_seq,
-                      strand_attributes="-")
-            )
+        # Scan the reverse strand through a lazy view in overlapping blocks
+        # instead of materialising the whole reverse complement.
+        rev = ReverseComplementView(seq_obj)
+        seq_len = len(rev)
+        motif = motif.upper()
+        for block_start in range(0, seq_len, self.REVERSE_BLOCK):
+            block = rev[block_start:block_start + self.REVERSE_BLOCK + self.k - 1]
+            if len(block) < self.k:
+                break
+            for kmer, pos in self._scan(block, motif, mismatches):
+                original_pos = seq_len - (block_start + pos) - self.k
+                matches.append(
+                    Match(seq_id = seq_obj.id,
+                          position= original_pos,
+                          matched_seq= kmer,
+                          strand_attributes="-")
+                )
         return matches
\ No newline at end of file
@@ -1,6 +1,18 @@
+from array import array
+from bio_seq_v1.genetic_codes import encode
+from bio_seq_v1.intervals import IntervalIndex, SortedIntervals, overlapping_pairs, sweep_pairs
+from bio_seq_v1.stats import sequence
 from bio_seq_v1.translator import Translator
+from bisect import bisect_left
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import compress, groupby, repeat
+from operator import and_, attrgetter, eq, ge, le
+from typing import Callable, Iterable, Iterator, Optional, Tuple
 
 class ORF():
+    __slots__ = ("seq_id", "start", "end", "frame", "strand", "protein", "length")
+
     def __init__(self, seq_id, start, end, frame, strand, protein):
         if start < 0 or end < start:
             raise ValueError("Invalid ORF coordinates")
@@ -41,67 +53,464 @@ class ORF():
 class ORFDetector():
     START_CODONS = {"ATG"}
     STOP_CODONS = {"TAA", "TAG", "TGA"}
+    MODES = ("all", "longest")
 
-    def __init__(self, min_length = 0):
+    def __init__(self, min_length = 0, table = None, mode = "all", start_codons = None):
+        """
+        Args:
+            min_length (int): Minimum ORF length in nucleotides (stop codon excluded).
+            table (int, optional): NCBI translation table ID; also supplies
+                the stop codons. Context-dependent stops (tables 27, 28 and
+                31) end ORFs here although ``Translator`` reads them as
+                amino acids; see ``GeneticCode``.
+            mode (str): "all" reports an ORF for every start codon; "longest"
+                keeps only the most upstream start before each stop.
+            start_codons (set, optional): Initiation codons, e.g.
+                {"ATG", "GTG", "TTG"}; defaults to ``START_CODONS``.
+        """
         if min_length < 0:
             raise ValueError("min_length must be non-negative")
-        self.translator = Translator()
+        if mode not in self.MODES:
+            raise ValueError(f"mode must be one of {', '.join(self.MODES)}")
+        self.translator = Translator(table=table)
         self.min_length = min_length
+        self.mode = mode
+        self.start_codons = set(self.START_CODONS if start_codons is None else start_codons)
+        self.stop_codons = set(self.STOP_CODONS if table is None else self.translator.stop_codons)
 
     def find_orfs(self, seq):
-        orfs = []
-        frames = self.translator.translate_six_frames(seq)
-        seq_id = seq.id
-        seq_len = len(seq.sequence)
-        for frame_label, protein in frames.items():
-            strand = frame_label[0]
-            frame = int(frame_label[1]) - 1
-            aa_index = 0
-            while aa_index < len(protein):
-                if protein[aa_index] == "M":
-                    start_aa = aa_index
-                    scan = aa_index + 1
-
-                    while scan < len(protein) and protein[scan] != "*":
-                        scan += 1
-
-                    if scan < len(protein):  
-                        end_aa = scan - 1
-                        dna_start = frame + start_aa * 3
-                        dna_end = frame + end_aa * 3 + 2
-                        prot_seq = protein[start_aa:scan]
-                        
-                        if strand == "-":
-                            rc_start = dna_start
-                            rc_end = dna_end
-                            dna_start = seq_len - rc_end - 1
-                            dna_end = seq_len - rc_start - 1
-
-
-                        if len(prot_seq) * 3 >= self.min_length:
-                            orfs.append(
-                                ORF(seq_id, dna_start, dna_end, frame, strand, prot_seq)
-                            )
-
-                aa_index += 1
+        """
+        Find ORFs on both strands.
+
+        Start and stop codons are located directly in the nucleotide
+        sequence and only ORFs that pass ``min_length`` are translated. The
+        initiating codon is always rendered as "M". Codons containing
+        ambiguity codes are never treated as starts or stops.
+
+        Args:
+            seq (str or sequence): Nucleotide sequence.
 
+        Returns:
+            list of ORF: In strand, frame, stop, start order.
+        """
+        seq = self.translator._coerce_to_sequence(seq)
+        seq_id = seq.id
+        seq_len = seq.sequence_length()
+        orfs = []
+        for strand, text in (("+", seq.sequence), ("-", seq.rev_complement())):
+            codes = encode(text)
+            starts = _codon_positions(text, self.start_codons)
+            stops = _codon_positions(text, self.stop_codons)
+            for frame in range(3):
+                for dna_start, stop in self._pair_starts(starts[frame], stops[frame]):
+                    protein = "M" + self.translator.translate_encoded(codes[dna_start + 3:stop], 0)
+                    dna_end = stop - 1
+                    if strand == "-":
+                        dna_start, dna_end = seq_len - dna_end - 1, seq_len - dna_start - 1
+                    orfs.append(ORF(seq_id, dna_start, dna_end, frame, strand, protein))
         return orfs
-        
-    def overlapping_orfs(self, orfs: list):
-        if not isinstance(orfs, list):
-            raise TypeError("ORFs must be a list of ORF objects")
-        
-        overlap = []
-        for i in range(len(orfs)):
-            if not isinstance(orfs[i], ORF):
-                raise TypeError("List must contain only ORF objects")
-            orf1 = orfs[i]
-            for j in range(i+1, len(orfs)):
-                if not isinstance(orfs[j], ORF):
-                    raise TypeError("List must contain only ORF objects")
-                orf2 = orfs[j]
-                if orf1.strand != orf2.strand:
-                    continue
-                if orf1.start <= orf2.end and orf2.start <= orf1.end:
-                    overlap.append((orf1, orf2))
-        return overlap
\ No newline at end of file
+
+    def _pair_starts(self, starts, stops):
+        """
+        Yield ``(start, stop)`` nucleotide positions of ORFs in one frame.
+
+        Both lists are sorted positions of the same frame, so one merge pass
+        pairs every stop with the starts since the previous stop. Starts too
+        close to their stop for ``min_length`` are skipped without building
+        anything.
+        """
+        # Nucleotides needed for min_length, rounded up to whole codons.
+        need = max(-(-self.min_length // 3), 1) * 3
+        longest = self.mode == "longest"
+        i, n = 0, len(starts)
+        for stop in stops:
+            first = True
+            while i < n and starts[i] < stop:
+                start = starts[i]
+                i += 1
+                if stop - start >= need and (first or not longest):
+                    first = False
+                    yield start, stop
+
+    def overlapping_orfs(self, orfs):
+        """
+        Find pairs of ORFs on the same sequence and strand that overlap.
+
+        Input is validated up front; the pairs themselves are produced
+        lazily by a sort-and-sweep per sequence and strand.
+
+        Args:
+            orfs (iterable of ORF): ORFs to compare.
+
+        Returns:
+            iterator of tuple: ``(orf1, orf2)`` pairs, ``orf1`` starting first.
+        """
+        orfs = list(orfs)
+        if not all(isinstance(orf, ORF) for orf in orfs):
+            raise TypeError("List must contain only ORF objects")
+        return overlapping_pairs(orfs, group=attrgetter("seq_id", "strand"))
+
+    @staticmethod
+    def index(orfs):
+        """Build an ``IntervalIndex`` over ORFs, queried by ``(seq_id, strand)`` group."""
+        return IntervalIndex(orfs, group=attrgetter("seq_id", "strand"))
+
+def _codon_positions(text, codons):
+    """Sorted positions of any of ``codons`` in ``text``, split by frame (position % 3)."""
+    frames = ([], [], [])
+    for codon in codons:
+        i = text.find(codon)
+        while i != -1:
+            frames[i % 3].append(i)
+            i = text.find(codon, i + 1)
+    if len(codons) > 1:
+        for positions in frames:
+            positions.sort()
+    return frames
+
+
+def _resolve(strand, starts, left, right, need, longest):
+    """
+    Pair the starts lying between two consecutive in-frame stops.
+
+    Positions are forward-strand codon starts. A "+" start reads towards
+    ``right``; a "-" start reads towards ``left``. A missing stop (None)
+    means the ORF runs off the sequence and is not reported.
+    """
+    if strand == "+":
+        if right is None:
+            return []
+        hits = [(s, right) for s in starts if right - s >= need]
+        return hits[:1] if longest else hits
+    if left is None:
+        return []
+    hits = [(s, left) for s in starts if s - left >= need]
+    return hits[-1:] if longest else hits
+
+
+def _orf_protein(translator, text, strand, start, stop):
+    if strand == "+":
+        body = text[start + 3:stop]
+    else:
+        body = text[stop + 3:start].translate(sequence.revcomp_table)[::-1]
+    return "M" + translator.translate_encoded(encode(body), 0)
+
+
+def _scan_chunk(text, offset, core, codons, need, longest, translator):
+    """
+    Find ORFs whose codons all start inside one chunk of a chromosome.
+
+    Returns the ORFs resolved inside the chunk as
+    ``(strand, start codon, stop codon, protein)`` tuples, plus the boundary
+    state per strand and frame: ``(head starts, first stop, last stop, tail
+    starts)``. Positions are chromosome coordinates; ``offset`` is a
+    multiple of 3 so frames agree with the chromosome.
+    """
+    resolved = []
+    boundary = {}
+    for strand, (start_codons, stop_codons) in codons.items():
+        starts = _codon_positions(text, start_codons)
+        stops = _codon_positions(text, stop_codons)
+        for frame in range(3):
+            frame_starts = [offset + p for p in starts[frame] if p < core]
+            frame_stops = [offset + p for p in stops[frame] if p < core]
+            if not frame_stops:
+                boundary[strand, frame] = (frame_starts, None, None, [])
+                continue
+            # Segment k holds the starts between stop k-1 and stop k; stops
+            # outnumber starts, so only non-empty segments are visited.
+            segments = {}
+            for s in frame_starts:
+                segments.setdefault(bisect_left(frame_stops, s), []).append(s)
+            last = len(frame_stops)
+            for k, members in segments.items():
+                if 0 < k < last:
+                    for s, stop in _resolve(strand, members, frame_stops[k - 1], frame_stops[k], need, longest):
+                        protein = _orf_protein(translator, text, strand, s - offset, stop - offset) if translator else None
+                        resolved.append((strand, s, stop, protein))
+            boundary[strand, frame] = (segments.get(0, []), frame_stops[0], frame_stops[-1], segments.get(last, []))
+    return resolved, boundary
+
+
+class _Stitcher:
+    """Joins the boundary state of consecutive chunks of one record."""
+
+    def __init__(self, record, need, longest, translator):
+        self.record = record
+        self.need = need
+        self.longest = longest
+        self.translator = translator
+        self.length = record.sequence_length()
+        # Last stop seen and starts waiting for the next stop, per (strand, frame).
+        self.left = {}
+        self.open = {}
+
+    def _orf(self, strand, start, stop, protein=None):
+        if self.translator and protein is None:
+            protein = _orf_protein(self.translator, self.record.sequence, strand, start, stop)
+        if strand == "+":
+            return ORF(self.record.id, start, stop - 1, start % 3, "+", protein)
+        return ORF(self.record.id, stop + 3, start + 2, (self.length - 3 - start) % 3, "-", protein)
+
+    def feed(self, result):
+        resolved, boundary = result
+        for key, (head, first, last, tail) in boundary.items():
+            strand = key[0]
+            waiting = self.open.get(key, [])
+            if first is None:
+                self.open[key] = waiting + head
+                continue
+            for start, stop in _resolve(strand, waiting + head, self.left.get(key), first, self.need, self.longest):
+                yield self._orf(strand, start, stop)
+            self.left[key] = last
+            self.open[key] = tail
+        for strand, start, stop, protein in resolved:
+            yield self._orf(strand, start, stop, protein)
+
+    def finish(self):
+        # Reverse-strand starts after the last stop read back to it.
+        for key, waiting in self.open.items():
+            for start, stop in _resolve(key[0], waiting, self.left.get(key), None, self.need, self.longest):
+                yield self._orf(key[0], start, stop)
+
+
+def call_orfs(records: Iterable, detector: Optional[ORFDetector] = None, processes: int = 1,
+              chunk_size: int = 1 << 20, proteins: bool = False) -> Iterator[ORF]:
+    """
+    Stream ORFs for whole genomes, splitting long records across processes.
+
+    Each record is cut into chunks of ``chunk_size`` bases. Workers find the
+    start and stop codons of their chunk and resolve every ORF that lies
+    between two of the chunk's own stops. The parent stitches the rest
+    together from the starts before the first stop and after the last stop
+    of each frame, so ORFs crossing chunk boundaries (however long) are
+    reported exactly once, in chromosome coordinates. Results match
+    ``detector.find_orfs`` per record, though not necessarily in the same
+    order. At most ``2 * processes`` chunks are in flight.
+
+    Args:
+        records (iterable of sequence): Records to scan (e.g. a FASTA stream).
+        detector (ORFDetector, optional): Settings (min_length, mode, codons, table).
+        processes (int): Worker processes; 1 scans in this process.
+        chunk_size (int): Bases per chunk (rounded down to a multiple of 3).
+        proteins (bool): Translate each ORF; otherwise ``protein`` is None.
+
+    Returns:
+        iterator of ORF
+    """
+    detector = detector or ORFDetector()
+    chunk_size = max(chunk_size - chunk_size % 3, 3)
+    need = max(-(-detector.min_length // 3), 1) * 3
+    longest = detector.mode == "longest"
+    translator = detector.translator if proteins else None
+    revcomp = lambda codons: {c.translate(sequence.revcomp_table)[::-1] for c in codons}
+    codons = {
+        "+": (detector.start_codons, detector.stop_codons),
+        "-": (revcomp(detector.start_codons), revcomp(detector.stop_codons)),
+    }
+
+    def chunks():
+        for record in records:
+            stitcher = _Stitcher(record, need, longest, translator)
+            text = record.sequence
+            for offset in range(0, len(text), chunk_size):
+                # Two extra bases complete codons starting at the chunk's end.
+                args = (text[offset:offset + chunk_size + 2], offset, chunk_size, codons, need, longest, translator)
+                yield stitcher, args, offset + chunk_size >= len(text)
+
+    def collect(stitcher, result, last):
+        yield from stitcher.feed(result)
+        if last:
+            yield from stitcher.finish()
+
+    if processes <= 1:
+        for stitcher, args, last in chunks():
+            yield from collect(stitcher, _scan_chunk(*args), last)
+        return
+
+    with ProcessPoolExecutor(max_workers=processes) as pool:
+        pending = deque()
+        for stitcher, args, last in chunks():
+            pending.append((stitcher, pool.submit(_scan_chunk, *args), last))
+            if len(pending) >= 2 * processes:
+                stitcher, future, last = pending.popleft()
+                yield from collect(stitcher, future.result(), last)
+        while pending:
+            stitcher, future, last = pending.popleft()
+            yield from collect(stitcher, future.result(), last)
+
+
+_STRAND_CODES = {"+": 1, "-": -1}
+_STRAND_NAMES = {1: "+", -1: "-"}
+
+
+class ORFTable:
+    """
+    Columnar (struct-of-arrays) store for large ORF sets.
+
+    Coordinates, frame, strand and length live in compact ``array``
+    columns, about 30 bytes per ORF, and sequence IDs are stored once in
+    ``seq_ids``. Neither proteins nor sequences are stored: ``protein(i)``
+    reads just the row's region through ``fetch`` (e.g. an indexed
+    ``FASTAParser.fetch``) and translates it on demand. Selections return
+    new tables with their own copy of the ID list; the row work is done
+    with ``map``, ``compress`` and ``sorted`` over the columns.
+
+    Attributes:
+        seq_ids (list of str): Sequence IDs, indexed by the ``seq_index`` column.
+        fetch (callable, optional): ``fetch(seq_id, start, end)`` returning
+            residues ``[start, end)`` of a sequence; None disables proteins.
+        translator (Translator): Translator used for proteins.
+    """
+
+    COLUMNS = (("seq_index", "I"), ("start", "q"), ("end", "q"), ("frame", "b"), ("strand", "b"), ("length", "q"))
+
+    def __init__(self, fetch: Optional[Callable] = None, translator=None):
+        self.seq_ids = []
+        self._seq_lookup = {}
+        self.fetch = fetch
+        self.translator = translator or Translator()
+        for name, typecode in self.COLUMNS:
+            setattr(self, name, array(typecode))
+        self._intervals = None
+
+    @classmethod
+    def from_orfs(cls, orfs: Iterable, fetch: Optional[Callable] = None, translator=None):
+        """Build a table from ORF objects (their proteins are dropped)."""
+        table = cls(fetch, translator)
+        for orf in orfs:
+            table.add(orf)
+        return table
+
+    @classmethod
+    def from_records(cls, records: Iterable, detector: Optional[ORFDetector] = None,
+                     processes: int = 1, chunk_size: int = 1 << 20, fetch: Optional[Callable] = None):
+        """
+        Call ORFs over a record stream straight into a table (see ``call_orfs``).
+
+        The records are not kept; pass ``fetch`` (e.g. ``parser.fetch`` of
+        an indexed ``FASTAParser``) to be able to produce proteins later.
+        """
+        detector = detector or ORFDetector()
+        table = cls(fetch, detector.translator)
+        for orf in call_orfs(records, detector, processes, chunk_size):
+            table.add(orf)
+        return table
+
+    def append(self, seq_id, start, end, frame, strand):
+        """Add one row."""
+        index = self._seq_lookup.get(seq_id)
+        if index is None:
+            index = self._seq_lookup[seq_id] = len(self.seq_ids)
+            self.seq_ids.append(seq_id)
+        self.seq_index.append(index)
+        self.start.append(start)
+        self.end.append(end)
+        self.frame.append(frame)
+        self.strand.append(_STRAND_CODES[strand])
+        self.length.append(end - start + 1)
+        self._intervals = None
+
+    def add(self, orf):
+        """Add an ``ORF`` object as a row."""
+        self.append(orf.seq_id, orf.start, orf.end, orf.frame, orf.strand)
+
+    def __len__(self):
+        return len(self.start)
+
+    def protein(self, i: int) -> Optional[str]:
+        """Translate row ``i`` from its fetched region; None without ``fetch``."""
+        if self.fetch is None:
+            return None
+        region = self.fetch(self.seq_ids[self.seq_index[i]], self.start[i], self.end[i] + 1)
+        if self.strand[i] == 1:
+            return _orf_protein(self.translator, region, "+", 0, len(region))
+        return _orf_protein(self.translator, region, "-", len(region) - 3, -3)
+
+    def __getitem__(self, i: int) -> ORF:
+        if i < 0:
+            i += len(self)
+        return ORF(self.seq_ids[self.seq_index[i]], self.start[i], self.end[i], self.frame[i],
+                   _STRAND_NAMES[self.strand[i]], self.protein(i))
+
+    def __iter__(self) -> Iterator[ORF]:
+        return map(self.__getitem__, range(len(self)))
+
+    def take(self, indices: Iterable[int]):
+        """New table holding the given rows, in the given order."""
+        indices = list(indices)
+        table = ORFTable.__new__(ORFTable)
+        table.seq_ids, table._seq_lookup = list(self.seq_ids), dict(self._seq_lookup)
+        table.fetch, table.translator = self.fetch, self.translator
+        for name, typecode in self.COLUMNS:
+            setattr(table, name, array(typecode, map(getattr(self, name).__getitem__, indices)))
+        table._intervals = None
+        return table
+
+    def filter(self, mask: Iterable[bool]):
+        """Rows where ``mask`` is true."""
+        return self.take(compress(range(len(self)), mask))
+
+    def filter_length(self, min_length: int = 0, max_length: Optional[int] = None):
+        """Rows with ``min_length <= length`` (and ``length <= max_length`` if given)."""
+        mask = map(le, repeat(min_length), self.length)
+        if max_length is not None:
+            mask = map(and_, mask, map(ge, repeat(max_length), self.length))
+        return self.filter(mask)
+
+    def on_strand(self, strand: str):
+        """Rows on one strand ("+" or "-")."""
+        return self.filter(map(eq, repeat(_STRAND_CODES[strand]), self.strand))
+
+    def on_sequence(self, seq_id: str):
+        """Rows of one sequence."""
+        return self.filter(map(eq, repeat(self._seq_lookup.get(seq_id, -1)), self.seq_index))
+
+    def sort(self, by=("seq_index", "start"), reverse: bool = False):
+        """
+        Rows ordered by one or more columns.
+
+        Args:
+            by (str or tuple of str): Column names from ``COLUMNS``.
+            reverse (bool): Descending order.
+        """
+        by = (by,) if isinstance(by, str) else tuple(by)
+        columns = [getattr(self, name) for name in by]
+        keys = columns[0] if len(columns) == 1 else list(zip(*columns))
+        return self.take(sorted(range(len(self)), key=keys.__getitem__, reverse=reverse))
+
+    def _group_order(self):
+        """Row numbers sorted by (sequence, strand, start), split per group."""
+        keys = list(zip(self.seq_index, self.strand, self.start))
+        order = sorted(range(len(self)), key=keys.__getitem__)
+        return groupby(order, key=lambda i: keys[i][:2])
+
+    def overlapping_pairs(self) -> Iterator[Tuple[int, int]]:
+        """Row pairs ``(i, j)`` overlapping on the same sequence and strand, ``i`` starting first."""
+        for _, rows in self._group_order():
+            yield from sweep_pairs(self.start, self.end, rows)
+
+    def overlaps(self, seq_id: str, start: int, end: int, strand: Optional[str] = None):
+        """
+        Rows overlapping ``[start, end]`` (inclusive) on one sequence.
+
+        Args:
+            seq_id (str): Sequence to search.
+            start (int): Region start.
+            end (int): Region end.
+            strand (str, optional): Restrict to "+" or "-".
+        """
+        if self._intervals is None:
+            self._intervals = {}
+            for key, rows in self._group_order():
+                rows = list(rows)
+                starts = array("q", map(self.start.__getitem__, rows))
+                ends = array("q", map(self.end.__getitem__, rows))
+                self._intervals[key] = (rows, SortedIntervals(starts, ends))
+        index = self._seq_lookup.get(seq_id)
+        hits = []
+        for code in (_STRAND_CODES[strand],) if strand else (1, -1):
+            rows, intervals = self._intervals.get((index, code), ((), None))
+            if intervals is not None:
+                hits.extend(rows[k] for k in intervals.overlapping(start, end))
+        return self.take(sorted(hits))
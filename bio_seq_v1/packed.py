@@ -0,0 +1,170 @@
+"""
+Compact 2-bit sequence storage.
+
+A, C, G and T are packed four to a byte. Every other character in the
+alphabet (IUPAC ambiguity codes, U, gaps) is kept in a sparse run-length
+exception mask, so long N stretches cost one entry each. Packing and
+unpacking use big-integer shifts and strided slice assignment, which all
+run in C.
+"""
+
+from array import array
+from bio_seq_v1.stats import sequence
+from bio_seq_v1.validation import find_invalid, invalid_characters
+from collections import Counter
+import re
+
+_CODES = bytearray(256)
+for _i, _b in enumerate(b"ACGT"):
+    _CODES[_b] = _CODES[_b + 32] = _i
+_CODES = bytes(_CODES)
+_LETTERS = bytes(b"ACGT"[i & 3] for i in range(256))
+_COMPLEMENT = bytes(0xFF - i for i in range(256))
+_SHIFTS = (6, 4, 2, 0)
+_EXCEPTION_RUNS = re.compile(rb"([^ACGTacgt])\1*")
+
+
+def _pack(codes: bytes) -> bytes:
+    codes = codes + b"\x00" * (-len(codes) % 4)
+    n = len(codes) // 4
+    packed = 0
+    for i, shift in enumerate(_SHIFTS):
+        # Each code is < 4, so shifting the whole integer never carries
+        # bits across byte boundaries.
+        packed |= int.from_bytes(codes[i::4], "big") << shift
+    return packed.to_bytes(n, "big")
+
+
+def _unpack(packed: bytes, length: int) -> bytearray:
+    n = len(packed)
+    whole = int.from_bytes(packed, "big")
+    low_bits = int.from_bytes(b"\x03" * n, "big")
+    codes = bytearray(4 * n)
+    for i, shift in enumerate(_SHIFTS):
+        codes[i::4] = ((whole >> shift) & low_bits).to_bytes(n, "big")
+    del codes[length:]
+    return codes
+
+
+class PackedSequence:
+    """
+    A sequence stored at 2 bits per base with an exception mask.
+
+    Offers the same analysis API as ``bio_seq_v1.stats.sequence``.
+
+    Attributes:
+        id (str): Identifier for the sequence.
+    """
+
+    __slots__ = ("id", "_packed", "_length", "_mask_starts", "_mask_lengths", "_mask_chars")
+
+    def __init__(self, id, sequence):
+        """
+        Pack a sequence string.
+
+        Args:
+            id (str): Identifier for the sequence.
+            sequence (str): Sequence string containing valid bases.
+
+        Raises:
+            ValueError: If the sequence is empty or contains invalid characters.
+        """
+        if not sequence:
+            raise ValueError(f"Sequence for ID '{id}' is empty")
+        if find_invalid(sequence) >= 0:
+            raise ValueError(f"Sequence '{id}' contains invalid characters: {invalid_characters(sequence)}")
+        raw = sequence.encode("ascii")
+        self.id = id
+        self._length = len(raw)
+        self._packed = _pack(raw.translate(_CODES))
+        self._mask_starts = array("Q")
+        self._mask_lengths = array("Q")
+        chars = bytearray()
+        for run in _EXCEPTION_RUNS.finditer(raw):
+            self._mask_starts.append(run.start())
+            self._mask_lengths.append(run.end() - run.start())
+            chars.append(run.group(1)[0])
+        self._mask_chars = bytes(chars).upper()
+
+    @classmethod
+    def from_sequence(cls, seq_obj):
+        """Pack an existing ``sequence`` object."""
+        return cls(seq_obj.id, seq_obj.sequence)
+
+    def _runs(self):
+        return zip(self._mask_starts, self._mask_lengths, self._mask_chars)
+
+    @property
+    def sequence(self):
+        """Uppercase sequence string (unpacked on every access)."""
+        out = _unpack(self._packed, self._length).translate(_LETTERS)
+        for start, length, ch in self._runs():
+            out[start:start + length] = bytes((ch,)) * length
+        return out.decode("ascii")
+
+    def to_sequence(self):
+        """Return an equivalent ``sequence`` object."""
+        return sequence.trusted(self.id, self.sequence)
+
+    def __len__(self):
+        return self._length
+
+    def sequence_length(self):
+        """
+        Return the length of the sequence.
+
+        Returns:
+            int: Number of bases in the sequence.
+        """
+        return self._length
+
+    def base_count(self):
+        """
+        Count the occurrences of each valid base in the sequence.
+
+        Counts are taken from a histogram of the packed bytes, so the
+        sequence is never unpacked.
+
+        Returns:
+            dict: Dictionary with bases as keys and their counts as values.
+        """
+        codes = [0, 0, 0, 0]
+        for byte, n in Counter(self._packed).items():
+            for shift in _SHIFTS:
+                codes[(byte >> shift) & 3] += n
+        # Padding and masked positions are stored as code 0 ("A").
+        codes[0] -= len(self._packed) * 4 - self._length
+        counts = {b: 0 for b in sequence.valid}
+        for base, n in zip("ACGT", codes):
+            counts[base] = n
+        for _, length, ch in self._runs():
+            counts["A"] -= length
+            counts[chr(ch)] += length
+        return counts
+
+    def gc_content(self):
+        """
+        Calculate the GC content percentage of the sequence.
+
+        Returns:
+            float: GC content as a percentage.
+        """
+        counts = self.base_count()
+        return ((counts["G"] + counts["C"]) / self._length) * 100
+
+    def rev_complement(self):
+        """
+        Compute the reverse complement of the sequence.
+
+        The packed bytes are complemented with one translate call before
+        unpacking; only masked runs are handled individually.
+
+        Returns:
+            str: Reverse complement string.
+        """
+        out = _unpack(self._packed, self._length).translate(_COMPLEMENT).translate(_LETTERS)
+        for start, length, ch in self._runs():
+            comp = sequence.revcomp_dict.get(chr(ch), chr(ch))
+            out[start:start + length] = comp.encode("ascii") * length
+        out.reverse()
+        return out.decode("ascii")
@@ -0,0 +1,194 @@
+"""
+MinHash sketches for fast sequence similarity and containment.
+
+A sketch keeps a small sample of hashed canonical k-mers:
+
+- bottom-k MinHash (``num``) keeps the ``num`` smallest hashes and
+  estimates Jaccard similarity;
+- FracMinHash (``scaled``) keeps every hash below ``2**64 / scaled``, so
+  sketch size grows with the input and containment can be estimated too.
+
+Sketches serialise to a small binary file (header plus sorted 64-bit
+hashes).
+"""
+
+from array import array
+from bio_seq_v1.fasta import FASTAParser
+from bio_seq_v1.kmers import iter_kmer_codes
+from pathlib import Path
+from typing import Iterable, List, Optional
+import heapq
+import struct
+import sys
+
+_MASK64 = (1 << 64) - 1
+_MAGIC = b"BSKT"
+_HEADER = struct.Struct("<4sBBQQQ")
+
+
+def hash64(code: int, seed: int = 42) -> int:
+    """Mix a k-mer code into a well-distributed 64-bit hash (murmur3 finaliser)."""
+    x = (code ^ (seed * 0x9E3779B97F4A7C15)) & _MASK64
+    x = ((x ^ (x >> 33)) * 0xFF51AFD7ED558CCD) & _MASK64
+    x = ((x ^ (x >> 33)) * 0xC4CEB9FE1A85EC53) & _MASK64
+    return x ^ (x >> 33)
+
+
+class Sketch:
+    """
+    A MinHash (bottom-k) or FracMinHash (scaled) sketch of canonical k-mers.
+
+    Attributes:
+        k (int): K-mer length (1-32).
+        num (int): Sketch size for bottom-k mode, else 0.
+        scaled (int): Scale factor for FracMinHash mode, else 0.
+        seed (int): Hash seed (0 to 2**64 - 1); only sketches with equal seeds
+            are comparable.
+    """
+
+    def __init__(self, k: int = 21, num: int = 0, scaled: int = 0, seed: int = 42):
+        if not 0 < k <= 32:
+            raise ValueError("k must be between 1 and 32")
+        if bool(num) == bool(scaled):
+            raise ValueError("Specify exactly one of num or scaled")
+        if num < 0 or scaled < 0:
+            raise ValueError("num and scaled must be positive")
+        if not 0 <= seed <= _MASK64:
+            raise ValueError("seed must be an unsigned 64-bit integer")
+        self.k = k
+        self.num = num
+        self.scaled = scaled
+        self.seed = seed
+        self._max_hash = _MASK64 // scaled if scaled else _MASK64
+        self._kept = set()
+        self._heap = []
+
+    def add(self, seq):
+        """Add the k-mers of one ``sequence`` (or string) to the sketch."""
+        k, seed, kept = self.k, self.seed, self._kept
+        if self.scaled:
+            max_hash = self._max_hash
+            for _, code in iter_kmer_codes(seq, k, canonical=True):
+                h = hash64(code, seed)
+                if h <= max_hash:
+                    kept.add(h)
+            return self
+        heap, num = self._heap, self.num
+        for _, code in iter_kmer_codes(seq, k, canonical=True):
+            h = hash64(code, seed)
+            if h in kept:
+                continue
+            if len(heap) < num:
+                heapq.heappush(heap, -h)
+                kept.add(h)
+            elif h < -heap[0]:
+                kept.discard(-heapq.heappushpop(heap, -h))
+                kept.add(h)
+        return self
+
+    def add_all(self, sequences: Iterable):
+        """Add every record of a stream."""
+        for seq in sequences:
+            self.add(seq)
+        return self
+
+    @classmethod
+    def from_fasta(cls, path, k: int = 21, num: int = 0, scaled: int = 0, seed: int = 42,
+                   threads: Optional[int] = None):
+        """Sketch all records of a (possibly compressed) FASTA file in one streaming pass."""
+        return cls(k, num, scaled, seed).add_all(FASTAParser(path, threads=threads).iter_records())
+
+    @property
+    def hashes(self) -> array:
+        """Sorted retained hashes."""
+        return array("Q", sorted(self._kept))
+
+    def __len__(self):
+        return len(self._kept)
+
+    def _check_compatible(self, other):
+        if (self.k, self.seed, self.num, self.scaled) != (other.k, other.seed, other.num, other.scaled):
+            raise ValueError("Sketches must share k, seed and num/scaled to be compared")
+
+    def jaccard(self, other: "Sketch") -> float:
+        """
+        Estimate the Jaccard similarity of the two underlying k-mer sets.
+
+        Returns:
+            float: Estimate in [0, 1].
+        """
+        self._check_compatible(other)
+        if self.scaled:
+            union = len(self._kept | other._kept)
+            return len(self._kept & other._kept) / union if union else 0.0
+        # Bottom-k: look only at the num smallest hashes of the union.
+        union = heapq.nsmallest(self.num, self._kept | other._kept)
+        if not union:
+            return 0.0
+        shared = sum(1 for h in union if h in self._kept and h in other._kept)
+        return shared / len(union)
+
+    def containment(self, other: "Sketch") -> float:
+        """
+        Estimate the fraction of this sketch's k-mers that also occur in ``other``.
+
+        Only defined for FracMinHash (scaled) sketches.
+        """
+        self._check_compatible(other)
+        if not self.scaled:
+            raise ValueError("Containment requires scaled (FracMinHash) sketches")
+        return len(self._kept & other._kept) / len(self._kept) if self._kept else 0.0
+
+    def save(self, path):
+        """Write the sketch as a compact binary file."""
+        hashes = self.hashes
+        if sys.byteorder != "little":
+            hashes.byteswap()
+        with open(path, "wb") as f:
+            f.write(_HEADER.pack(_MAGIC, 1, self.k, self.num, self.scaled, self.seed))
+            f.write(hashes.tobytes())
+
+    @classmethod
+    def load(cls, path):
+        """Read a sketch written by ``save``."""
+        data = Path(path).read_bytes()
+        if len(data) < _HEADER.size:
+            raise ValueError(f"{path} is not a sketch file")
+        magic, version, k, num, scaled, seed = _HEADER.unpack_from(data)
+        if magic != _MAGIC or version != 1:
+            raise ValueError(f"{path} is not a sketch file")
+        sketch = cls(k, num, scaled, seed)
+        hashes = array("Q")
+        hashes.frombytes(data[_HEADER.size:])
+        if sys.byteorder != "little":
+            hashes.byteswap()
+        sketch._kept = set(hashes)
+        if num:
+            sketch._heap = [-h for h in hashes]
+            heapq.heapify(sketch._heap)
+        return sketch
+
+
+def pairwise(sketches: List[Sketch], metric: str = "jaccard") -> List[List[float]]:
+    """
+    All-vs-all comparison of sketches.
+
+    Args:
+        sketches (list of Sketch): Compatible sketches.
+        metric (str): "jaccard" (symmetric) or "containment" (row in column).
+
+    Returns:
+        list of list of float: ``matrix[i][j]`` compares sketch i with sketch j.
+    """
+    if metric not in ("jaccard", "containment"):
+        raise ValueError(f"Unknown metric '{metric}'")
+    n = len(sketches)
+    matrix = [[1.0] * n for _ in range(n)]
+    for i in range(n):
+        for j in range(i + 1, n):
+            if metric == "jaccard":
+                matrix[i][j] = matrix[j][i] = sketches[i].jaccard(sketches[j])
+            else:
+                matrix[i][j] = sketches[i].containment(sketches[j])
+                matrix[j][i] = sketches[j].containment(sketches[i])
+    return matrix
@@ -1,3 +1,6 @@
+from bio_seq_v1.validation import NUCLEOTIDES, find_invalid, invalid_characters
+from collections import OrderedDict
+from typing import Iterator, NamedTuple
 import warnings
 
 class sequence():
@@ -8,15 +11,24 @@ class sequence():
     Attributes:
         id (str): Identifier for the sequence.
         sequence (str): Uppercase string of sequence bases.
+
+    Derived values (base counts, GC content, reverse complement, six-frame
+    translations) are memoized per object in a small LRU cache holding at
+    most ``cache_size`` entries. Assigning to ``sequence`` clears it.
     """
 
+    cache_size = 8
+    _cache = None
+
     revcomp_dict = { 
     "A":"T", "T":"A", "G":"C", "C":"G", "U":"A",
     "R":"Y", "Y":"R", "S":"S", "W":"W",
     "K":"M", "M":"K", "B":"V", "D":"H",
-    "H":"D", "V":"B", "N":"N"}
+    "H":"D", "V":"B", "N":"N", "-":"-", ".":"."}
+
+    revcomp_table = str.maketrans(revcomp_dict)
     
-    valid = "ACGTUNRYSWKMBDHV-." 
+    valid = NUCLEOTIDES
 
     def __init__(self, id, sequence):
         """
@@ -31,11 +43,68 @@ class sequence():
         """
         if not sequence: 
              raise ValueError(f"Sequence for ID '{id}' is empty")
-        invalid_chars = set(sequence.upper())-set(self.valid) 
-        if invalid_chars: 
-             raise ValueError(f"Sequence '{id}' contains invalid characters: {invalid_chars}")
+        if find_invalid(sequence) >= 0:
+             raise ValueError(f"Sequence '{id}' contains invalid characters: {invalid_characters(sequence)}")
         self.id = id 
         self.sequence = sequence.upper()
+
+    @classmethod
+    def trusted(cls, id, sequence):
+        """
+        Build a Sequence from data that has already been validated.
+
+        Skips the alphabet check and the uppercase copy made by ``__init__``;
+        the caller guarantees ``sequence`` is non-empty, uppercase and only
+        contains characters from ``valid`` (e.g. FASTAParser output).
+
+        Args:
+            id (str): Identifier for the sequence.
+            sequence (str): Pre-validated uppercase sequence string.
+
+        Returns:
+            sequence: The new Sequence object.
+        """
+        obj = cls.__new__(cls)
+        obj.id = id
+        obj.sequence = sequence
+        return obj
+
+    @property
+    def sequence(self):
+        return self._sequence
+
+    @sequence.setter
+    def sequence(self, value):
+        self._sequence = value
+        self._cache = None
+
+    def invalidate_cache(self):
+        """Drop every memoized derived value."""
+        self._cache = None
+
+    def cached(self, key, compute):
+        """
+        Return the memoized value for ``key``, computing it on a miss.
+
+        Args:
+            key (hashable): Cache key identifying the derived value.
+            compute (callable): Zero-argument function producing the value.
+
+        Returns:
+            The cached or freshly computed value.
+        """
+        if self.cache_size <= 0:
+            return compute()
+        if self._cache is None:
+            self._cache = OrderedDict()
+        elif key in self._cache:
+            self._cache.move_to_end(key)
+            return self._cache[key]
+        value = compute()
+        self._cache[key] = value
+        while len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+        return value
              
     def sequence_length(self): 
         """
@@ -48,22 +117,33 @@ class sequence():
         return len(self.sequence) 
     
     def base_count(self):
-            """
+        """
         Count the occurrences of each valid base in the sequence.
 
+        Each base is counted with ``str.count``, which scans in C. The
+        alphabet starts with ACGT, and counting stops as soon as every
+        character is accounted for, so plain DNA takes four scans.
+
         Returns:
             dict: Dictionary with bases as keys and their counts as values.
 
         Notes:
             If an invalid character is present, a warning is issued.
         """
-            counts = {b:0 for b in self.valid} 
-            for b in self.sequence: 
-                if b in counts:
-                    counts[b] += 1
-                else:
-                     warnings.warn(f"Invalid character in id: '{self.id}' and sequence: '{self.sequence}")
-            return counts 
+        return dict(self.cached("base_count", self._base_count))
+
+    def _base_count(self):
+        seq = self.sequence
+        counts = dict.fromkeys(self.valid, 0)
+        remaining = len(seq)
+        for b in self.valid:
+            if not remaining:
+                break
+            counts[b] = seq.count(b)
+            remaining -= counts[b]
+        if remaining:
+            warnings.warn(f"Invalid character in id: '{self.id}' and sequence: '{self.sequence}")
+        return counts
     
     def gc_content(self):
         """
@@ -75,6 +155,9 @@ class sequence():
         Raises:
             ValueError: If the sequence contains no valid bases for calculation.
         """
+        return self.cached("gc_content", self._gc_content)
+
+    def _gc_content(self):
         if not self.sequence: 
              return 0.0 
         g = self.sequence.count("G") 
@@ -83,18 +166,107 @@ class sequence():
         return ((g+c)/total)*100 
     
     def rev_complement(self):
-            """
+        """
         Compute the reverse complement of the sequence.
 
+        Uses a single ``str.translate`` over ``revcomp_table``, which covers
+        the whole ``valid`` alphabet (gaps map to themselves). For a lazy,
+        sliceable alternative see ``bio_seq_v1.views.ReverseComplementView``.
+
         Returns:
             str: Reverse complement string.
-
-        Raises:
-            ValueError: If the sequence contains invalid bases not in revcomp_dict.
         """
+        return self.cached("rev_complement", self._rev_complement)
 
-            reverse = self.sequence[::-1] 
-            complement = "".join(self.revcomp_dict[b] for b in reverse if b in self.valid )
-            return complement
+    def _rev_complement(self):
+        return self.sequence.translate(self.revcomp_table)[::-1]
+
+
+def composition_matrix(sequences, bases=sequence.valid):
+    """
+    Count bases for a batch of sequences in one call.
+
+    Args:
+        sequences (iterable): Objects with ``id`` and ``base_count()``
+            (sequence, PackedSequence, SequenceView, ...).
+        bases (str): Bases to report, in column order.
+
+    Returns:
+        tuple: (ids, matrix) where ``matrix[i][j]`` is the count of
+        ``bases[j]`` in the i-th sequence.
+    """
+    ids = []
+    matrix = []
+    for s in sequences:
+        counts = s.base_count()
+        ids.append(s.id)
+        matrix.append([counts.get(b, 0) for b in bases])
+    return ids, matrix
 
 
+class WindowStats(NamedTuple):
+    """Statistics for one window ``[start, end)`` of a sequence."""
+    start: int
+    end: int
+    gc: float
+    gc_skew: float
+    n_fraction: float
+
+
+class _RunningCounts:
+    """Prefix sums of G, C and N up to a monotonically advancing position."""
+
+    def __init__(self, seq: str):
+        self.seq = seq
+        self.pos = 0
+        self.g = self.c = self.n = 0
+
+    def advance(self, pos):
+        seq, lo = self.seq, self.pos
+        self.g += seq.count("G", lo, pos)
+        self.c += seq.count("C", lo, pos)
+        self.n += seq.count("N", lo, pos)
+        self.pos = pos
+        return self.g, self.c, self.n
+
+
+def window_stats(seq_obj, window: int, step: int = None) -> Iterator[WindowStats]:
+    """
+    Yield GC content, GC skew and N fraction over sliding windows.
+
+    Two running-count cursors follow the window starts and ends, and each
+    window is the difference of the two. Moving to the next window counts
+    only the ``step`` bases each cursor passes over, so a window costs
+    O(step) (O(window) for non-overlapping windows) rather than a fresh
+    count of the whole window. Every base is scanned by ``str.count`` at
+    most twice in total, and nothing is stored per window.
+
+    Args:
+        seq_obj (sequence or str): Sequence to scan.
+        window (int): Window size in bases.
+        step (int, optional): Distance between window starts; defaults to
+            ``window`` (non-overlapping windows).
+
+    Yields:
+        WindowStats: ``gc`` is a percentage like ``sequence.gc_content``,
+        ``gc_skew`` is (G - C) / (G + C) and ``n_fraction`` is in [0, 1].
+        The last window is truncated at the end of the sequence.
+    """
+    if window <= 0:
+        raise ValueError("Window size must be positive")
+    step = window if step is None else step
+    if step <= 0:
+        raise ValueError("Step size must be positive")
+    seq = seq_obj if isinstance(seq_obj, str) else seq_obj.sequence
+    length = len(seq)
+    starts = _RunningCounts(seq)
+    ends = _RunningCounts(seq)
+    for start in range(0, length, step):
+        end = min(start + window, length)
+        g0, c0, n0 = starts.advance(start)
+        g1, c1, n1 = ends.advance(end)
+        g, c, n = g1 - g0, c1 - c0, n1 - n0
+        size = end - start
+        yield WindowStats(start, end, (g + c) / size * 100, (g - c) / (g + c) if g + c else 0.0, n / size)
+        if end == length:
+            break
@@ -0,0 +1,103 @@
+"""
+Single-pass assembly summary statistics.
+
+``AssemblySummary`` consumes a stream of records once and keeps only
+per-record lengths (one integer each) plus running totals, so records can
+be discarded as soon as they have been counted.
+"""
+
+from array import array
+from bisect import bisect_right
+from typing import Dict, Iterable, List, Tuple
+
+DEFAULT_BINS = (0, 1_000, 10_000, 100_000, 1_000_000, 10_000_000)
+
+
+class AssemblySummary:
+    """
+    Running totals for an assembly: sizes, Nx/Lx, GC and ambiguous bases.
+
+    Attributes:
+        count (int): Number of records seen.
+        total_length (int): Sum of record lengths.
+        gc (int): Number of G and C bases.
+        ambiguous (int): Number of bases other than A, C, G, T and U.
+    """
+
+    def __init__(self, bins: Tuple[int, ...] = DEFAULT_BINS):
+        self.bins = tuple(bins)
+        self.histogram = [0] * len(self.bins)
+        self.lengths = array("Q")
+        self.count = 0
+        self.total_length = 0
+        self.gc = 0
+        self.ambiguous = 0
+
+    def add(self, seq):
+        """Account for one record (``sequence``, ``PackedSequence``, ``SequenceView`` ...)."""
+        length = seq.sequence_length()
+        counts = seq.base_count()
+        self.count += 1
+        self.total_length += length
+        self.lengths.append(length)
+        self.gc += counts["G"] + counts["C"]
+        self.ambiguous += length - sum(counts[b] for b in "ACGTU")
+        self.histogram[max(bisect_right(self.bins, length) - 1, 0)] += 1
+        return self
+
+    def add_all(self, sequences: Iterable):
+        """Consume a record stream."""
+        for seq in sequences:
+            self.add(seq)
+        return self
+
+    def nx(self, fraction: float) -> Tuple[int, int]:
+        """
+        Return ``(Nx, Lx)`` for a fraction such as 0.5 (N50/L50) or 0.9.
+
+        Returns:
+            tuple: Length of the record that takes the cumulative length
+            past ``fraction`` of the total, and how many records that took.
+        """
+        if not 0 < fraction <= 1:
+            raise ValueError("fraction must be in (0, 1]")
+        target = fraction * self.total_length
+        running = 0
+        for i, length in enumerate(sorted(self.lengths, reverse=True), start=1):
+            running += length
+            if running >= target:
+                return length, i
+        return 0, 0
+
+    def gc_content(self) -> float:
+        """Overall GC percentage across all records."""
+        return (self.gc / self.total_length) * 100 if self.total_length else 0.0
+
+    def ambiguous_fraction(self) -> float:
+        """Fraction of all bases that are ambiguity codes or gaps."""
+        return self.ambiguous / self.total_length if self.total_length else 0.0
+
+    def length_histogram(self) -> List[Tuple[str, int]]:
+        """Record counts per length bin, labelled as ``lo-hi`` ranges."""
+        labels = []
+        for i, lo in enumerate(self.bins):
+            hi = self.bins[i + 1] - 1 if i + 1 < len(self.bins) else None
+            labels.append(f"{lo}-{hi}" if hi is not None else f">={lo}")
+        return list(zip(labels, self.histogram))
+
+    def to_dict(self) -> Dict[str, float]:
+        n50, l50 = self.nx(0.5) if self.count else (0, 0)
+        n90, l90 = self.nx(0.9) if self.count else (0, 0)
+        return {
+            "sequences": self.count,
+            "total_length": self.total_length,
+            "min_length": min(self.lengths) if self.count else 0,
+            "max_length": max(self.lengths) if self.count else 0,
+            "mean_length": self.total_length / self.count if self.count else 0.0,
+            "N50": n50,
+            "L50": l50,
+            "N90": n90,
+            "L90": l90,
+            "gc_content": self.gc_content(),
+            "ambiguous_fraction": self.ambiguous_fraction(),
+        }
@@ -1,5 +1,17 @@
 
+from bio_seq_v1.fasta import split_header
+from bio_seq_v1.genetic_codes import compile_genetic_code, encode, get_code, translate_codes
 from bio_seq_v1.stats import sequence
+from bio_seq_v1.views import ReverseComplementView
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterable, Iterator, NamedTuple, Sequence
+
+FRAMES = ("+1", "+2", "+3", "-1", "-2", "-3")
+
+# Bases encoded and translated at a time; a multiple of 3 so codons never straddle blocks.
+TRANSLATE_BLOCK = 3 << 20
+
 genetic_code = {
     # Phenylalanine
     "TTT": "F", "TTC": "F",
@@ -45,14 +57,51 @@ genetic_code = {
     "TAA": "*", "TAG": "*", "TGA": "*"
 }
 
+class ProteinRecord(NamedTuple):
+    """
+    One translated frame, named ``<record name>_<frame>`` (e.g. ``chr1_-2``).
+
+    The description of the nucleotide header, if any, follows the name
+    (``chr1_-2 Homo sapiens``).
+    """
+    id: str
+    sequence: str
+
 start_codons = {"ATG"}
 stop_codons = {"TAA", "TAG", "TGA"}
 
 class Translator():
-    def __init__(self, genetic_code=genetic_code, start_codons = start_codons, stop_codons = stop_codons):
+    def __init__(self, genetic_code=genetic_code, start_codons = start_codons, stop_codons = stop_codons, table=None):
+        """
+        Args:
+            genetic_code (dict): Codon to amino acid mapping.
+            start_codons (set): Codons that can initiate an ORF.
+            stop_codons (set): Codons that terminate an ORF.
+            table (int, optional): NCBI translation table ID; overrides the
+                three arguments above with the registry's table.
+        """
+        if table is not None:
+            code = get_code(table)
+            genetic_code, start_codons, stop_codons = code.codons, code.start_codons, code.stop_codons
+        self.table_id = table
         self.genetic_code = genetic_code
         self.start_codons = start_codons
         self.stop_codons = stop_codons
+        self.table = compile_genetic_code(genetic_code if table is None else table)
+        # Six-frame results are memoized on the sequence under this key, so
+        # translators with different codes never share an entry.
+        self._six_frames_key = ("six_frames", tuple(sorted(genetic_code.items())))
+
+    def __getstate__(self):
+        # The compiled lookup is rebuilt from the per-process cache instead
+        # of being pickled to every worker.
+        state = self.__dict__.copy()
+        del state["table"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.table = compile_genetic_code(self.genetic_code if self.table_id is None else self.table_id)
 
     def _coerce_to_sequence(self, seq_input):
         if isinstance(seq_input, sequence):
@@ -65,32 +114,112 @@ class Translator():
         if frame not in (0, 1, 2):
             raise ValueError("Frame must be 0, 1, or 2")
         seq_obj = self._coerce_to_sequence(seq_input)
-        seq = seq_obj.sequence
-        protein = []
-        for i in range(frame, len(seq), 3):
-            codon = seq[i:i+3]
-            if len(codon) < 3:
-                break
-            codon = codon.upper()
-            if codon not in self.genetic_code:
-                protein.append("X")
-            else:
-                protein.append(self.genetic_code[codon])
-        return "".join(protein)
-    
+        return self.translate_encoded(encode(seq_obj.sequence), frame)
+
+    def translate_encoded(self, codes: bytes, frame: int):
+        """
+        Translate one frame of an already encoded sequence (see ``encode``).
+
+        Codons are packed into byte indices of the compiled table and
+        translated with ``bytes.translate``; see ``translate_codes``.
+        """
+        return translate_codes(self.table, codes, frame)
+
     def translate_six_frames(self, seq_input):
         seq_object = self._coerce_to_sequence(seq_input)
-        results = {}
+        return dict(seq_object.cached(self._six_frames_key, lambda: self._translate_six_frames(seq_object)))
+
+    def _translate_six_frames(self, seq_object):
+        return self.translate_frames(seq_object, FRAMES)
+
+    def translate_frames(self, seq_input, frames: Sequence[str] = FRAMES):
+        """
+        Translate the requested frames of one sequence.
 
-        for i in range(3):
-            results[f"+{i+1}"] = self.translate(seq_object, i)
+        Each strand is encoded and translated in ``TRANSLATE_BLOCK`` pieces.
+        Reverse frames read the strand through a ``ReverseComplementView``,
+        so no full-length encoding or reverse complement is ever built.
 
-        rev = sequence(seq_object.id, seq_object.rev_complement())
-        for i in range(3):
-            results[f"-{i+1}"] = self.translate(rev, i)
-        
+        Args:
+            seq_input (str or sequence): Nucleotide sequence.
+            frames (sequence of str): Frame labels from ``FRAMES``.
+
+        Returns:
+            dict: Frame label to protein string, in the order requested.
+        """
+        seq_object = self._coerce_to_sequence(seq_input)
+        forward = seq_object.sequence
+        reverse = None
+        results = {}
+        for label in frames:
+            if label not in FRAMES:
+                raise ValueError(f"Unknown frame '{label}'")
+            frame = int(label[1]) - 1
+            if label[0] == "+":
+                blocks = (forward[i:i + TRANSLATE_BLOCK] for i in range(frame, len(forward), TRANSLATE_BLOCK))
+            else:
+                if reverse is None:
+                    reverse = ReverseComplementView(seq_object)
+                blocks = reverse.blocks(TRANSLATE_BLOCK, frame)
+            results[label] = "".join(translate_codes(self.table, encode(block)) for block in blocks)
         return results
-    
+
+    def translate_records(self, records: Iterable, frames: Sequence[str] = FRAMES,
+                          processes: int = 1, chunk_bases: int = 1 << 22) -> Iterator[ProteinRecord]:
+        """
+        Stream protein records for every requested frame of every input record.
+
+        With ``processes > 1`` records are grouped into chunks of roughly
+        ``chunk_bases`` nucleotides and translated in a process pool. At most
+        ``2 * processes`` chunks are in flight, and results come back in input
+        order, so memory stays bounded however long the input is.
+
+        Args:
+            records (iterable of sequence): Nucleotide records (e.g. a FASTA stream).
+            frames (sequence of str): Frame labels from ``FRAMES``.
+            processes (int): Worker processes; 1 translates in this process.
+            chunk_bases (int): Target nucleotides per chunk sent to a worker.
+
+        Returns:
+            iterator of ProteinRecord
+        """
+        frames = tuple(frames)
+        if processes <= 1:
+            for record in records:
+                for label, protein in self.translate_frames(record, frames).items():
+                    yield ProteinRecord(_frame_header(record.id, label), protein)
+            return
+
+        with ProcessPoolExecutor(max_workers=processes) as pool:
+            pending = deque()
+            for chunk in _chunk_records(records, chunk_bases):
+                pending.append(pool.submit(_translate_chunk, self, chunk, frames))
+                if len(pending) >= 2 * processes:
+                    yield from pending.popleft().result()
+            while pending:
+                yield from pending.popleft().result()
+
+
+def _frame_header(header, label):
+    name, description = split_header(header)
+    return f"{name}_{label} {description}" if description else f"{name}_{label}"
+
+
+def _chunk_records(records, chunk_bases):
+    chunk, size = [], 0
+    for record in records:
+        chunk.append((record.id, record.sequence))
+        size += len(record.sequence)
+        if size >= chunk_bases:
+            yield chunk
+            chunk, size = [], 0
+    if chunk:
+        yield chunk
 
 
-        
\ No newline at end of file
+def _translate_chunk(translator, chunk, frames):
+    return [
+        ProteinRecord(_frame_header(seq_id, label), protein)
+        for seq_id, seq in chunk
+        for label, protein in translator.translate_frames(sequence.trusted(seq_id, seq), frames).items()
+    ]
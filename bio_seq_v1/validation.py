@@ -0,0 +1,52 @@
+"""
+Shared nucleotide alphabet and bulk sequence validation.
+
+Both the FASTA parser and ``sequence`` validate through this module, so
+they agree on one alphabet. Whole lines are checked with a single compiled
+regular expression, which scans in C and stops at the first bad character.
+"""
+
+import re
+
+NUCLEOTIDES = "ACGTUNRYSWKMBDHV-."
+
+_ALLOWED = re.escape(NUCLEOTIDES + NUCLEOTIDES.lower())
+_INVALID_STR = re.compile(f"[^{_ALLOWED}]")
+_INVALID_BYTES = re.compile(f"[^{_ALLOWED}]".encode())
+_STRIP_VALID = str.maketrans("", "", NUCLEOTIDES + NUCLEOTIDES.lower())
+
+
+def find_invalid(seq) -> int:
+    """
+    Locate the first character outside the nucleotide alphabet.
+
+    Args:
+        seq (str or bytes-like): Sequence data; either case is accepted.
+
+    Returns:
+        int: 0-based index of the first invalid character, or -1 if none.
+    """
+    pattern = _INVALID_STR if isinstance(seq, str) else _INVALID_BYTES
+    match = pattern.search(seq)
+    return match.start() if match else -1
+
+
+def invalid_characters(seq: str) -> set:
+    """Return the set of characters in ``seq`` that are not valid nucleotides."""
+    return set(seq.translate(_STRIP_VALID))
+
+
+def check_line(line, linenum: int) -> None:
+    """
+    Validate one line of sequence data.
+
+    Raises:
+        ValueError: Naming the offending character with its 1-based line
+            and column.
+    """
+    pos = find_invalid(line)
+    if pos >= 0:
+        ch = line[pos:pos + 1]
+        if not isinstance(ch, str):
+            ch = bytes(ch).decode("latin-1")
+        raise ValueError(f"Invalid nucleotide '{ch}' at line {linenum}, column {pos + 1}")
@@ -0,0 +1,212 @@
+"""
+Lazy, zero-copy views over sequence data.
+
+A ``SequenceView`` describes a region of a buffer (``bytes``, ``mmap``,
+``memoryview`` ...) that holds FASTA-formatted residues, possibly wrapped
+over several lines. Slicing returns another view without touching the
+data; statistics are computed block by block straight from the buffer, so
+memory stays bounded no matter how large the region is.
+
+A ``ReverseComplementView`` presents the reverse complement of a sequence
+without building it; only the slices that are actually read are
+complemented.
+"""
+
+from bio_seq_v1.stats import sequence
+from collections import Counter
+
+_BLOCK_SIZE = 1 << 20
+
+
+class SequenceView:
+    """
+    A read-only window onto residues stored in a buffer.
+
+    Line geometry follows the ``.fai`` convention: residue ``i`` of the
+    record lives at byte ``offset + (i // line_bases) * line_width + i % line_bases``.
+
+    Attributes:
+        id (str): Identifier for the sequence.
+    """
+
+    __slots__ = ("id", "_buffer", "_offset", "_line_bases", "_line_width", "_start", "_end")
+
+    def __init__(self, id, buffer, offset=0, line_bases=None, line_width=None, start=0, end=None):
+        """
+        Args:
+            id (str): Identifier for the sequence.
+            buffer: Any object supporting slicing to bytes (bytes, mmap, memoryview).
+            offset (int): Byte offset of the record's first residue.
+            line_bases (int, optional): Residues per full line; defaults to
+                treating the buffer as one unwrapped line.
+            line_width (int, optional): Bytes per full line including the newline.
+            start (int): First residue of the view (inclusive).
+            end (int, optional): Last residue of the view (exclusive); defaults
+                to the last residue in the buffer, derived from the line geometry.
+        """
+        if line_bases is None:
+            line_bases = line_width = max(len(buffer) - offset, 1)
+        self.id = id
+        self._buffer = buffer
+        self._offset = offset
+        self._line_bases = line_bases
+        self._line_width = line_width
+        self._start = start
+        self._end = self._residues_in_buffer() if end is None else end
+
+    def _residues_in_buffer(self):
+        """Residues between ``offset`` and the end of the buffer, newlines excluded."""
+        size = len(self._buffer) - self._offset
+        while size > 0 and self._buffer[self._offset + size - 1] in (10, 13):
+            size -= 1
+        lines, rest = divmod(size, self._line_width)
+        return lines * self._line_bases + min(rest, self._line_bases)
+
+    def _byte(self, pos):
+        return self._offset + (pos // self._line_bases) * self._line_width + pos % self._line_bases
+
+    def _raw_blocks(self):
+        """Yield the region's raw bytes (newlines included) in bounded blocks."""
+        if self._start >= self._end:
+            return
+        lo = self._byte(self._start)
+        hi = self._byte(self._end - 1) + 1
+        for a in range(lo, hi, _BLOCK_SIZE):
+            yield bytes(self._buffer[a:min(a + _BLOCK_SIZE, hi)])
+
+    def __len__(self):
+        return self._end - self._start
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            start, stop, step = key.indices(len(self))
+            if step != 1:
+                raise ValueError("SequenceView only supports contiguous slices")
+            stop = max(start, stop)
+            return SequenceView(self.id, self._buffer, self._offset, self._line_bases,
+                                self._line_width, self._start + start, self._start + stop)
+        if key < 0:
+            key += len(self)
+        if not 0 <= key < len(self):
+            raise IndexError("SequenceView index out of range")
+        pos = self._byte(self._start + key)
+        return bytes(self._buffer[pos:pos + 1]).decode("ascii").upper()
+
+    @property
+    def sequence(self):
+        """Uppercase sequence string of the region (materialised on access)."""
+        return b"".join(block.translate(None, b"\r\n") for block in self._raw_blocks()).decode("ascii").upper()
+
+    def to_sequence(self):
+        """Copy the region into a regular ``sequence`` object."""
+        return sequence(self.id, self.sequence)
+
+    def sequence_length(self):
+        """
+        Return the length of the region.
+
+        Returns:
+            int: Number of bases in the view.
+        """
+        return len(self)
+
+    def base_count(self):
+        """
+        Count the occurrences of each valid base in the region.
+
+        Returns:
+            dict: Dictionary with bases as keys and their counts as values.
+        """
+        raw = Counter()
+        for block in self._raw_blocks():
+            raw.update(block)
+        counts = {b: 0 for b in sequence.valid}
+        for b in counts:
+            counts[b] = raw[ord(b)]
+            if b.lower() != b:
+                counts[b] += raw[ord(b.lower())]
+        return counts
+
+    def gc_content(self):
+        """
+        Calculate the GC content percentage of the region.
+
+        Returns:
+            float: GC content as a percentage.
+        """
+        if not len(self):
+            return 0.0
+        gc = 0
+        for block in self._raw_blocks():
+            gc += block.count(b"G") + block.count(b"C") + block.count(b"g") + block.count(b"c")
+        return (gc / len(self)) * 100
+
+    def rev_complement(self):
+        """
+        Compute the reverse complement of the region.
+
+        Returns:
+            str: Reverse complement string.
+        """
+        return sequence.trusted(self.id, self.sequence).rev_complement()
+
+
+class ReverseComplementView:
+    """
+    Lazy reverse complement of a ``str``, ``sequence`` or ``SequenceView``.
+
+    Indexing and slicing complement only the requested part of the
+    source, so the full reverse-complement string is never materialised
+    unless ``sequence`` is read.
+
+    Attributes:
+        id (str): Identifier of the source sequence.
+    """
+
+    __slots__ = ("id", "_source", "_length")
+
+    def __init__(self, source, id=None):
+        self.id = getattr(source, "id", None) if id is None else id
+        self._source = source
+        self._length = len(source) if isinstance(source, (str, SequenceView)) else source.sequence_length()
+
+    def _forward(self, start, stop):
+        src = self._source
+        if isinstance(src, str):
+            return src[start:stop].upper()
+        if isinstance(src, SequenceView):
+            return src[start:stop].sequence
+        return src.sequence[start:stop]
+
+    def __len__(self):
+        return self._length
+
+    def __getitem__(self, key):
+        n = self._length
+        if isinstance(key, slice):
+            start, stop, step = key.indices(n)
+            if step != 1:
+                return "".join(self[i] for i in range(start, stop, step))
+            stop = max(start, stop)
+            return self._forward(n - stop, n - start).translate(sequence.revcomp_table)[::-1]
+        if key < 0:
+            key += n
+        if not 0 <= key < n:
+            raise IndexError("ReverseComplementView index out of range")
+        return self._forward(n - 1 - key, n - key).translate(sequence.revcomp_table)
+
+    def blocks(self, size: int, start: int = 0):
+        """
+        Yield the reverse complement from ``start`` onwards in ``size``-base pieces.
+
+        Args:
+            size (int): Bases per piece.
+            start (int): Reverse-strand position to begin at.
+        """
+        for pos in range(start, self._length, size):
+            yield self[pos:pos + size]
+
+    @property
+    def sequence(self):
+        """Full reverse-complement string (materialised on access)."""
+        return self[:]
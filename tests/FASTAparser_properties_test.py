@@ -1,6 +1,6 @@
 import pytest
 from bio_seq_v1.fasta import FASTAParser
-from hypothesis import given, strategies as st
+from hypothesis import given, settings, strategies as st
 
 @given(st.text(alphabet="ACGTNRYKMSWBDHV", min_size = 1))
 def test_fasta_preserves_sequences(seq):
@@ -24,7 +24,7 @@ def test_invalid_fasta_records_errors(fasta_str):
     parser.parse_string(fasta_str)
     assert parser.errors
 
-@given(st.text(alphabet=st.characters(blacklist_characters="ACGTNRYKMSWBDHV>.-"), min_size = 1))
+@given(st.text(alphabet=st.characters(blacklist_characters="ACGTUNRYKMSWBDHVacgtunrykmswbdhv>.-"), min_size = 1))
 def test_invalid_nucleotide(fasta_seq):
     fasta = f">seq1\n{fasta_seq}"
     parser = FASTAParser(strict_seq=False)
@@ -34,7 +34,7 @@ def test_invalid_nucleotide(fasta_seq):
         for e in parser.errors
     )
 
-@given(st.text(alphabet=st.characters(blacklist_characters="ACGTNRYKMSWBDHV>.-"), min_size = 1))
+@given(st.text(alphabet=st.characters(blacklist_characters="ACGTUNRYKMSWBDHVacgtunrykmswbdhv>.-"), min_size = 1))
 def test_line_reporting(fasta_seq):
     fasta = f">seq1\n{fasta_seq}"
     parser = FASTAParser(strict_seq=False)
@@ -57,3 +57,89 @@ def test_whitespaces(fasta_seq):
     parser.parse_string(fasta_seq)
     assert parser.errors
     assert any("whitespace" in e.lower() for e in parser.errors)
+
+@given(st.lists(st.text(alphabet="ACGTNRYKMSWBDHV", min_size=1), min_size=1))
+def test_iter_records_matches_parse_string(seqs):
+    fasta = "".join(f">seq{i}\n{s}\n" for i, s in enumerate(seqs))
+    streaming = FASTAParser()
+    streamed = [s.sequence for s in streaming.iter_string(fasta)]
+    assert streamed == seqs
+    assert streaming.sequences == []
+    assert streaming.records_parsed == len(seqs)
+
+    eager = FASTAParser()
+    eager.parse_string(fasta)
+    assert [s.sequence for s in eager.sequences] == streamed
+
+def test_iter_records_strict_raises_lazily():
+    parser = FASTAParser(strict=True)
+    records = parser.iter_string(">seq1\nACGT\n>seq2\n")
+    assert next(records).sequence == "ACGT"
+    with pytest.raises(ValueError):
+        next(records)
+
+@given(
+    seqs=st.lists(st.text(alphabet="ACGTN", min_size=1, max_size=60), min_size=1, max_size=5),
+    width=st.integers(min_value=1, max_value=20),
+    data=st.data(),
+)
+def test_indexed_fetch_matches_parsed_region(tmp_path_factory, seqs, width, data):
+    path = tmp_path_factory.mktemp("fai") / "ref.fasta"
+    with open(path, "w") as f:
+        for i, s in enumerate(seqs):
+            f.write(f">seq{i} description\n")
+            for j in range(0, len(s), width):
+                f.write(s[j:j + width] + "\n")
+    parser = FASTAParser(str(path))
+    parser.write_index()
+
+    fresh = FASTAParser(str(path))
+    i = data.draw(st.integers(min_value=0, max_value=len(seqs) - 1))
+    start = data.draw(st.integers(min_value=0, max_value=len(seqs[i])))
+    end = data.draw(st.integers(min_value=start, max_value=len(seqs[i])))
+    assert fresh.fetch(f"seq{i}", start, end) == seqs[i][start:end]
+    assert fresh.index[f"seq{i}"].length == len(seqs[i])
+    fresh.close()
+
+@given(
+    seqs=st.lists(st.text(alphabet="ACGTx", min_size=0, max_size=30), min_size=1, max_size=12),
+    chunk_size=st.integers(min_value=1, max_value=80),
+)
+@settings(max_examples=10, deadline=None)
+def test_parallel_parse_matches_serial(tmp_path_factory, seqs, chunk_size):
+    path = tmp_path_factory.mktemp("chunks") / "many.fasta"
+    path.write_text("".join(f">seq{i}\n{s}\n" for i, s in enumerate(seqs)))
+
+    serial = FASTAParser(str(path))
+    serial.parse_file()
+    parallel = FASTAParser(str(path))
+    parallel.sequences.extend(parallel.iter_records(processes=2, chunk_size=chunk_size))
+
+    assert [(s.id, s.sequence) for s in parallel.sequences] == [(s.id, s.sequence) for s in serial.sequences]
+    assert parallel.errors == serial.errors
+
+def test_parallel_strict_error_reports_absolute_line(tmp_path):
+    path = tmp_path / "strict.fasta"
+    path.write_text(">a\nACGT\n>b\nACGT\n>c\nACxT\n")
+    serial = FASTAParser(str(path), strict_seq=True)
+    with pytest.raises(ValueError) as expected:
+        serial.parse_file()
+    parallel = FASTAParser(str(path), strict_seq=True)
+    with pytest.raises(ValueError) as raised:
+        list(parallel.iter_records(processes=2, chunk_size=1))
+    assert str(raised.value) == str(expected.value) == "Invalid nucleotide 'x' at line 6, column 3"
+
+# parse_string splits lines the way str.splitlines does, so none of its
+# separators can stand in for an invalid character on a single line.
+LINE_BREAKS = "".join(c for c in map(chr, range(0x110000)) if len(("a" + c + "a").splitlines()) > 1)
+
+@given(prefix=st.text(alphabet="ACGTUNRYKMSWBDHV-.acgt", max_size=20),
+       bad=st.characters(blacklist_characters="ACGTUNRYKMSWBDHV-.acgtunrykmswbdhv>" + LINE_BREAKS),
+       suffix=st.text(alphabet="ACGT", max_size=5))
+def test_invalid_character_column_reporting(prefix, bad, suffix):
+    line = prefix + bad + suffix
+    if line.strip() != line:
+        return
+    parser = FASTAParser(strict_seq=False)
+    parser.parse_string(f">seq1\nACGT\n{line}")
+    assert f"line 3, column {len(prefix) + 1}" in parser.errors[0]
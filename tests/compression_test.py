@@ -0,0 +1,54 @@
+import bz2
+import gzip
+import lzma
+import struct
+import zlib
+import pytest
+from bio_seq_v1.compression import detect_compression, open_text
+from bio_seq_v1.fasta import FASTAParser
+from hypothesis import given, settings, strategies as st
+
+def write_bgzf(path, data, block_size=7):
+    with open(path, "wb") as f:
+        for i in range(0, len(data), block_size):
+            chunk = data[i:i + block_size]
+            comp = zlib.compressobj(6, zlib.DEFLATED, -15)
+            cdata = comp.compress(chunk) + comp.flush()
+            header = b"\x1f\x8b\x08\x04" + b"\x00" * 4 + b"\x00\xff" + struct.pack("<H", 6)
+            extra = b"BC" + struct.pack("<HH", 2, 12 + 6 + len(cdata) + 8 - 1)
+            f.write(header + extra + cdata + struct.pack("<II", zlib.crc32(chunk), len(chunk)))
+        # EOF marker block
+        f.write(bytes.fromhex("1f8b08040000000000ff0600424302001b0003000000000000000000"))
+
+WRITERS = {
+    "gzip": lambda p, d: p.write_bytes(gzip.compress(d)),
+    "bz2": lambda p, d: p.write_bytes(bz2.compress(d)),
+    "xz": lambda p, d: p.write_bytes(lzma.compress(d)),
+    "bgzf": write_bgzf,
+}
+
+@pytest.mark.parametrize("kind", sorted(WRITERS))
+def test_compressed_input_is_detected_by_magic(tmp_path, kind):
+    fasta = b">seq1\nACGT\nGG\n>seq2\nTTTT\n"
+    path = tmp_path / "reads.fasta"
+    WRITERS[kind](path, fasta)
+    assert detect_compression(path) == kind
+    parser = FASTAParser(str(path), threads=2)
+    parser.parse_file()
+    assert [(s.id, s.sequence) for s in parser.sequences] == [("seq1", "ACGTGG"), ("seq2", "TTTT")]
+
+@settings(max_examples=25)
+@given(st.lists(st.text(alphabet="ACGT", min_size=1, max_size=50), min_size=1, max_size=10),
+       st.integers(min_value=1, max_value=64))
+def test_bgzf_round_trip(tmp_path_factory, seqs, block_size):
+    fasta = "".join(f">s{i}\n{s}\n" for i, s in enumerate(seqs))
+    path = tmp_path_factory.mktemp("bgzf") / "x.fa.gz"
+    write_bgzf(path, fasta.encode(), block_size)
+    with open_text(path, threads=3) as f:
+        assert f.read() == fasta
+
+def test_compressed_file_cannot_be_indexed(tmp_path):
+    path = tmp_path / "x.fa.gz"
+    path.write_bytes(gzip.compress(b">a\nACGT\n"))
+    with pytest.raises(ValueError):
+        FASTAParser(str(path)).build_index()
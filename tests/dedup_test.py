@@ -0,0 +1,32 @@
+from bio_seq_v1.dedup import Deduplicator, deduplicate
+from bio_seq_v1.fasta import FASTAParser
+from bio_seq_v1.stats import sequence
+from hypothesis import given, strategies as st
+
+@given(st.lists(st.text(alphabet="ACGT", min_size=1, max_size=20), min_size=1, max_size=15))
+def test_exact_and_reverse_complement_duplicates(seqs):
+    records = [sequence(f"r{i}", s) for i, s in enumerate(seqs)]
+    unique = list(Deduplicator().filter(records))
+    canon = lambda s: min(s, sequence("x", s).rev_complement())
+    assert len(unique) == len({canon(s) for s in seqs})
+    assert len({canon(r.sequence) for r in unique}) == len(unique)
+
+    forward_only = list(Deduplicator(strand_aware=False).filter(records))
+    assert len(forward_only) == len(set(seqs))
+
+def test_dedup_on_parser_stream():
+    fasta = ">a\nACGTTTGA\n>b\nTCAAACGT\n>c\nACGTTTGA\n>d\nGGGG\n"
+    dedup = Deduplicator()
+    kept = [r.id for r in dedup.filter(FASTAParser().iter_string(fasta))]
+    assert kept == ["a", "d"]
+    assert [(d.id, d.duplicate_of, d.kind) for d in dedup.duplicates] == [
+        ("b", "a", "reverse_complement"), ("c", "a", "exact")]
+
+def test_containment_near_duplicates():
+    long = sequence("long", "ACGTAGGCTTACGATCGATCGGA")
+    records = [sequence("pre", long.sequence[:12]), long,
+               sequence("suf_rc", sequence("x", long.sequence[-10:]).rev_complement()),
+               sequence("inner", long.sequence[5:15])]
+    unique, dups = deduplicate(records, containment=True, anchor=6)
+    assert [r.id for r in unique] == ["long", "inner"]
+    assert {(d.id, d.kind) for d in dups} == {("pre", "prefix"), ("suf_rc", "suffix")}
@@ -0,0 +1,51 @@
+import csv
+from bio_seq_v1.fasta import FASTAParser
+from bio_seq_v1.export import Exporter
+from bio_seq_v1.orf import call_orfs
+from hypothesis import given, strategies as st
+
+@given(st.lists(st.text(alphabet="ACGT", min_size=1), min_size=1, max_size=20))
+def test_sequences_to_csv_streams_records(tmp_path_factory, seqs):
+    fasta = "".join(f">seq{i}\n{s}\n" for i, s in enumerate(seqs))
+    out = tmp_path_factory.mktemp("export") / "nested" / "seqs.csv"
+    parser = FASTAParser()
+    Exporter.sequences_to_csv(parser.iter_string(fasta), out)
+    with open(out, newline="") as f:
+        rows = list(csv.DictReader(f))
+    assert [r["sequence"] for r in rows] == seqs
+    assert [int(r["length"]) for r in rows] == [len(s) for s in seqs]
+
+def test_to_fasta_round_trip(tmp_path):
+    parser = FASTAParser()
+    out = tmp_path / "out.fasta"
+    Exporter.to_fasta(parser.iter_string(">a\nACGT\nGG\n>b\nTT\n"), out)
+    assert out.read_text() == ">a\nACGTGG\n>b\nTT\n"
+
+def test_windows_to_bedgraph(tmp_path):
+    parser = FASTAParser()
+    out = tmp_path / "gc.bedgraph"
+    Exporter.windows_to_bedgraph(parser.iter_string(">chr1\nGGCCAAAT\n"), 4, 2, file_path=out)
+    assert out.read_text().splitlines() == ["chr1\t0\t4\t100", "chr1\t2\t6\t50", "chr1\t4\t8\t0"]
+
+def test_orfs_to_gff3_and_bed(tmp_path):
+    orfs = call_orfs(FASTAParser().iter_string(">c1\nCCATGAAATTTTAGGGCTACATGG\n"))
+    gff, bed = tmp_path / "orfs.gff3", tmp_path / "orfs.bed"
+    orfs = list(orfs)
+    Exporter.orfs_to_gff3(orfs, gff)
+    Exporter.orfs_to_bed(orfs, bed)
+    assert gff.read_text().splitlines() == [
+        "##gff-version 3",
+        "c1\tbio_seq_v1\tORF\t3\t11\t.\t+\t.\tID=c1_orf1;frame=2;length=9",
+        "c1\tbio_seq_v1\tORF\t20\t22\t.\t-\t.\tID=c1_orf2;frame=2;length=3",
+    ]
+    assert bed.read_text().splitlines() == ["c1\t2\t11\tc1_orf1\t0\t+", "c1\t19\t22\tc1_orf2\t0\t-"]
+
+def test_exports_use_escaped_record_name(tmp_path):
+    orfs = list(call_orfs(FASTAParser().iter_string(">c1;a=b%&c sample one\nCCATGAAATTTTAGGG\n")))
+    gff, bed = tmp_path / "orfs.gff3", tmp_path / "orfs.bed"
+    Exporter.orfs_to_gff3(orfs, gff)
+    Exporter.orfs_to_bed(orfs, bed)
+    assert gff.read_text().splitlines()[1] == (
+        "c1%3Ba%3Db%25%26c\tbio_seq_v1\tORF\t3\t11\t.\t+\t.\tID=c1%3Ba%3Db%25%26c_orf1;frame=2;length=9"
+    )
+    assert bed.read_text().splitlines() == ["c1;a=b%&c\t2\t11\tc1;a=b%&c_orf1\t0\t+"]
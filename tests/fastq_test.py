@@ -0,0 +1,45 @@
+import pytest
+from bio_seq_v1.fastq import FASTQParser, FASTQRecord
+from hypothesis import given, strategies as st
+
+reads = st.lists(
+    st.text(alphabet="ACGTN", min_size=1, max_size=40).flatmap(
+        lambda s: st.tuples(st.just(s), st.lists(st.integers(0, 41), min_size=len(s), max_size=len(s)))
+    ),
+    min_size=1, max_size=10,
+)
+
+def to_fastq(records):
+    return "".join(
+        f"@r{i}\n{s}\n+\n{''.join(chr(q + 33) for q in quals)}\n"
+        for i, (s, quals) in enumerate(records)
+    )
+
+@given(reads)
+def test_fastq_round_trip(records):
+    parser = FASTQParser()
+    parser.parse_string(to_fastq(records))
+    assert not parser.errors
+    assert [(r.sequence, list(r.quality)) for r in parser.records] == records
+    for r, (s, quals) in zip(parser.records, records):
+        assert isinstance(r.quality, bytes)
+        assert r.mean_quality() == pytest.approx(sum(quals) / len(quals))
+
+@given(reads, st.integers(0, 41))
+def test_trim_never_extends_read(records, threshold):
+    parser = FASTQParser()
+    for r in parser.iter_string(to_fastq(records)):
+        trimmed = r.trim(threshold, five_prime=True)
+        assert len(trimmed.sequence) == len(trimmed.quality) <= len(r.sequence)
+        assert trimmed.sequence in r.sequence
+
+def test_trim_removes_low_quality_tail():
+    r = FASTQRecord("r", "ACGTACGT", bytes([30, 30, 30, 30, 30, 2, 2, 2]))
+    assert r.trim(20).sequence == "ACGTA"
+
+def test_mismatched_quality_is_an_error():
+    parser = FASTQParser()
+    parser.parse_string("@r1\nACGT\n+\nIII\n")
+    assert parser.errors and not parser.records
+    with pytest.raises(ValueError):
+        FASTQParser(strict=True).parse_string("@r1\nACGT\n+\nIII\n")
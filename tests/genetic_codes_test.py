@@ -0,0 +1,67 @@
+import pickle
+import pytest
+from bio_seq_v1.genetic_codes import NCBI_TABLES, compile_genetic_code, get_code, translate_codes
+from bio_seq_v1.orf import ORFDetector
+from bio_seq_v1.translator import Translator, genetic_code
+from hypothesis import given, strategies as st
+
+def test_registry_tables_are_complete():
+    assert set(NCBI_TABLES) == {1, 2, 3, 4, 5, 6, 9, 10, 11, 12, 13, 14, 15, 16, *range(21, 34)}
+    for table_id in NCBI_TABLES:
+        code = get_code(table_id)
+        assert len(code.codons) == 64
+        assert code.stop_codons >= {c for c, aa in code.codons.items() if aa == "*"}
+        assert code.start_codons <= set(code.codons)
+
+def test_standard_table_matches_default_code():
+    assert get_code(1).codons == genetic_code
+    assert get_code(11).start_codons == {"TTG", "CTG", "ATT", "ATC", "ATA", "ATG", "GTG"}
+
+def test_alternative_tables():
+    mito = Translator(table=2)
+    assert mito.translate("TGAAGAATA", frame=0) == "W*M"
+    assert mito.stop_codons == {"TAA", "TAG", "AGA", "AGG"}
+    assert Translator(table=4).translate("TGA", frame=0) == "W"
+    assert get_code(28).stop_codons == {"TAA", "TAG", "TGA"}
+    with pytest.raises(ValueError):
+        Translator(table=7)
+
+def test_compiled_tables_are_shared():
+    assert Translator(table=11).table is Translator(table=11).table
+    assert ORFDetector(table=11).translator.table is compile_genetic_code(11)
+    assert Translator().table is Translator(table=1).table
+
+@given(st.sampled_from(sorted(NCBI_TABLES)), st.text(alphabet="ACGTN", min_size=3, max_size=60))
+def test_pickled_translator_uses_same_table(table_id, seq):
+    translator = Translator(table=table_id)
+    restored = pickle.loads(pickle.dumps(translator))
+    assert restored.table is translator.table
+    assert restored.translate_six_frames(seq) == translator.translate_six_frames(seq)
+
+def test_packed_translation_matches_flat_table():
+    codes = bytes(m for i in range(4096) for m in (i >> 8, i >> 4 & 15, i & 15))
+    for table_id in NCBI_TABLES:
+        compiled = compile_genetic_code(table_id)
+        assert compiled.residues is not None
+        assert translate_codes(compiled, codes) == "".join(compiled.flat)
+    # Codes whose residues cannot be byte-translated use the flat table directly.
+    exotic = compile_genetic_code({c: chr(0x100 + i) for i, c in enumerate(genetic_code)})
+    assert exotic.residues is None
+    assert translate_codes(exotic, codes) == "".join(exotic.flat)
+
+def test_multi_character_residues():
+    translator = Translator(genetic_code={"ATG": "Met", "TAA": "*"})
+    assert translator.translate("ATGTAAATN", 0) == "Met*X"
+
+def test_context_dependent_stops_end_orfs_but_translate_as_sense():
+    assert get_code(1).context_stops == frozenset()
+    assert get_code(27).context_stops == {"TGA"}
+    assert get_code(31).context_stops == {"TAA", "TAG"}
+    for table_id in NCBI_TABLES:
+        code = get_code(table_id)
+        assert all(code.codons[c] != "*" for c in code.context_stops)
+        assert code.stop_codons == code.context_stops | {c for c, aa in code.codons.items() if aa == "*"}
+    seq = "ATGAAATGAAAA"
+    assert Translator(table=27).translate(seq, frame=0) == "MKWK"
+    orfs = [o for o in ORFDetector(table=27).find_orfs(seq) if o.strand == "+"]
+    assert [(o.start, o.end, o.protein) for o in orfs] == [(0, 5, "MK")]
@@ -0,0 +1,60 @@
+import pytest
+from typing import NamedTuple
+from bio_seq_v1.intervals import IntervalIndex, overlapping_pairs
+from bio_seq_v1.orf import ORF, ORFDetector
+from hypothesis import given, strategies as st
+
+class Feature(NamedTuple):
+    name: int
+    chrom: str
+    start: int
+    end: int
+
+features = st.lists(
+    st.tuples(st.sampled_from("ab"), st.integers(0, 200), st.integers(0, 40)),
+    max_size=40,
+).map(lambda raw: [Feature(i, c, s, s + w) for i, (c, s, w) in enumerate(raw)])
+
+def chrom(f):
+    return f.chrom
+
+@given(features)
+def test_overlapping_pairs_match_brute_force(items):
+    expected = {
+        frozenset((x.name, y.name))
+        for i, x in enumerate(items) for y in items[i + 1:]
+        if x.chrom == y.chrom and x.start <= y.end and y.start <= x.end
+    }
+    pairs = list(overlapping_pairs(items, group=chrom))
+    assert len(pairs) == len(expected)
+    assert {frozenset((x.name, y.name)) for x, y in pairs} == expected
+    assert all(x.start <= y.start for x, y in pairs)
+
+@given(features, st.integers(-10, 250), st.integers(0, 60))
+def test_region_and_nearest_queries(items, start, width):
+    index = IntervalIndex(items, group=chrom)
+    assert len(index) == len(items)
+    on_a = [f for f in items if f.chrom == "a"]
+    hits = index.overlaps(start, start + width, "a")
+    assert sorted(hits) == sorted(f for f in on_a if f.start <= start + width and start <= f.end)
+    assert index.overlaps(start, start + width, "c") == []
+
+    nearest = index.nearest(start, "a")
+    distance = lambda f: max(f.start - start, start - f.end, 0)
+    if not on_a:
+        assert nearest is None
+    else:
+        assert distance(nearest) == min(map(distance, on_a))
+
+def test_overlapping_orfs_grouped_by_sequence_and_strand():
+    orfs = [
+        ORF("s1", 0, 20, 0, "+", "M"), ORF("s1", 10, 30, 1, "+", "M"),
+        ORF("s1", 15, 25, 0, "-", "M"), ORF("s2", 5, 12, 2, "+", "M"),
+    ]
+    detector = ORFDetector()
+    assert list(detector.overlapping_orfs(orfs)) == [(orfs[0], orfs[1])]
+    index = detector.index(orfs)
+    assert index.overlaps(18, 19, ("s1", "+")) == orfs[:2]
+    assert index.nearest(40, ("s2", "+")) == orfs[3]
+    with pytest.raises(TypeError):
+        detector.overlapping_orfs(orfs + ["not an orf"])
@@ -0,0 +1,40 @@
+from collections import Counter
+from hypothesis import given, strategies as st
+from bio_seq_v1.kmers import KmerCounter, count_files
+from bio_seq_v1.motif_search import MotifFinder
+from bio_seq_v1.stats import sequence
+
+def revcomp(s):
+    return s.translate(str.maketrans("ACGT", "TGCA"))[::-1]
+
+def naive_counts(seqs, k, canonical):
+    counts = Counter()
+    for s in seqs:
+        for i in range(len(s) - k + 1):
+            kmer = s[i:i + k]
+            if set(kmer) <= set("ACGT"):
+                counts[min(kmer, revcomp(kmer)) if canonical else kmer] += 1
+    return counts
+
+@given(seqs=st.lists(st.text(alphabet="ACGTN", min_size=1, max_size=80), min_size=1, max_size=5),
+       k=st.sampled_from([1, 2, 3, 4, 5, 8, 13, 14, 16, 21, 31, 32, 33]), canonical=st.booleans())
+def test_counts_match_naive(seqs, k, canonical):
+    counter = KmerCounter(k, canonical).add_all(sequence("s", s) for s in seqs)
+    assert dict(counter.items()) == naive_counts(seqs, k, canonical)
+
+@given(st.text(alphabet="ACGT", min_size=4, max_size=40))
+def test_motif_finder_count_kmers(seq):
+    finder = MotifFinder(k=4)
+    counter = finder.count_kmers(sequence("s", seq))
+    assert dict(counter.items()) == Counter(kmer for kmer, _ in finder.kmer_generation(seq))
+
+def test_count_files_merges(tmp_path):
+    paths = []
+    for i, body in enumerate(["ACGTACGT", "TTTTACGT"]):
+        path = tmp_path / f"f{i}.fa"
+        path.write_text(f">s{i}\n{body}\n")
+        paths.append(path)
+    counter = count_files(paths, 4, processes=2)
+    assert counter["ACGT"] == 3
+    assert counter["TTTT"] == 1
+    assert counter.most_common(1) == [("ACGT", 3)]
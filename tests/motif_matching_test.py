@@ -42,3 +42,32 @@ def test_both_strands(seq_char):
         assert match.strand_attributes in {"+", "-"}
 
 
+
+#blocked reverse-strand scan agrees with scanning the materialised reverse complement
+@given(seq=st.text(alphabet="ACGTN", min_size=1, max_size=80), k=st.integers(min_value=1, max_value=4),
+       block=st.integers(min_value=1, max_value=10))
+def test_reverse_strand_blocks(seq, k, block):
+    assume(len(seq) >= k)
+    seq_obj = sequence("s", seq)
+    finder = MotifFinder(k=k)
+    finder.REVERSE_BLOCK = block
+    motif = "N" * (k - 1) + "A"
+    got = [(m.position, m.matched_seq) for m in finder.search_both_strands(seq_obj, motif, 0) if m.strand_attributes == "-"]
+    rev = sequence("s", seq_obj.rev_complement())
+    expected = [(len(seq) - m.position - k, m.matched_seq) for m in finder.search_single(rev, motif, 0)]
+    assert got == expected
+
+#bit-parallel scan agrees with counting mismatches window by window
+@given(seq=st.text(alphabet="ACGTNRY", min_size=1, max_size=120),
+       motif=st.text(alphabet="ACGTNRYSWKMBDHV", min_size=1, max_size=8),
+       max_mismatches=st.integers(min_value=0, max_value=9), block=st.integers(min_value=1, max_value=20))
+def test_bit_parallel_matches_brute_force(seq, motif, max_mismatches, block):
+    finder = MotifFinder(k=len(motif))
+    finder.SCAN_BLOCK = block
+    expected = [
+        (pos, seq[pos:pos + len(motif)])
+        for pos in range(len(seq) - len(motif) + 1)
+        if finder.mismatches(motif, seq[pos:pos + len(motif)]) <= max_mismatches
+    ]
+    got = [(m.position, m.matched_seq) for m in finder.search_single(sequence("s", seq), motif, max_mismatches)]
+    assert got == expected
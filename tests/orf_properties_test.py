@@ -1,7 +1,8 @@
 import pytest
 from hypothesis import given, strategies as st
 from bio_seq_v1.translator import Translator
-from bio_seq_v1.orf import ORFDetector
+from bio_seq_v1.orf import ORFDetector, call_orfs
+from bio_seq_v1.stats import sequence
 
 
 def count_orfs_in_protein(protein: str) -> int:
@@ -69,7 +70,7 @@ def test_orf_metadata_completeness(dna):
         assert (orf.length % 3) == 0
 
         d = orf.to_dict()
-        expected_keys = {"start", "end", "frame", "strand", "protein", "length"}
+        expected_keys = {"seq_id", "start", "end", "frame", "strand", "protein", "length"}
         assert set(d.keys()) == expected_keys
         assert d["start"] == orf.start
         assert d["length"] == orf.length
@@ -83,4 +84,65 @@ def test_orf_overlap(dna):
         assert orf1 in detected_orfs
         assert orf2 in detected_orfs
         assert orf1.start <= orf2.end
-        assert orf2.start <= orf1.end
\ No newline at end of file
+        assert orf2.start <= orf1.end
+@given(st.text(alphabet="ACGT", min_size=3), st.integers(min_value=0, max_value=30))
+def test_longest_mode_keeps_first_start_per_stop(dna, min_length):
+    all_orfs = ORFDetector(min_length=min_length).find_orfs(dna)
+    longest = ORFDetector(min_length=min_length, mode="longest").find_orfs(dna)
+    per_stop = {}
+    for orf in all_orfs:
+        key = (orf.strand, orf.frame, orf.end if orf.strand == "+" else orf.start)
+        if key not in per_stop or orf.length > per_stop[key].length:
+            per_stop[key] = orf
+    assert sorted(longest, key=lambda o: (o.strand, o.start, o.end)) == \
+        sorted(per_stop.values(), key=lambda o: (o.strand, o.start, o.end))
+    assert all(orf.length >= min_length for orf in all_orfs)
+
+def test_nested_starts_scan_linearly():
+    dna = "ATG" * 2000 + "TAA"
+    assert len(ORFDetector().find_orfs(dna)) >= 2000
+    (orf,) = [o for o in ORFDetector(mode="longest").find_orfs(dna) if o.strand == "+"]
+    assert (orf.start, orf.end, len(orf.protein)) == (0, 5999, 2000)
+
+@given(st.text(alphabet="ACGT", min_size=3), st.integers(min_value=0, max_value=30))
+def test_orf_proteins_match_translation(dna, min_length):
+    translator = Translator()
+    rev = translator._coerce_to_sequence(dna).rev_complement()
+    for orf in ORFDetector(min_length=min_length).find_orfs(dna):
+        if orf.strand == "+":
+            nucleotides = dna[orf.start:orf.end + 1]
+        else:
+            nucleotides = rev[len(dna) - orf.end - 1:len(dna) - orf.start]
+        assert translator.translate(nucleotides, 0) == orf.protein
+        assert orf.length >= min_length
+
+def test_alternative_start_codons():
+    dna = "CCGTGAAATTGCCCTAG"
+    assert ORFDetector().find_orfs(dna) == []
+    orfs = ORFDetector(start_codons={"ATG", "GTG", "TTG"}).find_orfs(dna)
+    assert [(o.start, o.end, o.protein) for o in orfs if o.strand == "+"] == [(2, 13, "MKLP"), (8, 13, "MP")]
+    longest = ORFDetector(start_codons={"GTG", "TTG"}, mode="longest").find_orfs(dna)
+    assert [(o.start, o.protein) for o in longest if o.strand == "+"] == [(2, "MKLP")]
+
+def orf_key(orf):
+    return (orf.seq_id, orf.strand, orf.start, orf.end, orf.frame, orf.protein)
+
+@given(st.lists(st.text(alphabet="ACGT", min_size=3, max_size=120), min_size=1, max_size=3),
+       st.integers(min_value=3, max_value=40), st.integers(min_value=0, max_value=30),
+       st.sampled_from(ORFDetector.MODES), st.booleans())
+def test_chunked_orf_calling_matches_find_orfs(seqs, chunk_size, min_length, mode, alt_starts):
+    records = [sequence(f"chr{i}", s) for i, s in enumerate(seqs)]
+    detector = ORFDetector(min_length=min_length, mode=mode,
+                           start_codons={"ATG", "GTG", "TTG"} if alt_starts else None)
+    expected = sorted(orf_key(o) for r in records for o in detector.find_orfs(r))
+    called = call_orfs(records, detector, chunk_size=chunk_size, proteins=True)
+    assert sorted(map(orf_key, called)) == expected
+
+def test_parallel_orf_calling():
+    import random
+    rng = random.Random(7)
+    records = [sequence(f"chr{i}", "".join(rng.choice("ACGT") for _ in range(3000))) for i in range(3)]
+    detector = ORFDetector(min_length=30)
+    expected = sorted((o.seq_id, o.strand, o.start, o.end) for r in records for o in detector.find_orfs(r))
+    called = call_orfs(records, detector, processes=2, chunk_size=500)
+    assert sorted((o.seq_id, o.strand, o.start, o.end) for o in called) == expected
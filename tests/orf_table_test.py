@@ -0,0 +1,84 @@
+from bio_seq_v1.fasta import FASTAParser
+from bio_seq_v1.orf import ORF, ORFDetector, ORFTable
+from bio_seq_v1.stats import sequence
+from hypothesis import given, settings, strategies as st
+
+records_strategy = st.lists(st.text(alphabet="ACGT", min_size=3, max_size=150), min_size=1, max_size=3).map(
+    lambda seqs: [sequence(f"chr{i}", s) for i, s in enumerate(seqs)])
+
+def key(orf):
+    return (orf.seq_id, orf.strand, orf.start, orf.end, orf.frame, orf.protein)
+
+def fetcher(records):
+    seqs = {r.id: r.sequence for r in records}
+    return lambda seq_id, start, end: seqs[seq_id][start:end]
+
+@settings(deadline=None)
+@given(records_strategy, st.integers(min_value=0, max_value=30))
+def test_table_matches_detector(records, min_length):
+    detector = ORFDetector()
+    expected = [o for r in records for o in detector.find_orfs(r)]
+    table = ORFTable.from_records(records, detector, chunk_size=30, fetch=fetcher(records))
+    assert len(table) == len(expected)
+    assert sorted(map(key, table)) == sorted(map(key, expected))
+
+    long_enough = table.filter_length(min_length)
+    assert sorted(map(key, long_enough)) == sorted(key(o) for o in expected if o.length >= min_length)
+    bounded = table.filter_length(min_length, min_length + 30)
+    assert all(min_length <= o.length <= min_length + 30 for o in bounded)
+    assert all(o.strand == "-" for o in table.on_strand("-"))
+    assert [o.seq_id for o in table.on_sequence("chr0")] == ["chr0"] * sum(o.seq_id == "chr0" for o in expected)
+
+    ordered = list(table.sort(("seq_index", "start")))
+    assert [(o.seq_id, o.start) for o in ordered] == sorted((o.seq_id, o.start) for o in expected)
+    assert list(table.sort("length", reverse=True).length) == sorted(table.length, reverse=True)
+
+@settings(deadline=None)
+@given(records_strategy, st.integers(min_value=0, max_value=150), st.integers(min_value=0, max_value=40))
+def test_table_overlaps(records, start, width):
+    table = ORFTable.from_records(records, fetch=fetcher(records))
+    orfs = list(table)
+    pairs = {(table[i].seq_id, table[i].strand, table[i].start, table[i].end,
+              table[j].start, table[j].end) for i, j in table.overlapping_pairs()}
+    expected = {(a.seq_id, a.strand, a.start, a.end, b.start, b.end)
+                for a, b in ORFDetector().overlapping_orfs(orfs)}
+    assert len(pairs) == len(list(table.overlapping_pairs())) == len(expected)
+    assert pairs == expected
+
+    hits = table.overlaps("chr0", start, start + width, strand="+")
+    assert sorted(map(key, hits)) == sorted(
+        key(o) for o in orfs
+        if o.seq_id == "chr0" and o.strand == "+" and o.start <= start + width and start <= o.end)
+
+def test_table_without_fetch_and_slots():
+    table = ORFTable.from_orfs([ORF("x", 3, 11, 0, "+", "MKF")])
+    assert table[0].protein is None
+    assert table[0].length == 9
+    assert not hasattr(table[0], "__dict__")
+
+def test_proteins_from_indexed_fasta(tmp_path):
+    path = tmp_path / "genome.fasta"
+    path.write_text(">chr1\nCCATGAAATTTTAGCC\nCTACATCATGG\n>chr2\nATGTAA\n")
+    parser = FASTAParser(str(path))
+    records = list(parser.iter_records())
+    table = ORFTable.from_records(records, fetch=parser.fetch)
+    assert sorted(map(key, table)) == sorted(key(o) for r in records for o in ORFDetector().find_orfs(r))
+    parser.close()
+
+def test_proteins_from_indexed_fasta_with_descriptions(tmp_path):
+    path = tmp_path / "genome.fasta"
+    path.write_text(">chr1 Homo sapiens chromosome 1\nCCATGAAATTTTAGCC\n>chr2 plasmid\nATGTAA\n")
+    parser = FASTAParser(str(path))
+    records = list(parser.iter_records())
+    table = ORFTable.from_records(records, fetch=parser.fetch)
+    assert table.seq_ids == ["chr1 Homo sapiens chromosome 1", "chr2 plasmid"]
+    assert sorted(map(key, table)) == sorted(key(o) for r in records for o in ORFDetector().find_orfs(r))
+    assert parser.view("chr2 plasmid").sequence == parser.fetch("chr2") == "ATGTAA"
+    parser.close()
+
+def test_selection_does_not_change_parent():
+    table = ORFTable.from_orfs([ORF("a", 0, 5, 0, "+", None), ORF("b", 0, 5, 0, "+", None)])
+    subset = table.on_sequence("a")
+    subset.append("c", 0, 5, 0, "+")
+    assert table.seq_ids == ["a", "b"]
+    assert len(table.on_sequence("c")) == 0
@@ -0,0 +1,28 @@
+import pytest
+from bio_seq_v1.packed import PackedSequence
+from bio_seq_v1.stats import sequence
+from hypothesis import given, strategies as st
+
+@given(st.text(alphabet="ACGTUNRYSWKMBDHV-.acgtn", min_size=1))
+def test_packing_round_trip(seq_str):
+    packed = PackedSequence("id", seq_str)
+    assert packed.sequence == seq_str.upper()
+    assert packed.sequence_length() == len(seq_str)
+
+@given(st.text(alphabet="ACGTUNRYSWKMBDHV-.", min_size=1))
+def test_packed_matches_sequence_stats(seq_str):
+    packed = PackedSequence("id", seq_str)
+    plain = sequence("id", seq_str)
+    assert packed.base_count() == plain.base_count()
+    assert packed.gc_content() == pytest.approx(plain.gc_content())
+
+@given(st.text(alphabet="ACGTUNRYSWKMBDHV", min_size=1))
+def test_packed_reverse_complement(seq_str):
+    assert PackedSequence("id", seq_str).rev_complement() == sequence("id", seq_str).rev_complement()
+
+def test_packed_is_compact():
+    packed = PackedSequence("chr", "ACGT" * 1000 + "N" * 1000)
+    assert len(packed._packed) == 1250
+    assert len(packed._mask_chars) == 1
+    with pytest.raises(AttributeError):
+        packed.extra = 1
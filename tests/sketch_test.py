@@ -0,0 +1,49 @@
+import random
+import pytest
+from bio_seq_v1.sketch import Sketch, pairwise
+from bio_seq_v1.stats import sequence
+from hypothesis import given, strategies as st
+
+def random_dna(n, seed):
+    rng = random.Random(seed)
+    return "".join(rng.choice("ACGT") for _ in range(n))
+
+@given(st.text(alphabet="ACGT", min_size=1, max_size=200), st.booleans())
+def test_self_similarity(seq, scaled):
+    params = {"scaled": 2} if scaled else {"num": 50}
+    sketch = Sketch(k=5, **params).add(sequence("s", seq))
+    if len(sketch):
+        assert sketch.jaccard(sketch) == 1.0
+    rc = Sketch(k=5, **params).add(sequence("s", seq).rev_complement())
+    assert rc.hashes == sketch.hashes
+
+def test_estimates_track_true_overlap():
+    base = random_dna(20000, 1)
+    half = base[:10000]
+    a = Sketch(k=15, scaled=10).add(base)
+    b = Sketch(k=15, scaled=10).add(half)
+    assert b.containment(a) == pytest.approx(1.0)
+    assert a.containment(b) == pytest.approx(0.5, abs=0.1)
+    assert a.jaccard(b) == pytest.approx(0.5, abs=0.1)
+    other = Sketch(k=15, scaled=10).add(random_dna(20000, 2))
+    matrix = pairwise([a, b, other])
+    assert matrix[0][2] < 0.05 and matrix[0][1] == matrix[1][0]
+
+def test_save_and_load(tmp_path):
+    for params in ({"num": 100}, {"scaled": 5}):
+        sketch = Sketch(k=11, **params).add(random_dna(3000, 3))
+        sketch.save(tmp_path / "s.sketch")
+        loaded = Sketch.load(tmp_path / "s.sketch")
+        assert loaded.hashes == sketch.hashes
+        assert loaded.jaccard(sketch) == 1.0
+        assert (tmp_path / "s.sketch").stat().st_size <= 40 + 8 * len(sketch)
+
+def test_seed_must_fit_header(tmp_path):
+    with pytest.raises(ValueError):
+        Sketch(k=11, num=10, seed=-1)
+    with pytest.raises(ValueError):
+        Sketch(k=11, num=10, seed=1 << 64)
+    sketch = Sketch(k=11, num=10, seed=(1 << 64) - 1).add(random_dna(500, 4))
+    sketch.save(tmp_path / "s.sketch")
+    assert Sketch.load(tmp_path / "s.sketch").seed == sketch.seed
+    assert (tmp_path / "s.sketch").stat().st_size == 30 + 8 * len(sketch)
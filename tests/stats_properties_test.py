@@ -1,6 +1,6 @@
 import pytest
 import os
-from bio_seq_v1.stats import sequence
+from bio_seq_v1.stats import composition_matrix, sequence, window_stats
 from bio_seq_v1.fasta import FASTAParser
 from hypothesis import given, strategies as st
 
@@ -40,3 +40,44 @@ def test_reverse_complement(seq_str):
     rc2 = seq_rc.rev_complement()
     assert rc2 == seq_str.upper()
 
+
+@given(st.text(alphabet='ACGTNRYKMSWBDHV', min_size=1), st.text(alphabet='ACGT', min_size=1))
+def test_derived_values_are_cached_and_invalidated(seq_str, new_str):
+    seq = sequence("id", seq_str)
+    counts = seq.base_count()
+    counts["A"] = -1
+    assert seq.base_count()["A"] == seq_str.upper().count("A")
+    assert seq.rev_complement() is seq.rev_complement()
+
+    seq.sequence = new_str
+    assert seq.rev_complement() == sequence("id", new_str).rev_complement()
+    assert seq.gc_content() == sequence("id", new_str).gc_content()
+
+def test_cache_is_bounded():
+    seq = sequence("id", "ACGT")
+    for i in range(sequence.cache_size + 5):
+        seq.cached(("key", i), lambda: i)
+    assert len(seq._cache) == sequence.cache_size
+
+@given(st.lists(st.text(alphabet='ACGTUNRYKMSWBDHV-.', min_size=1), min_size=1, max_size=10))
+def test_composition_matrix(seq_strs):
+    seqs = [sequence(f"s{i}", s) for i, s in enumerate(seq_strs)]
+    ids, matrix = composition_matrix(seqs)
+    assert ids == [s.id for s in seqs]
+    for row, s in zip(matrix, seq_strs):
+        assert row == [s.count(b) for b in sequence.valid]
+        assert sum(row) == len(s)
+
+@given(st.text(alphabet='ACGTN', min_size=1, max_size=300),
+       st.integers(min_value=1, max_value=50), st.integers(min_value=1, max_value=50))
+def test_window_stats_match_direct_counts(seq_str, window, step):
+    windows = list(window_stats(sequence("id", seq_str), window, step))
+    assert windows[0].start == 0
+    assert windows[-1].end == len(seq_str) or windows[-1].start + step >= len(seq_str)
+    for w in windows:
+        chunk = seq_str[w.start:w.end]
+        assert w.end - w.start == min(window, len(seq_str) - w.start)
+        assert w.gc == pytest.approx(sequence("w", chunk).gc_content())
+        assert w.n_fraction == pytest.approx(chunk.count("N") / len(chunk))
+        g, c = chunk.count("G"), chunk.count("C")
+        assert w.gc_skew == pytest.approx((g - c) / (g + c) if g + c else 0.0)
@@ -0,0 +1,30 @@
+import pytest
+from bio_seq_v1.fasta import FASTAParser
+from bio_seq_v1.summary import AssemblySummary
+from hypothesis import given, strategies as st
+
+@given(st.lists(st.text(alphabet="ACGTN", min_size=1, max_size=50), min_size=1, max_size=20))
+def test_summary_matches_naive(seqs):
+    fasta = "".join(f">c{i}\n{s}\n" for i, s in enumerate(seqs))
+    summary = AssemblySummary(bins=(0, 10, 25)).add_all(FASTAParser().iter_string(fasta))
+    total = sum(map(len, seqs))
+    assert summary.count == len(seqs)
+    assert summary.total_length == total
+    assert summary.gc_content() == pytest.approx(100 * sum(s.count("G") + s.count("C") for s in seqs) / total)
+    assert summary.ambiguous_fraction() == pytest.approx(sum(s.count("N") for s in seqs) / total)
+    assert sum(n for _, n in summary.length_histogram()) == len(seqs)
+
+    ordered = sorted(map(len, seqs), reverse=True)
+    n50, l50 = summary.nx(0.5)
+    assert sum(ordered[:l50]) >= total / 2 > sum(ordered[:l50 - 1])
+    assert n50 == ordered[l50 - 1]
+
+def test_cli_tables_stream_input_once(monkeypatch, capsys):
+    from bio_seq_v1 import cli
+    calls = []
+    open_stream = cli.open_stream
+    monkeypatch.setattr(cli, "open_stream", lambda args: calls.append(1) or open_stream(args))
+    cli.main(["-s", ">a\nACGTNNGC\n>b\nGGGCA", "--length", "--gc", "--basecount", "--summary", "assembly"])
+    out = capsys.readouterr().out
+    assert len(calls) == 1
+    assert "50.00%" in out and "80.00%" in out and "N50" in out
@@ -1,10 +1,16 @@
 import pytest
+from bio_seq_v1.cli import main
 from bio_seq_v1.fasta import FASTAParser
 from bio_seq_v1.stats import sequence
 from bio_seq_v1.translator import Translator
-from hypothesis import given, strategies as st
+from hypothesis import given, settings, strategies as st
+from itertools import product
 valid_amino_acids = set("ACDEFGHIKLMNPQRSTVWY*X")
 stop_codons = {"TAA", "TAG", "TGA"}
+IUPAC_EXPANSIONS = {
+    "A": "A", "C": "C", "G": "G", "T": "T", "N": "ACGT", "R": "AG", "Y": "CT", "S": "CG",
+    "W": "AT", "K": "GT", "M": "AC", "B": "CGT", "D": "AGT", "H": "ACT", "V": "ACG",
+}
 
 @given(st.text(alphabet = "ACGT", min_size = 3))
 def test_genetic_code_compliance(seq):
@@ -58,10 +64,15 @@ def test_ambiguous_code_handling(seq):
         for i in range(0, len(seq)-2, 3)
     ]
     for codon, aa in zip(codons, protein):
-        if codon not in translator.genetic_code:
-            assert aa == "X"
+        if codon in translator.genetic_code:
+            assert aa == translator.genetic_code[codon]
         else:
-            assert aa in valid_amino_acids
+            # Ambiguous codons resolve only when every expansion agrees.
+            expansions = {
+                translator.genetic_code.get("".join(bases), "X")
+                for bases in product(*(IUPAC_EXPANSIONS[b] for b in codon))
+            }
+            assert aa == (expansions.pop() if len(expansions) == 1 else "X")
 
 @given(st.text(alphabet = "ACGTNRYSWKMBDHV", min_size = 3))
 def test_six_frame_translation_completeness(seq):
@@ -76,3 +87,35 @@ def test_six_frame_translation_completeness(seq):
     for frame in range(3):
         assert translator.translate(rev, frame=frame) == six_frame[f"-{frame+1}"]
 
+
+
+def test_ambiguous_codons_resolve_to_single_amino_acid():
+    translator = Translator()
+    assert translator.translate("GCNGGNCTNTAR", frame=0) == "AGL*"
+    assert translator.translate("ANNTGNRAY", frame=0) == "XXX"
+    assert translator.translate("gcn---", frame=0) == "AX"
+
+
+@settings(max_examples=10, deadline=None)
+@given(st.lists(st.text(alphabet="ACGTN", min_size=1, max_size=40), min_size=1, max_size=12))
+def test_translate_records_parallel_matches_serial(seqs):
+    headers = [f"s{i} sample {i}" if i % 2 else f"s{i}" for i in range(len(seqs))]
+    records = [sequence(h, s) for h, s in zip(headers, seqs)]
+    translator = Translator(table=11)
+    serial = list(translator.translate_records(records, frames=("+1", "-3")))
+    parallel = list(translator.translate_records(iter(records), frames=("+1", "-3"), processes=2, chunk_bases=16))
+    assert parallel == serial
+    assert [r.id for r in serial] == [
+        f"s{i}_{f} sample {i}" if i % 2 else f"s{i}_{f}" for i in range(len(seqs)) for f in ("+1", "-3")
+    ]
+    for record, (plus, minus) in zip(records, zip(serial[::2], serial[1::2])):
+        frames = translator.translate_six_frames(record)
+        assert (plus.sequence, minus.sequence) == (frames["+1"], frames["-3"])
+
+
+def test_translate_subcommand_writes_protein_fasta(tmp_path):
+    out = tmp_path / "proteins.faa"
+    main(["translate", "-s", ">a\nATGTTTTAA\n>b\nATGTGA\n", "--frames", "+1", "-o", str(out)])
+    assert out.read_text() == ">a_+1\nMF*\n>b_+1\nM*\n"
+    main(["translate", "-s", ">b\nATGTGA\n", "--frames", "+1", "--table", "2", "-o", str(out)])
+    assert out.read_text() == ">b_+1\nMW\n"
@@ -0,0 +1,50 @@
+import pytest
+from bio_seq_v1.fasta import FASTAParser
+from bio_seq_v1.stats import sequence
+from bio_seq_v1.views import SequenceView
+from hypothesis import given, strategies as st
+
+@given(seq_str=st.text(alphabet="ACGTNacgtn-.", min_size=1, max_size=200),
+       width=st.integers(min_value=1, max_value=30),
+       data=st.data())
+def test_view_matches_sequence(tmp_path_factory, seq_str, width, data):
+    path = tmp_path_factory.mktemp("view") / "chr.fa"
+    path.write_text(">chr\n" + "".join(seq_str[i:i + width] + "\n" for i in range(0, len(seq_str), width)))
+    parser = FASTAParser(str(path))
+    start = data.draw(st.integers(0, len(seq_str) - 1))
+    end = data.draw(st.integers(start + 1, len(seq_str)))
+    view = parser.view("chr")[start:end]
+    plain = sequence("chr", seq_str[start:end])
+
+    assert view.sequence == plain.sequence
+    assert view.base_count() == plain.base_count()
+    assert view.gc_content() == pytest.approx(plain.gc_content())
+    assert view[0] == plain.sequence[0] and view[-1] == plain.sequence[-1]
+    parser.close()
+
+def test_view_over_plain_buffer():
+    view = SequenceView("x", memoryview(b"ggccAATT"))
+    assert view[2:6].sequence == "CCAA"
+    assert view[2:6].gc_content() == 50.0
+    assert view.rev_complement() == "AATTGGCC"
+
+def test_view_defaults_end_from_line_geometry():
+    view = SequenceView("x", b"ACGT\nAC-.\nG.\n", line_bases=4, line_width=5)
+    assert len(view) == 10
+    assert view.sequence == "ACGTAC-.G."
+    counts = view.base_count()
+    assert counts["-"] == 1 and counts["."] == 2 and sum(counts.values()) == 10
+
+@given(seq_str=st.text(alphabet="ACGTUNRYSWKMBDHV-.", min_size=1, max_size=100), data=st.data())
+def test_reverse_complement_view_slices(seq_str, data):
+    from bio_seq_v1.views import ReverseComplementView
+    seq = sequence("id", seq_str)
+    full = seq.rev_complement()
+    view = ReverseComplementView(seq)
+    assert len(view) == len(full) == len(seq_str)
+    start = data.draw(st.integers(-len(full), len(full)))
+    stop = data.draw(st.integers(-len(full), len(full)))
+    assert view[start:stop] == full[start:stop]
+    i = data.draw(st.integers(-len(full), len(full) - 1))
+    assert view[i] == full[i]
+    assert "".join(view.blocks(7)) == full